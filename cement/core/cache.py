@@ -1,14 +1,168 @@
 """Cement core cache module."""
 
+import json
+import pickle
+import zlib
 from abc import abstractmethod
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
+from ..core.exc import FrameworkError
 from ..core.handler import Handler
 from ..core.interface import Interface
 from ..utils.misc import minimal_logger
 
+if TYPE_CHECKING:
+    from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
+
 LOG = minimal_logger(__name__)
 
+# leading byte of a payload written by a compressing serializer
+_PLAIN = b'\x00'
+_COMPRESSED = b'\x01'
+
+
+def _raw_dumps(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    elif isinstance(value, str):
+        return value.encode('utf-8')
+    return str(value).encode('utf-8')
+
+
+def _raw_loads(data: bytes) -> Any:
+    return data
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _pickle_dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _pickle_loads(data: bytes) -> Any:
+    return pickle.loads(data)  # noqa: S301 - only reads values this app wrote
+
+
+def _msgpack() -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    import msgpack  # type: ignore
+
+    def dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)  # type: ignore
+
+    def loads(data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+    return dumps, loads
+
+
+def _zlib() -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    return zlib.compress, zlib.decompress
+
+
+def _lz4() -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    import lz4.frame  # type: ignore
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+#: Serializers available to :class:`CacheSerializer`, by name.  Each value is
+#: a callable returning a ``(dumps, loads)`` tuple, so that optional
+#: dependencies are only imported when used.
+SERIALIZERS: dict[str, Callable[[], tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]] = {
+    'raw': lambda: (_raw_dumps, _raw_loads),
+    'json': lambda: (_json_dumps, _json_loads),
+    'pickle': lambda: (_pickle_dumps, _pickle_loads),
+    'msgpack': _msgpack,
+}
+
+#: Compressors available to :class:`CacheSerializer`, by name.  Each value is
+#: a callable returning a ``(compress, decompress)`` tuple.
+COMPRESSORS: dict[str, Callable[[], tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]] = {
+    'zlib': _zlib,
+    'lz4': _lz4,
+}
+
+
+class CacheSerializer:
+
+    """
+    Converts cache values to and from ``bytes``, optionally compressing
+    payloads larger than ``compress_threshold``.  Used by cache handlers that
+    have a ``serializer`` configured so that all backends store and return
+    values the same way.
+
+    Args:
+        serializer (str): One of ``raw``, ``json``, ``pickle``, or
+            ``msgpack`` (requires the ``msgpack`` library).  The ``raw``
+            serializer stores ``bytes`` as is, encodes ``str`` as UTF-8, and
+            returns ``bytes``.
+
+    Keyword Args:
+        compression (str): One of ``zlib`` or ``lz4`` (requires the ``lz4``
+            library), or ``None`` to disable compression.
+        compress_threshold (int): Only compress payloads of at least this
+            many bytes.
+
+    """
+
+    def __init__(self,
+                 serializer: str = 'raw',
+                 compression: str | None = None,
+                 compress_threshold: int = 1024) -> None:
+        if serializer not in SERIALIZERS:
+            raise FrameworkError(f"Unknown cache serializer '{serializer}'")
+        if compression is not None and compression not in COMPRESSORS:
+            raise FrameworkError(f"Unknown cache compression '{compression}'")
+
+        self.name = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self._dumps, self._loads = SERIALIZERS[serializer]()
+        if compression is not None:
+            self._compress, self._decompress = COMPRESSORS[compression]()
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize (and possibly compress) a value.
+
+        Args:
+            value: The value to serialize.
+
+        Returns:
+            bytes: The serialized payload.
+
+        """
+        data = self._dumps(value)
+        if self.compression is None:
+            return data
+        elif len(data) >= self.compress_threshold:
+            return _COMPRESSED + self._compress(data)
+        return _PLAIN + data
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decompress (if necessary) and deserialize a payload created by
+        :meth:`dumps`.
+
+        Args:
+            data (bytes): The serialized payload.
+
+        Returns:
+            unknown: The original value.
+
+        """
+        if self.compression is not None:
+            flag, data = data[:1], data[1:]
+            if flag == _COMPRESSED:
+                data = self._decompress(data)
+        return self._loads(data)
+
 
 class CacheInterface(Interface):
 
@@ -100,6 +254,100 @@ class CacheHandler(CacheInterface, Handler):
     """
     Cache handler implementation.
 
+    Handlers that store values externally should pass them through
+    :meth:`_dumps` and :meth:`_loads`, which apply the ``serializer``,
+    ``compression``, and ``compress_threshold`` settings from the handler's
+    config section (if ``serializer`` is not set, values are passed through
+    unchanged).
+
     """
     class Meta(Handler.Meta):
         pass    # pragma: nocover  # abstract method
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.serializer: CacheSerializer | None = None
+
+    def _setup(self, app: "App") -> None:
+        super()._setup(app)
+        self.serializer = self._get_serializer()
+
+    def _get_serializer(self) -> CacheSerializer | None:
+        section = self._meta.config_section
+        if not self.app.config.has_section(section):
+            return None
+        keys = self.app.config.keys(section)
+
+        def opt(key: str) -> Any:
+            return self.app.config.get(section, key) if key in keys else None
+
+        if not opt('serializer'):
+            return None
+        threshold = opt('compress_threshold')
+        return CacheSerializer(opt('serializer'),
+                               compression=opt('compression') or None,
+                               compress_threshold=int(threshold or 1024))
+
+    def _dumps(self, value: Any) -> Any:
+        if self.serializer is None:
+            return value
+        return self.serializer.dumps(value)
+
+    def _loads(self, data: Any) -> Any:
+        if self.serializer is None:
+            return data
+        return self.serializer.loads(data)
+
+    # D-09: same user-arbitrary cache value contract as `CacheInterface.get`.
+    def get_many(self, keys: list[str], fallback: Any = None) -> dict[str, Any]:
+        """
+        Get the values for multiple keys in the cache.  The default
+        implementation calls ``get()`` once per key, and handlers that can
+        fetch several keys in a single round trip should override it.
+
+        Args:
+            keys (list): The keys of the values stored in cache.
+
+        Keyword Args:
+            fallback: Optional value that is returned for any key that is
+                expired or does not exist.
+
+        Returns:
+            dict: A dictionary of ``key: value`` for every requested key.
+
+        """
+        return {key: self.get(key, fallback) for key in keys}
+
+    # D-09: same user-arbitrary cache value contract as `CacheInterface.set`.
+    def set_many(self, items: dict[str, Any], time: int | None = None) -> None:
+        """
+        Set multiple key/values in the cache for a set amount of ``time``.
+        The default implementation calls ``set()`` once per key.
+
+        Args:
+            items (dict): A dictionary of ``key: value`` to store in cache.
+
+        Keyword Args:
+            time (int): A one-off expire time in seconds (or ``None``).  If
+                no time is given, then a default value is used (determined by
+                the implementation).
+
+        Returns: None
+
+        """
+        for key, value in items.items():
+            self.set(key, value, time=time)
+
+    def delete_many(self, keys: list[str]) -> int:
+        """
+        Delete multiple keys from the cache.  The default implementation
+        calls ``delete()`` once per key.
+
+        Args:
+            keys (list): The keys in the cache to delete.
+
+        Returns:
+            int: The number of keys that were successfully deleted.
+
+        """
+        return sum(1 for key in keys if self.delete(key))
@@ -212,6 +212,21 @@ class ConfigHandler(ConfigInterface, Handler):
         """
         pass    # pragma: nocover  # abstract method
 
+    def _get_parsed_dict(self) -> dict[str, Any]:
+        """
+        Return the settings parsed from configuration files as a dict that
+        can be merged into another config handler, without environment
+        variable overrides applied (used by ``App.Meta.config_snapshot``
+        and ``App.Meta.reload_incremental``).  Handlers that apply
+        environment variable overrides in ``get_dict()`` should override
+        this.
+
+        Returns:
+            dict: A dictionary of the parsed config.
+
+        """
+        return self.get_dict()
+
     def parse_file(self, file_path: str) -> bool:
         """
         Ensure we are using the absolute/expanded path to ``file_path``, and
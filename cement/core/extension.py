@@ -17,6 +17,27 @@ if TYPE_CHECKING:
     from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
 
 
+#: Declarative registry of framework extensions that only provide handlers,
+#: mapping the extension module to the ``(interface, handler_label)`` pairs
+#: that it registers when loaded.  When ``App.Meta.lazy_extensions`` is
+#: enabled, extensions listed here are not imported until one of their
+#: handlers is first requested.  Extensions whose ``load()`` registers hooks
+#: or extends the application must not be listed, as deferring them would
+#: also defer those.  Applications can declare their own extensions via
+#: ``App.Meta.extension_registry``.
+EXTENSION_REGISTRY: dict[str, list[tuple[str, str]]] = {
+    'cement.ext.ext_colorlog': [('log', 'colorlog')],
+    'cement.ext.ext_jinja2': [('output', 'jinja2'), ('template', 'jinja2')],
+    'cement.ext.ext_memcached': [('cache', 'memcached')],
+    'cement.ext.ext_memory': [('cache', 'memory')],
+    'cement.ext.ext_mustache': [('output', 'mustache'), ('template', 'mustache')],
+    'cement.ext.ext_redis': [('cache', 'redis')],
+    'cement.ext.ext_smtp': [('mail', 'smtp')],
+    'cement.ext.ext_sqlite': [('cache', 'sqlite')],
+    'cement.ext.ext_tabulate': [('output', 'tabulate')],
+}
+
+
 class ExtensionInterface(Interface):
 
     """
@@ -85,6 +106,19 @@ class ExtensionHandler(ExtensionInterface, Handler):
         super().__init__(**kw)
         self.app: App = None  # type: ignore
         self._loaded_extensions: list[str] = []
+        self._deferred_extensions: dict[str, list[tuple[str, str]]] = {}
+        self._registry: dict[str, list[tuple[str, str]]] = {}
+
+    def _setup(self, app: "App") -> None:
+        super()._setup(app)
+        self._registry = EXTENSION_REGISTRY.copy()
+        self._registry.update(self.app._meta.extension_registry)
+
+    def _get_module_name(self, ext_module: str) -> str:
+        # If it's not a full module path then preppend our default path
+        if ext_module.find('.') == -1:
+            ext_module = f'cement.ext.ext_{ext_module}'
+        return ext_module
 
     def get_loaded_extensions(self) -> builtins.list[str]:
         """
@@ -96,6 +130,16 @@ class ExtensionHandler(ExtensionInterface, Handler):
         """
         return self._loaded_extensions
 
+    def get_deferred_extensions(self) -> builtins.list[str]:
+        """
+        Get all extensions whose loading has been deferred until first use.
+
+        Returns:
+            list: A list of deferred extensions.
+
+        """
+        return list(self._deferred_extensions.keys())
+
     def list(self) -> builtins.list[str]:
         """
         Synonymous with ``get_loaded_extensions()``.
@@ -120,9 +164,7 @@ class ExtensionHandler(ExtensionInterface, Handler):
                 loaded.
 
         """
-        # If it's not a full module path then preppend our default path
-        if ext_module.find('.') == -1:
-            ext_module = f'cement.ext.ext_{ext_module}'
+        ext_module = self._get_module_name(ext_module)
 
         if ext_module in self._loaded_extensions:
             LOG.debug(f"framework extension '{ext_module}' already loaded")
@@ -130,11 +172,12 @@ class ExtensionHandler(ExtensionInterface, Handler):
 
         LOG.debug(f"loading the '{ext_module}' framework extension")
         try:
-            if ext_module not in sys.modules:
-                __import__(ext_module, globals(), locals(), [], 0)
+            with self.app._profile('extension', ext_module):
+                if ext_module not in sys.modules:
+                    __import__(ext_module, globals(), locals(), [], 0)
 
-            if hasattr(sys.modules[ext_module], 'load'):
-                sys.modules[ext_module].load(self.app)
+                if hasattr(sys.modules[ext_module], 'load'):
+                    sys.modules[ext_module].load(self.app)
 
             if ext_module not in self._loaded_extensions:
                 self._loaded_extensions.append(ext_module)
@@ -153,3 +196,73 @@ class ExtensionHandler(ExtensionInterface, Handler):
         """
         for ext in ext_list:
             self.load_extension(ext)
+
+    def defer_extension(self, ext_module: str) -> bool:
+        """
+        Given an extension module name, defer loading it until one of the
+        handlers it provides is first requested.  Only extensions declared in
+        the extension registry (``EXTENSION_REGISTRY`` and
+        ``App.Meta.extension_registry``) can be deferred.
+
+        Args:
+            ext_module (str): The extension module name.  For example:
+                ``cement.ext.ext_json``.
+
+        Returns:
+            bool: ``True`` if the extension is deferred (or already loaded),
+            ``False`` if it is not declared in the registry.
+
+        """
+        ext_module = self._get_module_name(ext_module)
+
+        if ext_module in self._loaded_extensions or \
+                ext_module in self._deferred_extensions:
+            return True
+        elif ext_module not in self._registry:
+            return False
+
+        LOG.debug(f"deferring the '{ext_module}' framework extension until first use")
+        self._deferred_extensions[ext_module] = self._registry[ext_module]
+        return True
+
+    def defer_extensions(self, ext_list: builtins.list[str]) -> None:
+        """
+        Given a list of extension modules, defer those declared in the
+        extension registry and load the rest immediately.
+
+        Args:
+            ext_list (list): A list of extension module names (str).
+
+        """
+        for ext in ext_list:
+            if not self.defer_extension(ext):
+                self.load_extension(ext)
+
+    def load_deferred_extensions(self,
+                                 interface: str,
+                                 handler_label: str | None = None) -> bool:
+        """
+        Load any deferred extensions that provide handlers for ``interface``
+        (and ``handler_label`` if given).
+
+        Args:
+            interface (str): The interface of the handler (i.e. ``output``)
+
+        Keyword Args:
+            handler_label (str): The label of the handler (i.e. ``json``).
+                If ``None``, all deferred extensions providing ``interface``
+                are loaded.
+
+        Returns:
+            bool: ``True`` if any extensions were loaded, ``False`` otherwise.
+
+        """
+        loaded = False
+        for ext_module, provides in list(self._deferred_extensions.items()):
+            for _interface, _label in provides:
+                if _interface == interface and handler_label in [None, _label]:
+                    del self._deferred_extensions[ext_module]
+                    self.load_extension(ext_module)
+                    loaded = True
+                    break
+        return loaded
@@ -1,10 +1,14 @@
 """Cement core foundation module."""
 
+import asyncio
+import inspect
 import os
+import pickle
 import platform
 import signal
 import sys
 from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
 from importlib import reload as reload_module
 from pathlib import Path as _Path
 from time import sleep
@@ -27,6 +31,7 @@ from ..core import (
     meta,
     output,
     plugin,
+    profile,
     template,
 )
 from ..core.deprecations import deprecate
@@ -73,14 +78,24 @@ def add_handler_override_options(app: "App") -> None:
         return
 
     for i in app._meta.handler_override_options:
-        if i not in app.interface.list():
+        if not app.interface.defined(i):
             LOG.debug(f"interface '{i}'" +
                       " is not defined, can not override handlers")
             continue
 
-        if len(app.handler.list(i)) > 1:
+        # extensions deferred by App.Meta.lazy_extensions are only loaded
+        # here if the application makes one of their handlers overridable
+        # (builtin handlers are not overridable by default)
+        if app._meta.lazy_extensions is True:
+            for key, meta in app._meta.meta_defaults.items():
+                interface, _, label = key.partition('.')
+                if interface == i and meta.get('overridable') is True:
+                    app.ext.load_deferred_extensions(i, label)
+
+        handler_list = app.handler.list(i, load_deferred=False)
+        if len(handler_list) > 1:
             handlers = []
-            for h in app.handler.list(i):
+            for h in handler_list:
                 handlers.append(app._resolve_handler(i, h))
 
             choices = [x._meta.label
@@ -132,6 +147,38 @@ def handler_override(app: "App") -> None:
             getattr(app, f'_setup_{i}_handler')()
 
 
+def teardown_handlers(app: "App") -> None:
+    """
+    This is a ``pre_close`` hook that tears down the application's primary
+    handlers (i.e. ``app.cache``), and handler instances that were reused due
+    to their ``Meta.scope`` (see
+    :meth:`cement.core.handler.HandlerManager.teardown`).
+
+    Args:
+        app (instance): The application object.
+
+    """
+    handlers = []
+    for name in ['config', 'mail', 'cache', 'log', 'plugin', 'args',
+                 'output', 'template']:
+        han = getattr(app, name, None)
+        if han is not None:
+            handlers.append(han)
+    app.handler.teardown(*handlers)
+
+
+def freeze_handlers(app: "App") -> None:
+    """
+    This is a ``post_setup`` hook that freezes the handler registry if
+    ``App.Meta.freeze_handlers`` is ``True``.
+
+    Args:
+        app (instance): The application object.
+
+    """
+    app.handler.freeze()
+
+
 # D-09: the wide return type matches Python's `signal.signal` callable
 # protocol (the stdlib accepts handlers returning anything). The function
 # always raises CaughtSignal so the body never reaches a return statement;
@@ -281,6 +328,40 @@ class App(meta.MetaMixin):
         ``CementApp.Meta.config_file_suffix``.
         """
 
+        config_snapshot: bool = False
+        """
+        Whether to cache the settings parsed from all config files in a
+        snapshot file (see ``App.Meta.config_snapshot_file``), and load the
+        snapshot rather than parsing the config files on the next run if the
+        list of config files, and their sizes and modification times are
+        unchanged.  Environment variable overrides (i.e. ``MYAPP_*``) are
+        not stored in the snapshot.
+        """
+
+        config_snapshot_file: str | None = None
+        """
+        Path of the config snapshot file used if ``App.Meta.config_snapshot``
+        is enabled.
+
+        Note: Though the meta default is ``None``, Cement will set this to
+        ``~/.<app_label>/cache/config.snapshot`` if not set.
+        """
+
+        reload_incremental: bool = False
+        """
+        Whether ``App.reload()`` should only re-parse the config files that
+        changed (by size and modification time), and re-run ``_setup()`` for
+        the application's handlers whose config sections changed, rather
+        than tearing down and rebuilding the entire application.  Extensions,
+        plugins, hooks, and the controller tree are kept as is.
+
+        A full reload is still performed if config files were added or
+        removed, a setting was removed from a config file, or a setting in the
+        application's config section that overrides ``App.Meta`` (see
+        ``App.Meta.core_meta_override``) or loads ``extensions`` changed.
+        Has no effect if ``App.Meta.config_snapshot`` is enabled.
+        """
+
         plugins: list[str] = []
         """
         A list of plugins to load.  This is generally considered bad practice
@@ -490,6 +571,36 @@ class App(meta.MetaMixin):
         extensions: list[str] = []
         """List of additional framework extensions to load."""
 
+        lazy_extensions = False
+        """
+        Whether to defer importing extensions listed in
+        ``App.Meta.core_extensions`` and ``App.Meta.extensions`` until one of
+        the handlers they provide is first requested (via
+        ``app.handler.get()``, ``app.handler.resolve()``, etc).  Only
+        extensions declared in the extension registry
+        (``cement.core.extension.EXTENSION_REGISTRY`` and
+        ``App.Meta.extension_registry``) are deferred, all others are loaded
+        immediately.
+
+        Note that listing the handlers of an interface loads every deferred
+        extension that provides that interface.  The choices of
+        ``App.Meta.handler_override_options`` only load deferred extensions
+        whose handlers are made overridable via ``App.Meta.meta_defaults``.
+        Extensions that register hooks or extend the application (i.e.
+        ``json`` and ``yaml``) are never deferred.
+        """
+
+        extension_registry: dict[str, list[tuple[str, str]]] = {}
+        """
+        Dictionary of application extensions that can be deferred when
+        ``App.Meta.lazy_extensions`` is enabled, mapping the extension module
+        to the ``(interface, handler_label)`` pairs that it registers.  This
+        is merged with (and has precedence over) the builtin
+        ``cement.core.extension.EXTENSION_REGISTRY``.
+
+        I.e. ``{'myapp.ext.ext_s3': [('storage', 's3')]}``
+        """
+
         bootstrap: str | None = None
         """
         A bootstrapping module to load after app creation, and before
@@ -632,6 +743,24 @@ class App(meta.MetaMixin):
         ``True``.
         """
 
+        profile = False
+        """
+        Whether or not to time each phase of the application (handler setup,
+        extension and plugin loading, config file parsing, and every hook
+        function run), and emit a report sorted by duration to
+        ``sys.stderr`` after setup and again before close.  The profiler is
+        accessible as ``app.profiler``.
+
+        This option is overridden by the environment variable
+        ``CEMENT_PROFILE`` (``0`` or ``1``).
+        """
+
+        profile_file: str | None = None
+        """
+        A file path to write the profile report to in JSON format (when
+        ``App.Meta.profile`` is enabled).
+        """
+
         define_hooks: list[str] = []
         """
         List of hook definitions (labels).  Will be passed to
@@ -685,6 +814,14 @@ class App(meta.MetaMixin):
         I.e. ``[MyCustomHandler, SomeOtherHandler]``
         """
 
+        freeze_handlers: bool = False
+        """
+        Whether to freeze the handler registry at ``post_setup``, after which
+        registering a handler raises ``InterfaceError`` (handlers provided by
+        deferred extensions, see ``App.Meta.lazy_extensions``, can still be
+        loaded).
+        """
+
         alternative_module_mapping: dict[str, str] = {}
         """
         EXPERIMENTAL FEATURE: This is an experimental feature added in Cement
@@ -815,6 +952,13 @@ class App(meta.MetaMixin):
             else:
                 self._meta.framework_logging = False
 
+        # enable profiling from environment?
+        if 'CEMENT_PROFILE' in os.environ.keys():
+            val = os.environ.get('CEMENT_PROFILE')
+            assert val in ['0', '1'], \
+                f'Invalid value for CEMENT_PROFILE ({val}). Must be one of: 0, 1'
+            self._meta.profile = is_true(val)
+
         # DEPRECATE: in v3.2.0, this needs to set os.environ if is True
         if self._meta.framework_logging is True:
             deprecate('3.0.8-2')
@@ -825,6 +969,9 @@ class App(meta.MetaMixin):
             self._meta.label = label
 
         self._validate_label()
+        self._profiler: profile.Profiler | None = None
+        if self._meta.profile is True:
+            self._profiler = profile.Profiler(self._meta.label)
         self._loaded_bootstrap = None
         # D-09: argparse Namespace is opaque per-attr-access; Cement does
         # not bind to argparse's internal Namespace type. Internal state.
@@ -833,8 +980,13 @@ class App(meta.MetaMixin):
         # public signature below). Internal cache of last render.
         self._last_rendered: tuple[Any, str | None] | None = None
         self._extended_members: list[str] = []
+        # D-09: parsed config file settings are user-arbitrary.
+        # path -> ((size, mtime), settings parsed from the file)
+        self._config_files_state: dict[str, tuple[Any, dict[str, Any]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
         self.__saved_stdout__: TextIO = None  # type: ignore
         self.__saved_stderr__: TextIO = None  # type: ignore
+        self._output_suppressed = False
         self.__retry_hooks__: list[tuple[str, Callable]] = []
         self.handler: HandlerManager = None  # type: ignore
         self.interface: InterfaceManager = None  # type: ignore
@@ -892,6 +1044,20 @@ class App(meta.MetaMixin):
         """
         return self._meta.quiet
 
+    @property
+    def profiler(self) -> profile.Profiler | None:
+        """
+        The application profiler if ``App.Meta.profile`` is enabled,
+        otherwise ``None``.
+        """
+        return self._profiler
+
+    def _profile(self, category: str, label: str) -> AbstractContextManager[None]:
+        # time the block if profiling is enabled, otherwise a no-op
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.timeit(category, label)
+
     @property
     def argv(self) -> list[str]:
         """The arguments list that will be used when self.run() is called."""
@@ -968,17 +1134,19 @@ class App(meta.MetaMixin):
         for _res in self.hook.run('pre_setup', self):
             pass
 
-        self._setup_extension_handler()
-        self._setup_signals()
-        self._setup_config_handler()
-        self._setup_mail_handler()
-        self._setup_cache_handler()
-        self._setup_log_handler()
-        self._setup_plugin_handler()
-        self._setup_arg_handler()
-        self._setup_output_handler()
-        self._setup_template_handler()
-        self._setup_controllers()
+        for name in ['extension_handler',
+                     'signals',
+                     'config_handler',
+                     'mail_handler',
+                     'cache_handler',
+                     'log_handler',
+                     'plugin_handler',
+                     'arg_handler',
+                     'output_handler',
+                     'template_handler',
+                     'controllers']:
+            with self._profile('setup', f'_setup_{name}'):
+                getattr(self, f'_setup_{name}')()
 
         for hook_spec in self.__retry_hooks__:
             self.hook.register(*hook_spec)
@@ -991,6 +1159,12 @@ class App(meta.MetaMixin):
         This function wraps everything together (after ``self._setup()`` is
         called) to run the application.
 
+        Controller functions and ``pre_run``/``post_run`` hook functions
+        that are coroutines (``async def``) are awaited on the application's
+        event loop, which is created on first use and closed by
+        ``self.close()``.  If the application is run from within an already
+        running event loop, use ``await self.run_async()`` instead.
+
         Returns:
             unknown: The result of the executed controller function if
             a base controller is set and a controller function is called,
@@ -1001,21 +1175,103 @@ class App(meta.MetaMixin):
         return_val = None
 
         LOG.debug('running pre_run hook')
-        for _res in self.hook.run('pre_run', self):
+        for res in self.hook.run('pre_run', self):
+            self._await(res)
+
+        # If controller exists, then dispatch it
+        if self.controller:
+            return_val = self._await(self.controller._dispatch())
+        else:
+            self._parse_args()  # pragma: nocover  # defensive: unreachable
+
+        LOG.debug('running post_run hook')
+        for res in self.hook.run('post_run', self):
+            self._await(res)
+
+        return return_val
+
+    async def run_async(self) -> None | Any:
+        """
+        Coroutine equivalent of ``self.run()``, for use when the application
+        is run from within an already running event loop.  Controller
+        functions and ``pre_run``/``post_run`` hook functions that are
+        coroutines are awaited.
+
+        Returns:
+            unknown: The result of the executed controller function if
+            a base controller is set and a controller function is called,
+            otherwise ``None`` if no controller dispatched or no controller
+            function was called.
+
+        Example:
+
+            .. code-block:: python
+
+                import asyncio
+                from cement import App
+
+                async def main():
+                    app = App('myapp')
+                    app.setup()
+                    await app.run_async()
+                    await app.close_async()
+
+                asyncio.run(main())
+
+        """
+        return_val = None
+
+        LOG.debug('running pre_run hook')
+        async for _res in self.hook.run_async('pre_run', self):
             pass
 
         # If controller exists, then dispatch it
         if self.controller:
             return_val = self.controller._dispatch()
+            if inspect.isawaitable(return_val):
+                return_val = await return_val
         else:
             self._parse_args()  # pragma: nocover  # defensive: unreachable
 
         LOG.debug('running post_run hook')
-        for _res in self.hook.run('post_run', self):
+        async for _res in self.hook.run_async('post_run', self):
             pass
 
         return return_val
 
+    # D-09: awaitables and their results are user-arbitrary (controller
+    # function and hook return values).
+    def _await(self, obj: Any) -> Any:
+        # drive coroutines/awaitables to completion on the application event
+        # loop, anything else is returned as is
+        if not inspect.isawaitable(obj):
+            return obj
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            if inspect.iscoroutine(obj):
+                obj.close()
+            raise exc.FrameworkError(
+                "Can not await coroutine from within a running event loop, "
+                "use `await app.run_async()` instead."
+            )
+
+        if self._loop is None:
+            LOG.debug('creating application event loop')
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(obj)
+
+    def _close_event_loop(self) -> None:
+        if self._loop is None:
+            return
+        LOG.debug('closing application event loop')
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        self._loop.close()
+        self._loop = None
+
     def run_forever(self, interval: int = 1, tb: bool = True) -> None:
         """
         This function wraps ``self.run()`` with an endless while loop.  If any
@@ -1052,12 +1308,95 @@ class App(meta.MetaMixin):
         """
         This function is useful for reloading a running applications, for
         example to reload configuration settings, etc.
+
+        If ``App.Meta.reload_incremental`` is enabled, only what changed is
+        reloaded when possible.
         """
         LOG.debug(f'reloading the {self._meta.label} application')
+        if self._meta.reload_incremental is True and self._reload_incremental():
+            return
+        teardown_handlers(self)
         self._unlay_cement()
         self._lay_cement()
         self.setup()
 
+    def _reload_incremental(self) -> bool:
+        # returns False if a full reload is required
+        files = list(self._meta.config_files)
+        for d in self._meta.config_dirs:
+            for f in self._find_config_files(d):
+                if f not in files:
+                    LOG.debug(f"config file '{f}' was added, full reload required")
+                    return False
+
+        if any(f not in self._config_files_state for f in files):
+            LOG.debug("config files were not parsed individually, full reload required")
+            return False
+
+        old: dict[str, dict[str, Any]] = {}
+        new: dict[str, dict[str, Any]] = {}
+        for f in files:
+            stat, settings = self._config_files_state[f]
+            for section, items in settings.items():
+                old.setdefault(section, {}).update(items)
+            if self._get_config_file_stat(f) != stat:
+                LOG.debug(f"config file '{f}' changed, re-parsing")
+                with self._profile('config', f):
+                    settings = self._parse_config_file(f)
+            for section, items in settings.items():
+                new.setdefault(section, {}).update(items)
+
+        changed: dict[str, dict[str, Any]] = {}
+        for section, items in old.items():
+            for key in items:
+                if key not in new.get(section, {}):
+                    LOG.debug(f"config setting '{section}.{key}' was removed, "
+                              "full reload required")
+                    return False
+        for section, items in new.items():
+            for key, value in items.items():
+                if key not in old.get(section, {}) or old[section][key] != value:
+                    changed.setdefault(section, {})[key] = value
+
+        if not changed:
+            LOG.debug("no config changes found")
+            return True
+
+        for section in changed:
+            # new sections (or i.e. the ConfigParser default section, whose
+            # settings apply to all sections)
+            if not self.config.has_section(section):
+                LOG.debug(f"config section '{section}' was added, "
+                          "full reload required")
+                return False
+
+        requires_full = set(self._meta.core_meta_override) | \
+            set(self._meta.meta_override) | {'extensions'}
+        for key in changed.get(self._meta.config_section, {}):
+            if key in requires_full:
+                LOG.debug(f"config setting '{self._meta.config_section}.{key}' "
+                          "changed, full reload required")
+                return False
+
+        self.config.merge(changed)
+        self.validate_config()
+
+        # re-setup handlers whose config sections changed
+        handlers: dict[int, Handler] = {}
+        for name in ['mail', 'cache', 'log', 'plugin', 'output', 'template']:
+            han = getattr(self, name, None)
+            if han is not None:
+                handlers[id(han)] = han
+        for han in self.handler._instances.values():
+            handlers[id(han)] = han
+
+        for han in handlers.values():
+            if han._meta.config_section in changed:
+                LOG.debug(f"setting up handler {han} again")
+                han._setup(self)
+
+        return True
+
     def _unlay_cement(self) -> None:
         for member in self._extended_members:
             delattr(self, member)
@@ -1076,10 +1415,46 @@ class App(meta.MetaMixin):
             passed then exit with whatever ``self.exit_code`` is currently set
             to.  Note: ``sys.exit()`` will only be called if
             ``App.Meta.exit_on_close==True``.
+
+        Hook functions that are coroutines (``async def``) are awaited on
+        the application's event loop, which is then closed.
         """
-        for _res in self.hook.run('pre_close', self):
+        for res in self.hook.run('pre_close', self):
+            self._await(res)
+
+        self._close_output()
+
+        # in theory, this should happen last-last... but at that point `self`
+        # would be kind of busted after _unlay_cement() is run.
+        for res in self.hook.run('post_close', self):
+            self._await(res)
+
+        self._close_event_loop()
+        self._finalize_close(code)
+
+    async def close_async(self, code: int | None = None) -> None:
+        """
+        Coroutine equivalent of ``self.close()``, for use from within an
+        already running event loop.  Hook functions that are coroutines are
+        awaited.
+
+        Args:
+            code: An exit code to exit with (``int``), if ``None`` is
+            passed then exit with whatever ``self.exit_code`` is currently set
+            to.  Note: ``sys.exit()`` will only be called if
+            ``App.Meta.exit_on_close==True``.
+        """
+        async for _res in self.hook.run_async('pre_close', self):
+            pass
+
+        self._close_output()
+
+        async for _res in self.hook.run_async('post_close', self):
             pass
 
+        self._finalize_close(code)
+
+    def _close_output(self) -> None:
         LOG.debug(f"closing the {self._meta.label} application")
 
         # reattach our stdout if in quiet mode to avoid lingering file handles
@@ -1087,11 +1462,7 @@ class App(meta.MetaMixin):
         if self._meta.quiet is True:
             self._unsuppress_output()
 
-        # in theory, this should happen last-last... but at that point `self`
-        # would be kind of busted after _unlay_cement() is run.
-        for _res in self.hook.run('post_close', self):
-            pass
-
+    def _finalize_close(self, code: int | None) -> None:
         self._unlay_cement()
 
         if code is not None:
@@ -1110,11 +1481,27 @@ class App(meta.MetaMixin):
                template: str | None = None,
                out: IO = sys.stdout,
                handler: str | None = None,
+               stream: bool = False,
                **kw: Any) -> str:
         """
         This is a simple wrapper around ``self.output.render()`` which simply
         returns an empty string if no output handler is defined.
 
+        If ``stream`` is ``True``, the output is instead rendered with
+        ``self.output.render_iter()`` and every chunk is written to ``out``
+        as soon as it is produced, so that large output is never held in
+        memory as a whole.  The ``post_render`` hooks are then run once per
+        chunk, the rendered text is not kept (``App.last_rendered`` holds
+        ``(data, None)``) and an empty string is returned.  ``out`` is
+        flushed after every chunk, and rendering stops
+        early if the reader of ``out`` goes away (i.e. ``myapp | head``).
+
+        Output handlers that encode to ``bytes`` natively (i.e. the ``json``
+        output handler with the ``orjson`` backend) write the encoded output
+        directly to the binary buffer of ``out`` (i.e. ``sys.stdout.buffer``)
+        if it has one, unless a ``post_render`` hook modified the text.  The
+        rendered text is still returned as ``str``.
+
         Args:
             data (dict): The data dictionary to render.
 
@@ -1127,6 +1514,8 @@ class App(meta.MetaMixin):
                 is ``True``, this will be set to ``None``.
             handler: The output handler to use to render.  Defaults to
                 ``App.Meta.output_handler``.
+            stream (bool): Whether to write the output to ``out`` in chunks
+                as it is rendered.
 
         Other Parameters:
             kw (dict): Additional keyword arguments will be passed to the
@@ -1147,16 +1536,30 @@ class App(meta.MetaMixin):
         kw['template'] = template
 
         if handler is not None:
-            oh = self.handler.resolve('output', handler)
-            oh._setup(self)  # type: ignore
+            oh = self.handler.resolve('output', handler, setup=True)
         else:
             oh = self.output
 
+        if stream is True:
+            self._render_stream(oh, data, out, **kw)
+            self._last_rendered = (data, None)
+            return ''
+
+        # skip the decode/encode round trip of bytes native handlers when
+        # `out` has a binary buffer to write to
+        binary = getattr(oh, 'bytes_native', False) is True and \
+            out is not None and hasattr(out, 'buffer')
+
+        out_bytes: bytes | None = None
         if oh is None:
             LOG.debug('render() called, but no output handler defined.')
             out_text = ''
+        elif binary is True:
+            out_bytes = oh.render_bytes(data, **kw)
+            out_text = out_bytes.decode('utf-8')
         else:
             out_text = oh.render(data, **kw)
+        rendered_text = out_text
 
         for res in self.hook.run('post_render', self, out_text):
             if type(res) is not str:
@@ -1168,12 +1571,62 @@ class App(meta.MetaMixin):
             raise TypeError("Argument 'out' must be a 'file' like object")
         elif out is not None and out_text is None:
             LOG.debug('render() called but output text is None')
+        elif out and out_bytes is not None and out_text is rendered_text:
+            # no post_render hook replaced the text, so write the encoded
+            # output as is (anything already written as text must come first)
+            out.flush()
+            out.buffer.write(out_bytes)
         elif out:
             out.write(out_text)
 
         self._last_rendered = (data, out_text)
         return out_text
 
+    # D-09: same user-arbitrary render data/passthrough contract as `render`.
+    def _render_stream(self, oh: Any, data: Any, out: IO | None, **kw: Any) -> None:
+        if out is not None and not hasattr(out, 'write'):
+            raise TypeError("Argument 'out' must be a 'file' like object")
+
+        if oh is None:
+            LOG.debug('render() called, but no output handler defined.')
+            chunks: Any = iter([])
+        elif hasattr(oh, 'render_iter'):
+            chunks = oh.render_iter(data, **kw)
+        else:
+            # handlers implementing the interface without OutputHandler
+            chunks = iter([oh.render(data, **kw)])
+
+        try:
+            for chunk in chunks:
+                for res in self.hook.run('post_render', self, chunk):
+                    if type(res) is not str:
+                        LOG.debug('post_render hook did not return a str()')
+                    else:
+                        chunk = str(res)
+                if out is not None and chunk is not None:
+                    out.write(chunk)
+                    # make each chunk available to the reader right away
+                    if hasattr(out, 'flush'):
+                        out.flush()
+        except BrokenPipeError:
+            LOG.debug('output pipe closed by the reader, stopping render')
+            self._discard_output(out)
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+    def _discard_output(self, out: IO | None) -> None:
+        # anything still buffered would raise BrokenPipeError again when
+        # python flushes stdout at exit, so point it to devnull instead
+        if out not in [sys.stdout, sys.__stdout__]:
+            return
+        try:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, out.fileno())  # type: ignore
+            os.close(devnull)
+        except (AttributeError, OSError, ValueError):
+            pass
+
     # D-09: render data is user-arbitrary (matches the `render` signature
     # above). Public App property (D-12).
     @property
@@ -1209,12 +1662,16 @@ class App(meta.MetaMixin):
         if self._meta.debug is True:
             LOG.debug('not suppressing console output because of debug mode')
             return
+        elif self._output_suppressed is True:
+            # i.e. post_render hooks run once per chunk when streaming
+            return
 
         LOG.debug('suppressing all console output')
         self.__saved_stdout__ = sys.stdout
         self.__saved_stderr__ = sys.stderr
         sys.stdout = open(os.devnull, 'w')
         sys.stderr = open(os.devnull, 'w')
+        self._output_suppressed = True
 
         # have to resetup the log handler to suppress console output
         if self.log is not None:
@@ -1230,6 +1687,7 @@ class App(meta.MetaMixin):
             sys.stderr.close()
         sys.stdout = self.__saved_stdout__
         sys.stderr = self.__saved_stderr__
+        self._output_suppressed = False
 
         # have to resetup the log handler to unsuppress console output
         if self.log is not None:
@@ -1265,6 +1723,14 @@ class App(meta.MetaMixin):
                            weight=-99)
         self.hook.register('post_argument_parsing',
                            handler_override, weight=-99)
+        self.hook.register('pre_close', teardown_handlers, weight=99)
+
+        if self._meta.freeze_handlers is True:
+            self.hook.register('post_setup', freeze_handlers, weight=99)
+
+        if self._profiler is not None:
+            self.hook.register('post_setup', profile.emit_report, weight=99)
+            self.hook.register('pre_close', profile.emit_report, weight=99)
 
         # register application hooks from meta.  the hooks listed in
         # App.Meta.hooks are registered here, so obviously can not be
@@ -1347,8 +1813,12 @@ class App(meta.MetaMixin):
         LOG.debug(f"setting up {self._meta.label}.extension handler")
         self.ext = self._resolve_handler('extension',  # type: ignore
                                          self._meta.extension_handler)
-        self.ext.load_extensions(self._meta.core_extensions)
-        self.ext.load_extensions(self._meta.extensions)
+        if self._meta.lazy_extensions is True:
+            self.ext.defer_extensions(self._meta.core_extensions)
+            self.ext.defer_extensions(self._meta.extensions)
+        else:
+            self.ext.load_extensions(self._meta.core_extensions)
+            self.ext.load_extensions(self._meta.extensions)
 
     def _find_config_files(self, path: str) -> list[str]:
         found_files = []
@@ -1361,6 +1831,74 @@ class App(meta.MetaMixin):
                 found_files.append(fs.join(path, f))
         return found_files
 
+    def _get_config_file_stat(self, path: str) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def _get_config_snapshot_key(self) -> tuple[Any, ...]:
+        files = []
+        for f in self._meta.config_files:
+            files.append((f, self._get_config_file_stat(f)))
+        return (self.config.__class__.__qualname__, tuple(files))
+
+    def _parse_config_snapshot(self) -> None:
+        if self._meta.config_snapshot_file is None:
+            self._meta.config_snapshot_file = fs.join(
+                fs.HOME_DIR, f'.{self._meta.label}', 'cache', 'config.snapshot')
+        path = fs.abspath(self._meta.config_snapshot_file)
+        key = self._get_config_snapshot_key()
+
+        try:
+            with self._profile('config', path), open(path, 'rb') as fh:
+                snapshot = pickle.load(fh)
+            if snapshot['key'] == key:
+                LOG.debug(f"loading config snapshot '{path}'")
+                self.config.merge(snapshot['config'])
+                return
+        except Exception as e:
+            LOG.debug(f"unable to load config snapshot '{path}': {e}")
+
+        # parse the config files into a separate config handler so that the
+        # snapshot only holds settings from the files (not defaults or
+        # environment variable overrides)
+        parsed = self._new_config_handler()
+        for f in self._meta.config_files:
+            with self._profile('config', f):
+                parsed.parse_file(f)
+        config = parsed._get_parsed_dict()
+        self.config.merge(config)
+
+        LOG.debug(f"writing config snapshot '{path}'")
+        try:
+            fs.ensure_parent_dir_exists(path)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as fh:
+                pickle.dump(dict(key=key, config=config), fh,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            LOG.debug(f"unable to write config snapshot '{path}': {e}")
+
+    def _new_config_handler(self) -> config.ConfigHandler:
+        label = self.config._meta.label
+        han = self.config.__class__(
+            **self._meta.meta_defaults.get(f'config.{label}', {}))
+        han._setup(self)
+        return han
+
+    def _parse_config_file(self, path: str) -> dict[str, Any]:
+        # parse a single config file into a separate config handler, keeping
+        # its settings so that they can be compared on reload
+        stat = self._get_config_file_stat(path)
+        parsed = self._new_config_handler()
+        parsed.parse_file(path)
+        settings = parsed._get_parsed_dict()
+        self._config_files_state[path] = (stat, settings)
+        return settings
+
     def _setup_config_handler(self) -> None:
         LOG.debug(f"setting up {self._meta.label}.config handler")
         label = self._meta.label
@@ -1440,9 +1978,19 @@ class App(meta.MetaMixin):
         for d in config_dirs:
             self.add_config_dir(d)
 
+        self._config_files_state = {}
         for f in config_files:
             self.add_config_file(f)
-            self.config.parse_file(f)
+            if self._meta.config_snapshot is True:
+                continue
+            with self._profile('config', f):
+                if self._meta.reload_incremental is True:
+                    self.config.merge(self._parse_config_file(f))
+                else:
+                    self.config.parse_file(f)
+
+        if self._meta.config_snapshot is True:
+            self._parse_config_snapshot()
 
         self.validate_config()
 
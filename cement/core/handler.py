@@ -5,11 +5,14 @@ Cement core handler module.
 
 import builtins
 import re
+import threading
 from abc import ABC
+from collections import Counter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from ..core import exc
-from ..core.meta import MetaMixin
+from ..core.meta import MetaMixin, _get_meta_defaults, reset_meta_cache
 from ..utils.misc import minimal_logger
 
 LOG = minimal_logger(__name__)
@@ -64,6 +67,16 @@ class Handler(ABC, MetaMixin):
         ``App.Meta.output_handler``, etc).
         """
 
+        scope: str = 'call'
+        """
+        How instances resolved (and setup) by ``app.handler.resolve()`` are
+        reused.  One of ``call`` (a new instance every time), ``app`` (one
+        instance per application), or ``thread`` (one instance per
+        application, per thread).  Reused instances are cached by interface,
+        handler class, and ``meta_defaults``, and are torn down via
+        ``_teardown()`` at ``pre_close``.
+        """
+
     # D-09: handler-contract pluggable kwargs by design (Meta merging via
     # MetaMixin upchain). Public Handler base API (D-12).
     def __init__(self, **kw: Any) -> None:
@@ -109,6 +122,18 @@ class Handler(ABC, MetaMixin):
         """
         pass    # pragma: nocover  # abstract method
 
+    def _teardown(self) -> None:
+        """
+        Called at ``pre_close`` for the application's primary handlers (i.e.
+        ``app.cache``) and reused handler instances (see ``Meta.scope``), and
+        should release anything acquired in ``_setup()``.
+        """
+        pass
+
+
+# cached handler instances by (interface, handler class, meta_defaults repr)
+_InstanceCache = dict[tuple[str, type[Handler], str], Handler]
+
 
 class HandlerManager:
     """
@@ -120,6 +145,13 @@ class HandlerManager:
     def __init__(self, app: "App"):
         self.app = app
         self.__handlers__: dict[str, dict[str, type[Handler]]] = {}
+        self._instances: _InstanceCache = {}
+        self._local = threading.local()
+        self._thread_instances: list[_InstanceCache] = []
+        self._lock = threading.Lock()
+        self._lookups: Counter[str] = Counter()
+        self._registry: MappingProxyType[str, MappingProxyType[str, type[Handler]]] | None = None
+        self._frozen = False
 
     # D-09: passthrough kwargs for handler-resolution machinery; wide type
     # is intentional. Public HandlerManager API (D-12).
@@ -160,28 +192,39 @@ class HandlerManager:
 
         """
         setup = kwargs.get('setup', False)
+        self._lookups['get'] += 1
 
-        if interface not in self.app.interface.list():
+        if not self.app.interface.defined(interface):
             raise exc.InterfaceError(f"Interface '{interface}' does not exist!")
 
-        if handler_label in self.__handlers__[interface]:
+        handlers = self.__handlers__.get(interface, {})
+        if handler_label not in handlers:
+            self._load_deferred(interface, handler_label)
+            handlers = self.__handlers__.get(interface, {})
+
+        if handler_label in handlers:
             if setup is True:
-                han = self.__handlers__[interface][handler_label]
-                return self.setup(han)
+                return self.setup(handlers[handler_label])
             else:
-                return self.__handlers__[interface][handler_label]
+                return handlers[handler_label]
         elif fallback is not None:
             return fallback
         else:
             raise exc.InterfaceError(f"handlers['{interface}']['{handler_label}'] does not exist!")
 
-    def list(self, interface: str) -> builtins.list[type[Handler]]:
+    def list(self, interface: str,
+             load_deferred: bool = True) -> builtins.list[type[Handler]]:
         """
         Return a list of handlers for a given ``interface``.
 
         Args:
             interface (str): The interface of the handler (i.e. ``output``)
 
+        Keyword Args:
+            load_deferred (bool): Whether to first load any extensions
+                deferred by ``App.Meta.lazy_extensions`` that provide
+                handlers for ``interface``.
+
         Returns:
             list: Handler labels (str) that match ``interface``.
 
@@ -196,14 +239,32 @@ class HandlerManager:
                 app.handler.list('log')
 
         """
+        self._lookups['list'] += 1
         if not self.app.interface.defined(interface):
             raise exc.InterfaceError(f"Interface '{interface}' does not exist!")
 
+        if load_deferred is True:
+            self._load_deferred(interface)
+
         res = []
         for label in self.__handlers__[interface]:
             res.append(self.__handlers__[interface][label])
         return res
 
+    def _load_deferred(self, interface: str, handler_label: str | None = None) -> bool:
+        # load extensions deferred by App.Meta.lazy_extensions that provide
+        # the requested handler(s)
+        if self.app._meta.lazy_extensions is not True or self.app.ext is None:
+            return False
+
+        # deferred extensions are part of the app, even if the registry is
+        # frozen
+        frozen, self._frozen = self._frozen, False
+        try:
+            return self.app.ext.load_deferred_extensions(interface, handler_label)
+        finally:
+            self._frozen = frozen
+
     def register(self,
                  handler_class: type[Handler],
                  force: bool = False) -> None:
@@ -244,6 +305,11 @@ class HandlerManager:
 
         """
 
+        if self._frozen:
+            raise exc.InterfaceError(
+                f"Unable to register handler {handler_class}, the handler "
+                "registry is frozen")
+
         # for checks
         if not issubclass(handler_class, Handler):
             raise exc.InterfaceError(f"Class {handler_class} " +
@@ -252,8 +318,10 @@ class HandlerManager:
         obj = handler_class()
 
         # translate dashes to underscores
-        handler_class.Meta.label = re.sub('-', '_', obj._meta.label)
-        obj._meta.label = re.sub('-', '_', obj._meta.label)
+        if '-' in obj._meta.label:
+            handler_class.Meta.label = re.sub('-', '_', obj._meta.label)
+            obj._meta.label = re.sub('-', '_', obj._meta.label)
+            reset_meta_cache()
 
         interface = obj._meta.interface
         LOG.debug(
@@ -261,10 +329,11 @@ class HandlerManager:
             f"handlers['{interface}']['{obj._meta.label}']"
         )
 
-        if interface not in self.app.interface.list():
+        if not self.app.interface.defined(interface):
             raise exc.InterfaceError(f"Handler interface '{interface}' doesn't exist.")
-        elif interface not in self.__handlers__.keys():
+        elif interface not in self.__handlers__:
             self.__handlers__[interface] = {}
+            self._registry = None
 
         if obj._meta.label in self.__handlers__[interface] and \
                 self.__handlers__[interface][obj._meta.label] != handler_class:
@@ -305,12 +374,8 @@ class HandlerManager:
                 app.handler.registered('log', 'colorlog')
 
         """
-        if interface in self.app.interface.list():
-            if interface in self.__handlers__.keys() and \
-               handler_label in self.__handlers__[interface]:
-                return True
-
-        return False
+        self._lookups['registered'] += 1
+        return handler_label in self.__handlers__.get(interface, ())
 
     def setup(self, handler_class: type[Handler]) -> Handler:
         """
@@ -333,6 +398,105 @@ class HandlerManager:
         h._setup(self.app)
         return h
 
+    @property
+    def registry(self) -> "MappingProxyType[str, MappingProxyType[str, type[Handler]]]":
+        """
+        A read-only view of all registered handler classes, by interface
+        label and then handler label (i.e.
+        ``app.handler.registry['output']['json']``).
+
+        """
+        if self._registry is None:
+            self._registry = MappingProxyType({
+                key: MappingProxyType(val) for key, val in self.__handlers__.items()
+            })
+        return self._registry
+
+    def freeze(self) -> None:
+        """
+        Freeze the handler registry, after which any attempt to register a
+        handler raises ``InterfaceError``.  Called at ``post_setup`` if
+        ``App.Meta.freeze_handlers`` is ``True``.
+
+        """
+        LOG.debug('freezing handler registry')
+        self._frozen = True
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the number of handler registry lookups performed, by method.
+
+        Returns:
+            dict: A dictionary with the keys ``get``, ``list``,
+            ``registered``, and ``resolve``.
+
+        """
+        return {key: self._lookups[key]
+                for key in ['get', 'list', 'registered', 'resolve']}
+
+    def _get_instance_cache(self, scope: str) -> _InstanceCache | None:
+        if scope == 'app':
+            return self._instances
+        elif scope == 'thread':
+            if not hasattr(self._local, 'instances'):
+                self._local.instances = {}
+                with self._lock:
+                    self._thread_instances.append(self._local.instances)
+            return self._local.instances  # type: ignore
+        elif scope == 'call':
+            return None
+        raise exc.FrameworkError(
+            f"Invalid handler scope '{scope}'.  "
+            "Expecting one of: [call, app, thread]")
+
+    # D-09: meta_defaults carries the same arbitrary Meta values as resolve().
+    def _get_instance(self,
+                      interface: str,
+                      handler_class: type[Handler],
+                      meta_defaults: dict[str, Any]) -> Handler | None:
+        # return a previously resolved and setup instance for handlers whose
+        # Meta.scope is `app` or `thread`
+        scope = meta_defaults.get('scope', _get_meta_defaults(handler_class).get('scope'))
+        cache = self._get_instance_cache(scope or 'call')
+        if cache is None:
+            return None
+        key = (interface, handler_class, repr(sorted(meta_defaults.items())))
+        return cache.get(key)
+
+    # D-09: same arbitrary Meta value contract as `_get_instance` above.
+    def _set_instance(self,
+                      interface: str,
+                      han: Handler,
+                      meta_defaults: dict[str, Any]) -> None:
+        cache = self._get_instance_cache(getattr(han._meta, 'scope', None) or 'call')
+        if cache is not None:
+            key = (interface, han.__class__, repr(sorted(meta_defaults.items())))
+            cache[key] = han
+
+    def teardown(self, *handlers: Handler) -> None:
+        """
+        Tear down (see ``Handler._teardown()``) and discard all handler
+        instances cached due to their ``Meta.scope``, as well as any other
+        handler instances passed (i.e. the application's primary handlers).
+        Every instance is torn down once.  Called automatically at
+        ``pre_close``.
+
+        Args:
+            handlers (instance): Additional handler instances to tear down.
+
+        """
+        with self._lock:
+            caches = [self._instances] + self._thread_instances
+            seen: set[int] = set()
+            for han in [*handlers, *(h for cache in caches for h in cache.values())]:
+                if id(han) in seen:
+                    continue
+                seen.add(id(han))
+                LOG.debug(f"tearing down handler {han}")
+                han._teardown()
+            for cache in caches:
+                cache.clear()
+
     # D-09: same passthrough-kwargs contract as `get` above. Public
     # HandlerManager API (D-12). Note: the `Handler | Handler | None`
     # return type is a Wave 3 UP007 cascade artifact (duplicate union
@@ -379,6 +543,7 @@ class HandlerManager:
                 log = app.handler.resolve('log', ColorLogHandler())
 
         """
+        self._lookups['resolve'] += 1
         raise_error = kwargs.get('raise_error', True)
         meta_defaults = kwargs.get('meta_defaults', None)
         if meta_defaults is None:
@@ -393,15 +558,22 @@ class HandlerManager:
                                                                  {})
 
         setup = kwargs.get('setup', False)
-        han = None
+        han: Handler | None = None
 
         if type(handler_def) is str:
-            han = self.get(interface, handler_def)(**meta_defaults)  # type: ignore
+            han_class = self.get(interface, handler_def)
+            cached = self._get_instance(interface, han_class, meta_defaults)  # type: ignore
+            if cached is not None:
+                return cached
+            han = han_class(**meta_defaults)  # type: ignore
         elif hasattr(handler_def, '_meta'):
             if not self.registered(interface, handler_def._meta.label):  # type: ignore
                 self.register(handler_def.__class__)  # type: ignore
-            han = handler_def
+            han = handler_def  # type: ignore
         elif hasattr(handler_def, 'Meta'):
+            cached = self._get_instance(interface, handler_def, meta_defaults)  # type: ignore
+            if cached is not None:
+                return cached
             han = handler_def(**meta_defaults)  # type: ignore
             if not self.registered(interface, han._meta.label):  # type: ignore
                 self.register(handler_def)  # type: ignore
@@ -410,6 +582,8 @@ class HandlerManager:
         if han is not None:
             if setup is True:
                 han._setup(self.app)
+                if han is not handler_def:
+                    self._set_instance(interface, han, meta_defaults)
             return han
         elif han is None and raise_error:
             raise exc.FrameworkError(msg)
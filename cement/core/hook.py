@@ -1,9 +1,13 @@
 """Cement core hooks module."""
 
+import asyncio
 import builtins
+import inspect
 import operator
 import types
-from collections.abc import Callable, Generator
+from bisect import insort
+from collections.abc import AsyncGenerator, Callable, Generator
+from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
 from ..core import exc
@@ -26,6 +30,11 @@ class HookManager:
         self.app = app
         self.__hooks__: dict[str, list] = {}
 
+        # frozen, weight-ordered call lists per hook name (tied to the
+        # registered list object and its length, so that any registration
+        # invalidates them)
+        self._call_lists: dict[str, tuple[list, int, tuple]] = {}
+
     def list(self) -> builtins.list[str]:
         """
         List all defined hooks.
@@ -128,10 +137,25 @@ class HookManager:
 
         LOG.debug(f"registering hook '{func.__name__}' from {func.__module__} into hooks['{name}']")
 
-        # Hooks are as follows: (weight, name, func)
-        self.__hooks__[name].append((int(weight), func.__name__, func))
+        # Hooks are as follows: (weight, name, func), and kept ordered by
+        # weight (the first item in the tuple) on registration. Hooks of equal
+        # weight keep their registration order.
+        insort(self.__hooks__[name], (int(weight), func.__name__, func),
+               key=operator.itemgetter(0))
+        self._call_lists.pop(name, None)
         return True
 
+    def _get_call_list(self, name: str) -> tuple:
+        hooks = self.__hooks__[name]
+        cached = self._call_lists.get(name)
+        if cached is None or cached[0] is not hooks or cached[1] != len(hooks):
+            # hooks appended directly to ``__hooks__`` are not guaranteed to
+            # be in order
+            hooks.sort(key=operator.itemgetter(0))
+            cached = (hooks, len(hooks), tuple(hooks))
+            self._call_lists[name] = cached
+        return cached[2]
+
     # D-09: hook payload is user-arbitrary by design — extensions register
     # callbacks that receive whatever the framework passes at the hook site.
     # Public HookManager API — wide types are the contract (D-12).
@@ -174,11 +198,18 @@ class HookManager:
         if name not in self.__hooks__:
             raise exc.FrameworkError(f"Hook name '{name}' is not defined!")
 
-        # Will order based on weight (the first item in the tuple)
-        self.__hooks__[name].sort(key=operator.itemgetter(0))
-        for hook in self.__hooks__[name]:
-            LOG.debug(f"running hook '{name}' ({hook[2]}) from {hook[2].__module__}")
-            res = hook[2](*args, **kwargs)
+        profiler = self.app.profiler
+        debug = LOG.logging_is_enabled
+
+        for hook in self._get_call_list(name):
+            if debug:
+                LOG.debug(f"running hook '{name}' ({hook[2]}) from {hook[2].__module__}")
+            if profiler is None:
+                res = hook[2](*args, **kwargs)
+            else:
+                label = f"{name}: {hook[2].__module__}.{hook[1]}"
+                with profiler.timeit('hook', label):
+                    res = hook[2](*args, **kwargs)
 
             # Check if result is a nested generator - needed to support e.g.
             # asyncio
@@ -186,3 +217,103 @@ class HookManager:
                 yield from res
             else:
                 yield res
+
+    # D-09: same hook payload contract as `run` above.
+    async def run_async(self,
+                        name: str,
+                        *args: Any,
+                        concurrent: bool = False,
+                        **kwargs: Any) -> AsyncGenerator:
+        """
+        Run all defined hooks in the namespace, awaiting any hook functions
+        that are coroutines (``async def``).  Sync hook functions, generators
+        and async generators are also supported.
+
+        Args:
+            name (str): The name of the hook function.
+            args (tuple): Additional arguments to be passed to the hook
+                functions.
+            kwargs (dict): Additional keyword arguments to be passed to the
+                hook functions.
+
+        Keyword Args:
+            concurrent (bool): Whether to run hook functions of equal weight
+                concurrently (via ``asyncio.gather()``).  Results are still
+                yielded in weight (and registration) order.
+
+        Yields:
+            The result of each hook function executed.
+
+        Raises:
+            cement.core.exc.FrameworkError: If the hook ``name`` is not
+                defined
+
+        Example:
+
+            .. code-block:: python
+
+                import asyncio
+                from cement import App
+
+                async def my_hook_func(app):
+                    # do something asynchronous with app?
+                    return True
+
+                with App('myapp') as app:
+                    app.hook.define('my_hook_name')
+                    app.hook.register('my_hook_name', my_hook_func)
+
+                    async def main():
+                        async for res in app.hook.run_async('my_hook_name',
+                                                            app,
+                                                            concurrent=True):
+                            # do something with the result?
+                            pass
+
+                    asyncio.run(main())
+
+        """
+        if name not in self.__hooks__:
+            raise exc.FrameworkError(f"Hook name '{name}' is not defined!")
+
+        call_list = self._get_call_list(name)
+
+        if concurrent is True:
+            # hooks of equal weight are adjacent in the call list
+            for _weight, group in groupby(call_list, key=operator.itemgetter(0)):
+                results = await asyncio.gather(
+                    *[self._run_hook_async(name, hook, args, kwargs) for hook in group]
+                )
+                for res in results:
+                    async for _res in self._expand_result(res):
+                        yield _res
+        else:
+            for hook in call_list:
+                res = await self._run_hook_async(name, hook, args, kwargs)
+                async for _res in self._expand_result(res):
+                    yield _res
+
+    # D-09: same hook payload contract as `run` above.
+    async def _run_hook_async(self,
+                              name: str,
+                              hook: tuple,
+                              args: tuple[Any, ...],
+                              kwargs: dict[str, Any]) -> Any:
+        LOG.debug(f"running hook '{name}' ({hook[2]}) from {hook[2].__module__}")
+        with self.app._profile('hook', f"{name}: {hook[2].__module__}.{hook[1]}"):
+            res = hook[2](*args, **kwargs)
+            if inspect.isawaitable(res):
+                res = await res
+        return res
+
+    # D-09: hook results are user-arbitrary.
+    async def _expand_result(self, res: Any) -> AsyncGenerator:
+        # nested (async) generators yield each of their results
+        if isinstance(res, types.GeneratorType):
+            for _res in res:
+                yield _res
+        elif isinstance(res, types.AsyncGeneratorType):
+            async for _res in res:
+                yield _res
+        else:
+            yield res
@@ -3,6 +3,7 @@ Cement core interface module.
 """
 
 from abc import ABC
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from ..core import exc, meta
@@ -59,6 +60,7 @@ class InterfaceManager:
     def __init__(self, app: "App") -> None:
         self.app = app
         self.__interfaces__ = {}
+        self._lookups: Counter[str] = Counter()
 
     # D-09: fallback accepts user-arbitrary values per the public
     # contract (matches cache.get pattern; tests verify string
@@ -92,7 +94,8 @@ class InterfaceManager:
 
         """
 
-        if interface in self.__interfaces__.keys():
+        self._lookups['get'] += 1
+        if interface in self.__interfaces__:
             return self.__interfaces__[interface]
         elif fallback is not None:
             return fallback  # type: ignore[no-any-return]
@@ -113,6 +116,7 @@ class InterfaceManager:
                 app.interface.list()
 
         """
+        self._lookups['list'] += 1
         return list(self.__interfaces__.keys())
 
     def define(self, ibc: type[Interface]) -> None:
@@ -159,7 +163,16 @@ class InterfaceManager:
                 app.interface.defined('log')
 
         """
-        if interface in self.__interfaces__:
-            return True
-        else:
-            return False
+        self._lookups['defined'] += 1
+        return interface in self.__interfaces__
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the number of interface lookups performed, by method.
+
+        Returns:
+            dict: A dictionary with the keys ``get``, ``list``, and
+            ``defined``.
+
+        """
+        return {key: self._lookups[key] for key in ['get', 'list', 'defined']}
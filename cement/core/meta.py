@@ -1,6 +1,35 @@
 """Cement core meta functionality."""
 
 from typing import Any
+from weakref import WeakKeyDictionary
+
+# merged Meta defaults, per MetaMixin class
+_META_CACHE: "WeakKeyDictionary[type, dict[str, Any]]" = WeakKeyDictionary()
+
+
+def reset_meta_cache() -> None:
+    """
+    Clear the merged ``Meta`` defaults cached for every ``MetaMixin`` class.
+    The defaults are resolved once per class, on first instantiation, so
+    this must be called after modifying a ``Meta`` class attribute at
+    runtime for the change to be seen by new instances.
+
+    """
+    _META_CACHE.clear()
+
+
+def _get_meta_defaults(cls: type) -> dict[str, Any]:
+    defaults = _META_CACHE.get(cls)
+    if defaults is None:
+        # Get a List of all the Classes we in our MRO, find any attribute
+        # named Meta on them, and then merge them together in order of MRO
+        metas = reversed([x.Meta for x in cls.mro() if hasattr(x, "Meta")])
+        defaults = {}
+        for meta in metas:
+            defaults.update([x for x in meta.__dict__.items()
+                             if not x[0].startswith("_")])
+        _META_CACHE[cls] = defaults
+    return defaults
 
 
 class Meta:
@@ -20,8 +49,7 @@ class Meta:
 
     # D-09: same arbitrary-value contract as `__init__` above.
     def _merge(self, dict_obj: dict[str, Any]) -> None:
-        for key in dict_obj.keys():
-            setattr(self, key, dict_obj[key])
+        self.__dict__.update(dict_obj)
 
 
 class MetaMixin:
@@ -30,25 +58,25 @@ class MetaMixin:
     Mixin that provides the meta class support to add settings to instances
     of objects. Meta keys cannot start with a ``_``.
 
+    The ``Meta`` classes of the MRO are merged once per class and cached,
+    so only keyword arguments are applied per instance.  As a result,
+    modifying a ``Meta`` class attribute at runtime (i.e.
+    ``MyHandler.Meta.foo = 'bar'``) after the class (or a subclass) has
+    been instantiated is not seen by new instances until
+    :func:`reset_meta_cache` is called.  Prefer passing keyword arguments
+    (or ``App.Meta.meta_defaults``) to alter meta per instance.
+
     """
 
     # D-09: same Meta arbitrary-attribute contract — `*args` accepts any
     # positional cooperative-multi-inheritance super() chain payload.
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        # Get a List of all the Classes we in our MRO, find any attribute named
-        #     Meta on them, and then merge them together in order of MRO
-        metas = reversed([x.Meta for x in self.__class__.mro()
-                          if hasattr(x, "Meta")])
-        final_meta = {}
-
-        # Merge the Meta classes into one dict
-        for meta in metas:
-            final_meta.update(dict([x for x in meta.__dict__.items()
-                                    if not x[0].startswith("_")]))
+        final_meta = _get_meta_defaults(self.__class__)
 
         # Update the final Meta with any kwargs passed in
-        for key in final_meta.keys():
-            if key in kwargs:
+        if kwargs:
+            final_meta = final_meta.copy()
+            for key in kwargs.keys() & final_meta.keys():
                 final_meta[key] = kwargs.pop(key)
 
         self._meta = Meta(**final_meta)
@@ -1,6 +1,7 @@
 """Cement core output module."""
 
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from ..core.handler import Handler
@@ -9,6 +10,38 @@ from ..utils.misc import minimal_logger
 
 LOG = minimal_logger(__name__)
 
+#: Minimum size (in characters) of the chunks produced by ``buffer_chunks()``
+CHUNK_SIZE = 65536
+
+
+def buffer_chunks(chunks: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Join small pieces of rendered output (i.e. as produced by
+    ``json.JSONEncoder.iterencode()``) into chunks of at least ``size``
+    characters, for use by ``OutputHandler.render_iter()`` implementations.
+
+    Args:
+        chunks (iterable): The pieces of rendered output.
+
+    Keyword Args:
+        size (int): The minimum size of each chunk (except the last).
+
+    Yields:
+        str: The joined chunks.
+
+    """
+    buf: list[str] = []
+    length = 0
+    for chunk in chunks:
+        buf.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(buf)
+            buf = []
+            length = 0
+    if buf:
+        yield ''.join(buf)
+
 
 class OutputInterface(Interface):
 
@@ -54,3 +87,23 @@ class OutputHandler(OutputInterface, Handler):
 
     class Meta(Handler.Meta):
         pass  # pragma: nocover  # abstract method
+
+    # D-09: same user-arbitrary render data/passthrough contract as `render`.
+    def render_iter(self, data: dict[str, Any], *args: Any, **kwargs: Any) -> Iterator[str]:
+        """
+        Render the ``data`` dict into output, yielding it in chunks (used by
+        ``App.render(..., stream=True)``).  Handlers that can produce their
+        output incrementally should override this, by default the output of
+        ``self.render()`` is yielded as a single chunk.
+
+        Args:
+            data (dict): The dictionary whose data we need to render into
+                output.
+
+        Yields:
+            str: Chunks of the rendered output.
+
+        """
+        out_text = self.render(data, *args, **kwargs)
+        if out_text is not None:
+            yield out_text
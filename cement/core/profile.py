@@ -0,0 +1,115 @@
+"""Cement core profile module."""
+
+import json
+import sys
+from collections.abc import Generator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from ..utils.misc import minimal_logger
+
+if TYPE_CHECKING:
+    from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
+
+LOG = minimal_logger(__name__)
+
+
+class Profiler:
+    """
+    Records how long each phase of the application takes (handler setup,
+    extension and plugin loading, config file parsing, hook functions, etc),
+    and renders the results as a report sorted by duration.  Enabled via
+    ``App.Meta.profile`` or the ``CEMENT_PROFILE`` environment variable, and
+    accessible as ``app.profiler``.
+
+    """
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self._timings: list[tuple[str, str, float]] = []
+
+    @contextmanager
+    def timeit(self, category: str, label: str) -> Generator[None, None, None]:
+        """
+        Context manager that records the time spent within the block.
+
+        Args:
+            category (str): The type of item being timed (i.e. ``setup``,
+                ``extension``, ``plugin``, ``config``, ``hook``).
+            label (str): The identifier of the item being timed.
+
+        Example:
+
+            .. code-block:: python
+
+                with app.profiler.timeit('myapp', 'expensive_thing'):
+                    do_expensive_thing()
+
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._timings.append((category, label, perf_counter() - start))
+
+    # D-09: report rows are JSON-compatible dicts of mixed str/float values.
+    def report(self) -> list[dict[str, Any]]:
+        """
+        Return all recorded timings, sorted by duration (slowest first).
+
+        Returns:
+            list: A list of dictionaries with the keys ``category``,
+            ``label``, and ``duration`` (seconds).
+
+        """
+        rows = [dict(category=c, label=label, duration=d)
+                for c, label, d in self._timings]
+        return sorted(rows, key=lambda x: x['duration'], reverse=True)
+
+    def render_text(self) -> str:
+        """
+        Render the report as plain text, with durations in milliseconds.
+
+        Returns:
+            str: The text report.
+
+        """
+        lines = [
+            f"Cement Profile Report ({self.label})",
+            '-' * 78,
+            f"{'ms':>10}  {'category':<12}label",
+        ]
+        for row in self.report():
+            lines.append(
+                f"{row['duration'] * 1000:>10.3f}  {row['category']:<12}{row['label']}"
+            )
+        return '\n'.join(lines) + '\n'
+
+    def render_json(self) -> str:
+        """
+        Render the report as JSON.
+
+        Returns:
+            str: The JSON report.
+
+        """
+        return json.dumps(dict(label=self.label, timings=self.report()))
+
+
+def emit_report(app: "App") -> None:
+    """
+    This is a ``post_setup`` and ``pre_close`` hook that writes the profile
+    report as text to ``sys.stderr``, and as JSON to
+    ``App.Meta.profile_file`` if set.
+
+    Args:
+        app (instance): The application object.
+
+    """
+    sys.stderr.write(app.profiler.render_text())  # type: ignore
+
+    if app._meta.profile_file is not None:
+        LOG.debug(f"writing profile report to {app._meta.profile_file}")
+        with open(app._meta.profile_file, 'w') as f:
+            f.write(app.profiler.render_json())  # type: ignore
@@ -1,11 +1,13 @@
 """Cement core template module."""
 
+import filecmp
 import os
 import pkgutil
 import re
 import shutil
 import sys
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path as _Path
 from typing import Any
 
@@ -17,6 +19,8 @@ from ..utils.misc import minimal_logger
 
 LOG = minimal_logger(__name__)
 
+_MISSING = object()
+
 LoadTemplateReturnType = tuple[bytes | str | None, str | None]
 
 
@@ -114,6 +118,24 @@ class TemplateHandler(TemplateInterface, Handler):
         #: List of file patterns to ignore completely (not copy at all)
         ignore: list[str] = None  # type: ignore
 
+        #: Number of threads used by ``copy()`` to render and write files.
+        #: Files are rendered one after another if ``1``.
+        copy_workers = 1
+
+        #: Whether ``copy()`` should hard link excluded files (copied but not
+        #: rendered) rather than copying them, if possible.  Note that
+        #: changes to a hard linked file also change the source template.
+        hardlink_excluded = False
+
+        #: Whether to watch the ``template_dirs`` for changes (requires
+        #: ``watchdog``), invalidating cached templates when files change
+        #: rather than checking their modification time on every load.
+        watch_template_dirs = False
+
+        #: Reuse one instance per application, so that output handlers
+        #: share the template cache (and watchers) of ``app.template``.
+        scope = 'app'
+
     # D-09: handler-contract pluggable kwargs (super() chain feeds Meta).
     # Public TemplateHandler (D-12).
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -123,6 +145,66 @@ class TemplateHandler(TemplateInterface, Handler):
         if self._meta.exclude is None:
             self._meta.exclude = []
 
+        # template path -> resolved file path (or None if it does not exist)
+        # for the template dirs in `_index_dirs`, only used while watching
+        # all of them (otherwise a template may be created in a higher
+        # precedence dir at any time)
+        self._index: dict[str, str | None] = {}
+        self._index_dirs: tuple[str, ...] | None = None
+        # file path -> ((size, mtime), content)
+        self._file_cache: dict[str, tuple[tuple[int, int], str]] = {}
+        # (template module, template path) -> (content, module path)
+        self._module_cache: dict[tuple[str, str], LoadTemplateReturnType] = {}
+        # D-09: watchdog Observer (optional dependency, imported on use)
+        self._observer: Any = None
+        self._watching_all = False
+
+    def _teardown(self) -> None:
+        self._unwatch()
+
+    def _reset_index(self) -> None:
+        self._index_dirs = tuple(self.app._meta.template_dirs)
+        self._index.clear()
+        if self._meta.watch_template_dirs is True:
+            self._watch(self._index_dirs)
+
+    def _clear_cache(self) -> None:
+        self._index.clear()
+        self._file_cache.clear()
+
+    def _watch(self, template_dirs: tuple[str, ...]) -> None:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        handler = self
+
+        class EventHandler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                # reading templates must not invalidate them
+                if event.event_type not in ['opened', 'closed_no_write']:
+                    handler._clear_cache()
+
+        self._unwatch()
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._watching_all = True
+        for template_dir in template_dirs:
+            if _Path(template_dir).is_dir():
+                LOG.debug(f"watching template directory {template_dir}")
+                self._observer.schedule(EventHandler(), template_dir, recursive=True)
+            else:
+                self._watching_all = False
+        self._observer.start()
+
+        # anything cached before the observer started might be stale
+        self._file_cache.clear()
+
+    def _unwatch(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
     # D-09: same user-arbitrary template-data contract as the abstract
     # `render` above (this is the concrete-handler-side declaration).
     def render(self, content: str | bytes, data: dict[str, Any]) -> str | None:
@@ -140,7 +222,7 @@ class TemplateHandler(TemplateInterface, Handler):
         # must be provided by a subclass
         raise NotImplementedError  # pragma: nocover  # abstract method
 
-    def _match_patterns(self, item: str, patterns: list[str]) -> bool:
+    def _match_patterns(self, item: str, patterns: list[str] | list[re.Pattern[str]]) -> bool:
         for pattern in patterns:
             if re.match(pattern, item):
                 return True
@@ -190,8 +272,12 @@ class TemplateHandler(TemplateInterface, Handler):
             exclude = []
         if ignore is None:
             ignore = []
-        ignore_patterns = self._meta.ignore + ignore
-        exclude_patterns = self._meta.exclude + exclude
+        ignore_patterns = [re.compile(p) for p in self._meta.ignore + ignore]
+        exclude_patterns = [re.compile(p) for p in self._meta.exclude + exclude]
+
+        # (source file, destination file, render as template) for every file
+        # to copy, rendered/copied after walking the source tree
+        files_to_copy: list[tuple[str, str, bool]] = []
 
         if not _Path(src).is_dir():
             raise NotADirectoryError(
@@ -306,47 +392,162 @@ class TemplateHandler(TemplateInterface, Handler):
                     continue
 
                 elif self._match_patterns(_file, exclude_patterns):
-                    LOG.debug(
-                        'not rendering excluded file: ' +
-                        f'{_file}')
-                    shutil.copy(_file, _file_dest)
+                    files_to_copy.append((_file, _file_dest, False))
 
                 else:
-                    LOG.debug(f'rendering file as template: {_file}')
-                    f = open(_file)
-                    content = f.read()
-                    f.close()
+                    files_to_copy.append((_file, _file_dest, True))
 
-                    _file_content = self.render(content, data)
-                    f = open(_file_dest, 'w')
-                    f.write(_file_content)  # type: ignore
-                    f.close()
+        def copy_file(item: tuple[str, str, bool]) -> None:
+            _file, _file_dest, render = item
+            if render is True:
+                LOG.debug(f'rendering file as template: {_file}')
+                self._copy_rendered_file(_file, _file_dest, data)
+            else:
+                LOG.debug(f'not rendering excluded file: {_file}')
+                self._copy_file(_file, _file_dest)
+
+        workers = int(self._meta.copy_workers or 1)
+        if workers > 1 and len(files_to_copy) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # consume the results to raise any exceptions
+                for _res in executor.map(copy_file, files_to_copy):
+                    pass
+        else:
+            for item in files_to_copy:
+                copy_file(item)
 
         return True
 
+    # D-09: same user-arbitrary template-data contract as `render` above.
+    def _copy_rendered_file(self, src: str, dest: str, data: dict[str, Any]) -> None:
+        with open(src) as f:
+            content = f.read()
+        rendered = self.render(content, data)
+
+        # leave destination files that already have the rendered content
+        # untouched
+        try:
+            if os.stat(dest).st_size == len(rendered.encode()):  # type: ignore
+                with open(dest) as f:
+                    if f.read() == rendered:
+                        LOG.debug(f'destination file is up to date: {dest}')
+                        return
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        with open(dest, 'w') as f:
+            f.write(rendered)  # type: ignore
+
+    def _copy_file(self, src: str, dest: str) -> None:
+        dest_path = _Path(dest)
+        if dest_path.exists():
+            if os.path.samefile(src, dest):
+                return
+            elif filecmp.cmp(src, dest, shallow=False):
+                LOG.debug(f'destination file is up to date: {dest}')
+                return
+
+        if self._meta.hardlink_excluded is True:
+            try:
+                dest_path.unlink(missing_ok=True)
+                os.link(src, dest)
+                return
+            except OSError as e:
+                LOG.debug(f'unable to hard link {src} -> {dest}: {e}')
+
+        if hasattr(os, 'copy_file_range'):
+            # let the kernel copy the data (or share it on copy-on-write
+            # filesystems) rather than reading it into python
+            try:
+                with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                if remaining == 0:
+                    shutil.copymode(src, dest)
+                    return
+            except OSError as e:
+                LOG.debug(f'unable to copy {src} -> {dest} with copy_file_range: {e}')
+
+        shutil.copy(src, dest)
+
+    def _read_template_file(self, path: str) -> str | None:
+        cached = self._file_cache.get(path)
+        if cached is not None and self._observer is not None:
+            return cached[1]
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (st.st_size, st.st_mtime_ns)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(path) as f:
+            content = f.read()
+        self._file_cache[path] = (key, content)
+        return content
+
     def _load_template_from_file(self,
                                  template_path: str) -> LoadTemplateReturnType:
-        for template_dir in self.app._meta.template_dirs:
+        if self._index_dirs != tuple(self.app._meta.template_dirs):
+            self._reset_index()
+
+        template_path = template_path.lstrip('/')
+        indexed = self._observer is not None and self._watching_all is True
+        if indexed:
+            # the index may be cleared by the watcher thread at any time
+            cached = self._index.get(template_path, _MISSING)
+            if cached is None:
+                return (None, None)
+            elif isinstance(cached, str):
+                content = self._read_template_file(cached)
+                if content is not None:
+                    return (content, cached)
+                # removed since it was indexed
+                self._index.pop(template_path, None)
+
+        for template_dir in self._index_dirs:  # type: ignore
             template_prefix = template_dir.rstrip('/')
-            template_path = template_path.lstrip('/')
             full_path = fs.abspath(str(_Path(template_prefix) /
                                        template_path))
             LOG.debug(
                 f"attemping to load output template from file {full_path}")
-            if _Path(full_path).exists():
-                content = open(full_path).read()
+            content = self._read_template_file(full_path)
+            if content is not None:
                 LOG.debug(f"loaded output template from file {full_path}")
+                if indexed:
+                    self._index[template_path] = full_path
                 return (content, full_path)
             else:
                 LOG.debug(f"output template file {full_path} does not exist")
                 continue
 
+        if indexed:
+            self._index[template_path] = None
         return (None, None)
 
     def _load_template_from_module(self,
                                    template_path: str) -> LoadTemplateReturnType:
         template_module = self.app._meta.template_module
+        if template_module is None:
+            return (None, None)
         template_path = template_path.lstrip('/')
+        cache_key = (template_module, template_path)
+        if cache_key in self._module_cache:
+            return self._module_cache[cache_key]
+
+        res = self._find_template_in_module(template_module, template_path)
+        self._module_cache[cache_key] = res
+        return res
+
+    def _find_template_in_module(self,
+                                 template_module: str,
+                                 template_path: str) -> LoadTemplateReturnType:
         full_module_path = f"{template_module}.{re.sub('/', '.', template_path)}"
 
         LOG.debug(
@@ -357,14 +558,14 @@ class TemplateHandler(TemplateInterface, Handler):
         # see if the module exists first
         if template_module not in sys.modules:
             try:
-                __import__(template_module, globals(), locals(), [], 0)  # type: ignore
+                __import__(template_module, globals(), locals(), [], 0)
             except ImportError:
                 LOG.debug(f"unable to import template module '{template_module}'.")
                 return (None, None)
 
         # get the template content
         try:
-            content = pkgutil.get_data(template_module, template_path)  # type: ignore
+            content = pkgutil.get_data(template_module, template_path)
             LOG.debug(f"loaded output template '{template_path}' from module {template_module}")
             return (content, full_module_path)
         except OSError:
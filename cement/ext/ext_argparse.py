@@ -6,6 +6,7 @@ import re
 from argparse import SUPPRESS, ArgumentParser, RawDescriptionHelpFormatter
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from ..core.arg import ArgumentHandler
@@ -21,7 +22,6 @@ if TYPE_CHECKING:
 
 LOG = minimal_logger(__name__)
 
-
 def _clean_label(label: str) -> str:
     return re.sub('_', '-', label)
 
@@ -105,6 +105,55 @@ class ArgparseArgumentHandler(ArgumentParser, ArgumentHandler):
         super().add_argument(*args, **kw)
 
 
+class _LazyArgumentParser:
+
+    """
+    Stand-in for a sub-parser when ``ArgparseController.Meta.lazy_parsers``
+    is enabled.  Calls to ``add_argument()`` and attribute assignments are
+    recorded, and the real parser is only built (replaying the recorded
+    calls) the first time anything else is accessed on it, which in practice
+    is when argparse selects it from the command line or when help is
+    printed for it.
+    """
+
+    # D-09: `parser_class` is the app's argument handler class (an
+    # ArgumentParser subclass, but typed as the abstract ArgumentHandler).
+    def __init__(self, parser_class: Callable[..., Any], **kw: Any) -> None:
+        object.__setattr__(self, '_lazy_parser_class', parser_class)
+        object.__setattr__(self, '_lazy_kwargs', kw)
+        object.__setattr__(self, '_lazy_calls', [])
+        object.__setattr__(self, '_lazy_parser', None)
+
+    def _materialize(self) -> ArgumentParser:
+        if self._lazy_parser is None:
+            parser = self._lazy_parser_class(**self._lazy_kwargs)
+            for name, args, kw in self._lazy_calls:
+                if name == 'setattr':
+                    setattr(parser, *args)
+                else:
+                    parser.add_argument(*args, **kw)
+            object.__setattr__(self, '_lazy_parser', parser)
+            object.__setattr__(self, '_lazy_calls', [])
+        return self._lazy_parser  # type: ignore
+
+    def add_argument(self, *args: Any, **kw: Any) -> None:
+        if self._lazy_parser is None:
+            self._lazy_calls.append(('add_argument', args, kw))
+        else:
+            self._lazy_parser.add_argument(*args, **kw)
+
+    # D-09: transparent proxy to the wrapped ArgumentParser; attribute
+    # values are whatever argparse exposes.
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._lazy_parser is None:
+            self._lazy_calls.append(('setattr', (name, value), {}))
+        else:
+            setattr(self._lazy_parser, name, value)
+
+
 @dataclass
 class CommandMeta:
     label: str
@@ -189,6 +238,27 @@ class expose:  # noqa: N801 - public decorator (used as @expose); renaming break
 ex = expose
 
 
+def _index_commands(cls: type) -> "tuple[tuple[str, CommandMeta], ...]":
+    """
+    Build the ordered (by member name, same as ``dir()``) index of
+    ``(func_name, CommandMeta)`` for every exposed command of ``cls``.  Only
+    class ``__dict__`` entries are inspected (honoring the MRO, so an
+    un-exposed override hides an exposed parent function), which means no
+    descriptors such as properties are evaluated.
+    """
+    members: dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        members.update(vars(klass))
+
+    commands = []
+    for name in sorted(members):
+        member = getattr(members[name], '__func__', members[name])
+        meta = getattr(member, '__cement_meta__', None)
+        if meta is not None:
+            commands.append((name, meta))
+    return tuple(commands)
+
+
 class ArgparseController(ControllerHandler):
 
     """
@@ -331,6 +401,25 @@ class ArgparseController(ControllerHandler):
         #: exception ``error: too few arguments``.
         default_func: str = '_default'
 
+        #: Whether to defer building command sub-parsers until argparse
+        #: actually selects them from the command line (or help is displayed
+        #: for them).  The parsers of nested controllers are still built
+        #: during setup, as sub-commands are attached to them.  Can greatly
+        #: reduce startup time for applications with a large number of
+        #: commands, however errors in command argument definitions (such as
+        #: duplicate arguments) will only surface when the affected
+        #: sub-parser is built.  Only honored on the ``base`` controller.
+        lazy_parsers: bool = False
+
+    #: Ordered, immutable index of ``(func_name, CommandMeta)`` for all
+    #: exposed commands, built once when the controller class is defined.
+    #: Functions exposed on the class after it is defined are not included.
+    __cement_commands__: "tuple[tuple[str, CommandMeta], ...]" = ()
+
+    def __init_subclass__(cls, **kw: Any) -> None:
+        super().__init_subclass__(**kw)
+        cls.__cement_commands__ = _index_commands(cls)
+
     def __init__(self, *args: Any, **kw: Any) -> None:
         super().__init__(*args, **kw)
         self.app: App = None  # type: ignore
@@ -538,6 +627,10 @@ class ArgparseController(ControllerHandler):
 
         kwargs['dest'] = 'command'
 
+        if self._meta.lazy_parsers is True and 'parser_class' not in kwargs.keys():
+            kwargs['parser_class'] = partial(_LazyArgumentParser,
+                                             type(self.app.args))
+
         return kwargs
 
     def _get_parser_options(self, contr: "ArgparseController") -> dict[str, Any]:
@@ -774,13 +867,11 @@ class ArgparseController(ControllerHandler):
         )
 
         commands = []
-        for member in dir(self.__class__):
-            if member.startswith('_'):
+        for func_name, func in self.__cement_commands__:
+            if func_name.startswith('_'):
                 continue
-            elif hasattr(getattr(self, member), '__cement_meta__'):
-                func: CommandMeta = getattr(self.__class__, member).__cement_meta__
-                func.controller = self
-                commands.append(func)
+            func.controller = self
+            commands.append(func)
 
         return commands
 
@@ -792,13 +883,7 @@ class ArgparseController(ControllerHandler):
 
             exposed_commands (list): List of exposed commands (labels)
         """
-        # get exposed commands
-        exposed = []
-        for member_key in dir(self):
-            member = getattr(self, member_key)
-            if hasattr(member, '__cement_meta__'):
-                exposed.append(_clean_label(member_key))
-        return exposed
+        return [_clean_label(func_name) for func_name, _ in self.__cement_commands__]
 
     def _pre_argument_parsing(self) -> None:
         """
@@ -920,6 +1005,8 @@ class ArgparseController(ControllerHandler):
         if func_name is None:
             pass    # pragma: nocover  # defensive: unreachable
         elif hasattr(contr, func_name):
+            # coroutine functions (``async def`` commands) return their
+            # coroutine, which is awaited by ``App.run()``/``App.run_async()``
             func = getattr(contr, func_name)
             return func()
         else:
@@ -4,17 +4,26 @@ Cement configparser extension module.
 
 import os
 import re
-from configparser import RawConfigParser
+from collections.abc import Callable, Mapping
+from configparser import NoOptionError, NoSectionError, RawConfigParser
 from typing import TYPE_CHECKING, Any
 
 from ..core import config
-from ..utils.misc import minimal_logger
+from ..utils.misc import is_true, minimal_logger
 
 if TYPE_CHECKING:
     from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
 
 LOG = minimal_logger(__name__)
 
+_UNSET = object()
+
+
+def _to_list(value: Any) -> list[Any]:
+    if isinstance(value, str):
+        return [x.strip() for x in value.split(',') if x.strip()]
+    return list(value)
+
 
 class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
 
@@ -28,6 +37,13 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
 
     Additional arguments and keyword arguments are passed directly to
     RawConfigParser on initialization.
+
+    Lookups are served from a snapshot of all sections/keys (and their
+    environment variable override names) that is updated in place by
+    ``set()`` and ``remove_option()``, and only rebuilt after
+    ``add_section()``, ``remove_section()``, modifying the default section,
+    or when files are read.  The ``get_int()``, ``get_bool()``, and
+    ``get_list()`` accessors additionally cache the coerced value.
     """
     class Meta(config.ConfigHandler.Meta):
 
@@ -36,6 +52,73 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         label = 'configparser'
         """The string identifier of this handler."""
 
+        cache_env: bool = False
+        """
+        Whether to read environment variable overrides from a map of the
+        application's environment variables (i.e. ``MYAPP_*``) that is built
+        once, rather than checking ``os.environ`` on every lookup.  If
+        enabled, ``refresh_env()`` must be called after modifying the
+        environment at runtime.
+        """
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        # section -> key -> (env var name, raw value)
+        self._snapshot: dict[str, dict[str, tuple[str, Any]]] | None = None
+        # (section, key, kind) -> (raw value, converted value)
+        self._typed: dict[tuple[str, str, str], tuple[Any, Any]] = {}
+        self._env: dict[str, str] | None = None
+
+    def _invalidate(self) -> None:
+        self._snapshot = None
+        self._typed = {}
+
+    def _update(self, section: str, key: str) -> None:
+        # update a single key of the snapshot in place
+        for kind in ['int', 'bool', 'list']:
+            self._typed.pop((section, key, kind), None)
+        if self._snapshot is None:
+            return
+        elif section not in self._snapshot:
+            # i.e. the default section, which applies to all sections
+            self._invalidate()
+            return
+
+        items = self._snapshot[section]
+        if RawConfigParser.has_option(self, section, key):
+            items[self.optionxform(key)] = (self._get_env_var(section, key),
+                                            RawConfigParser.get(self, section, key))
+        else:
+            items.pop(self.optionxform(key), None)
+
+    def _get_snapshot(self) -> dict[str, dict[str, tuple[str, Any]]]:
+        if self._snapshot is None:
+            self._snapshot = {
+                section: {
+                    key: (self._get_env_var(section, key),
+                          RawConfigParser.get(self, section, key))
+                    for key in self.options(section)
+                } for section in self.sections()
+            }
+        return self._snapshot
+
+    def _get_env_map(self) -> Mapping[str, str]:
+        if self._meta.cache_env is not True:
+            return os.environ
+        elif self._env is None:
+            self.refresh_env()
+        return self._env  # type: ignore[return-value]
+
+    def refresh_env(self) -> None:
+        """
+        Rebuild the map of environment variable overrides used when
+        ``Meta.cache_env`` is enabled.
+
+        """
+        prefix = re.sub('[^0-9a-zA-Z_]+', '_', f'{self.app._meta.config_section}_'.upper())
+        self._env = {k: v for k, v in os.environ.items() if k.startswith(prefix)}
+        self._typed = {}
+
     def merge(self, dict_obj: dict, override: bool = True) -> None:
         """
         Merge a dictionary into our config.  If override is True then
@@ -54,15 +137,19 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
 
         for section in list(dict_obj.keys()):
             if type(dict_obj[section]) is dict:
-                if section not in self.get_sections():
-                    self.add_section(section)
+                if section == self.default_section:
+                    keys = list(self.defaults())
+                else:
+                    if section not in self.get_sections():
+                        self.add_section(section)
+                    keys = self.keys(section)
 
                 for key in list(dict_obj[section].keys()):
                     if override:
                         self.set(section, key, dict_obj[section][key])
                     else:
                         # only set it if the key doesn't exist
-                        if key not in self.keys(section):
+                        if key not in keys:
                             self.set(section, key, dict_obj[section][key])
 
                 # we don't support nested config blocks, so no need to go
@@ -105,10 +192,24 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         Returns:
             dict: A dictionary of the entire config.
         """
-        _config = {}
-        for section in self.get_sections():
-            _config[section] = self.get_section_dict(section)
-        return _config
+        env = self._get_env_map()
+        return {
+            section: {key: env[var] if var in env else value
+                      for key, (var, value) in items.items()}
+            for section, items in self._get_snapshot().items()
+        }
+
+    def _get_parsed_dict(self) -> dict[str, Any]:
+        # raw values, keeping the default section separate rather than
+        # copying its keys into every section
+        defaults = self.defaults()
+        res: dict[str, Any] = {}
+        if defaults:
+            res[self.default_section] = dict(defaults)
+        for section, items in self._get_snapshot().items():
+            res[section] = {key: value for key, (_var, value) in items.items()
+                            if key not in defaults or defaults[key] != value}
+        return res
 
     def get_sections(self) -> list[str]:
         """
@@ -131,10 +232,13 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
             dict: Dictionary reprisentation of the config section.
 
         """
-        dict_obj = dict()
-        for key in self.keys(section):
-            dict_obj[key] = self.get(section, key)
-        return dict_obj
+        env = self._get_env_map()
+        items = self._get_snapshot().get(section)
+        if items is None:
+            # raise the same error as RawConfigParser
+            self.options(section)
+        return {key: env[var] if var in env else value
+                for key, (var, value) in items.items()}  # type: ignore[union-attr]
 
     def add_section(self, section: str) -> None:
         """
@@ -144,7 +248,39 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
             section (str): The section to add.
 
         """
-        return RawConfigParser.add_section(self, section)
+        RawConfigParser.add_section(self, section)
+        self._invalidate()
+
+    def remove_section(self, section: str) -> bool:
+        """
+        Removes a block section from the config.
+
+        Args:
+            section (str): The section to remove.
+
+        Returns:
+            bool: ``True`` if the section existed, ``False`` otherwise.
+
+        """
+        res = RawConfigParser.remove_section(self, section)
+        self._invalidate()
+        return res
+
+    def remove_option(self, section: str, key: str) -> bool:
+        """
+        Removes ``key`` from ``section``.
+
+        Args:
+            section (str): The section that the key exists.
+            key (str): The key of the configuration item.
+
+        Returns:
+            bool: ``True`` if the key existed, ``False`` otherwise.
+
+        """
+        res = RawConfigParser.remove_option(self, section, key)
+        self._update(section, key)
+        return res
 
     def _get_env_var(self, section: str, key: str) -> str:
         if section == self.app._meta.config_section:
@@ -156,6 +292,89 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         env_var = re.sub('[^0-9a-zA-Z_]+', '_', env_var)
         return env_var
 
+    # D-09: coerced config values are user-arbitrary, as with `get()`.
+    def _get_typed(self,
+                   section: str,
+                   key: str,
+                   kind: str,
+                   func: Callable[[Any], Any],
+                   fallback: Any) -> Any:
+        try:
+            value = self.get(section, key)
+        except (NoSectionError, NoOptionError):
+            if fallback is _UNSET:
+                raise
+            return fallback
+
+        cache_key = (section, key, kind)
+        cached = self._typed.get(cache_key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        res = func(value)
+        self._typed[cache_key] = (value, res)
+        return res
+
+    def get_int(self, section: str, key: str, fallback: Any = _UNSET) -> int:
+        """
+        Get a config value converted to an ``int``.  The converted value is
+        cached until the underlying value changes.
+
+        Args:
+            section (str): The section that the key exists.
+            key (str): The key of the configuration item.
+
+        Keyword Args:
+            fallback: Returned if the section or key does not exist (raises
+                ``NoSectionError``/``NoOptionError`` if not given).
+
+        Returns:
+            int: The value of the key.
+
+        """
+        return self._get_typed(section, key, 'int', int, fallback)  # type: ignore[no-any-return]
+
+    def get_bool(self, section: str, key: str, fallback: Any = _UNSET) -> bool:
+        """
+        Get a config value converted to a ``bool`` (see
+        :func:`cement.utils.misc.is_true`).  The converted value is cached
+        until the underlying value changes.
+
+        Args:
+            section (str): The section that the key exists.
+            key (str): The key of the configuration item.
+
+        Keyword Args:
+            fallback: Returned if the section or key does not exist (raises
+                ``NoSectionError``/``NoOptionError`` if not given).
+
+        Returns:
+            bool: The value of the key.
+
+        """
+        res = self._get_typed(section, key, 'bool', is_true, fallback)
+        return res  # type: ignore[no-any-return]
+
+    def get_list(self, section: str, key: str, fallback: Any = _UNSET) -> list[Any]:
+        """
+        Get a config value as a ``list``, splitting comma-separated strings
+        (empty items are dropped).  The converted value is cached until the
+        underlying value changes.
+
+        Args:
+            section (str): The section that the key exists.
+            key (str): The key of the configuration item.
+
+        Keyword Args:
+            fallback: Returned if the section or key does not exist (raises
+                ``NoSectionError``/``NoOptionError`` if not given).
+
+        Returns:
+            list: The value of the key.
+
+        """
+        res = self._get_typed(section, key, 'list', _to_list, fallback)
+        return list(res) if isinstance(res, list) else res
+
     def get(self, section: str, key: str, **kwargs: Any) -> str:  # type: ignore
         """
         Get a config value for a given ``section``, and ``key``.
@@ -170,10 +389,19 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         Returns:
             value (unknown): Returns the value of the key in the configuration section.
         """
+        if not kwargs:
+            items = self._get_snapshot().get(section)
+            if items is not None:
+                item = items.get(self.optionxform(key))
+                if item is not None:
+                    env = self._get_env_map()
+                    return env[item[0]] if item[0] in env else item[1]
+
         env_var = self._get_env_var(section, key)
+        env = self._get_env_map()
 
-        if env_var in os.environ.keys():
-            return os.environ[env_var]
+        if env_var in env:
+            return env[env_var]
         else:
             return RawConfigParser.get(self, section, key, **kwargs)
 
@@ -201,6 +429,28 @@ class ConfigParserConfigHandler(config.ConfigHandler, RawConfigParser):
         Returns: None
         """
         RawConfigParser.set(self, section, key, value)
+        self._update(section, key)
+
+    def read(self, *args: Any, **kw: Any) -> list[str]:
+        """
+        Read and parse configuration files (see ``RawConfigParser.read()``).
+
+        Returns:
+            list: List of files that were successfully read.
+
+        """
+        res = RawConfigParser.read(self, *args, **kw)
+        self._invalidate()
+        return res
+
+    def read_file(self, *args: Any, **kw: Any) -> None:
+        """
+        Read and parse configuration data from a file-like object (see
+        ``RawConfigParser.read_file()``).
+
+        """
+        RawConfigParser.read_file(self, *args, **kw)
+        self._invalidate()
 
 
 def load(app: "App") -> None:
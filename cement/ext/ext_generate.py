@@ -6,12 +6,12 @@ import inspect
 import os
 import re
 import shutil
-from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import yaml  # type: ignore
 
 from .. import Controller, minimal_logger, shell
+from ..ext.ext_yaml import yaml_loader
 from ..utils.version import VERSION, get_version
 
 if TYPE_CHECKING:
@@ -40,8 +40,7 @@ class GenerateTemplateAbstractBase(Controller):
         data['cement']['major_minor_version'] = maj_min
 
         f = open(os.path.join(source, '.generate.yml'))
-        yaml_load: Callable = yaml.full_load if hasattr(yaml, 'full_load') else yaml.load
-        g_config = yaml_load(f)
+        g_config = yaml.load(f, Loader=yaml_loader())
         f.close()
 
         # Use `or []` (not the .get default) so explicit `key: null` in the
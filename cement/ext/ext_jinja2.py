@@ -11,12 +11,25 @@ extensions.
   dependencies.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, PackageLoader
-
-from ..core.output import OutputHandler
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    PackageLoader,
+    Template,
+)
+
+from ..core import exc
+from ..core.output import OutputHandler, buffer_chunks
 from ..core.template import TemplateHandler
+from ..utils import fs
 from ..utils.misc import minimal_logger
 
 if TYPE_CHECKING:
@@ -76,6 +89,31 @@ class Jinja2OutputHandler(OutputHandler):
         content, _type, _path = self.templater.load(template)
         return self.templater.render(content, data)  # type: ignore
 
+    def render_iter(self, data: dict[str, Any],
+                    template: str | None = None, **kw: Any) -> Iterator[str]:
+        """
+        Take a data dictionary and render it using the given template file,
+        yielding the output in chunks as it is generated by
+        ``jinja2.Template.generate()``.  Additional keyword arguments are
+        ignored.
+
+        Args:
+            data (dict): The data dictionary to render.
+
+        Keyword Args:
+            template (str): The path to the template, after the
+                ``template_module`` or ``template_dirs`` prefix as defined in
+                the application.
+
+        Yields:
+            str: Chunks of the rendered template text
+
+        """
+
+        LOG.debug(f"rendering content using '{template}' as a template (streaming).")
+        tmpl = self.templater.get_template(template)
+        yield from buffer_chunks(tmpl.generate(**data))
+
 
 class Jinja2TemplateHandler(TemplateHandler):
 
@@ -86,6 +124,11 @@ class Jinja2TemplateHandler(TemplateHandler):
     `Jinja2 Templating Language <http://jinja.pocoo.org/>`_.  Please
     see the developer documentation on
     :cement:`Template Handling <dev/template>`.
+
+    Compiled templates are cached keyed by their content, which for
+    templates loaded by path (see :meth:`load` and :meth:`get_template`) is
+    itself cached until the template file is modified.  Compiled templates
+    can also be persisted to disk with ``Meta.bytecode_cache``.
     """
 
     class Meta(TemplateHandler.Meta):
@@ -94,12 +137,68 @@ class Jinja2TemplateHandler(TemplateHandler):
 
         label = 'jinja2'
 
+        #: Maximum number of compiled templates to keep in memory (for both
+        #: templates loaded by path and content passed to ``render()``).
+        cache_size = 400
+
+        #: Whether to persist compiled template bytecode to disk (in
+        #: ``bytecode_cache_dir``) so that templates do not need to be
+        #: compiled again by later invocations of the application.
+        bytecode_cache = False
+
+        #: Directory to store the bytecode cache in.  Defaults to
+        #: ``~/.<app_label>/cache/jinja2`` if not set.
+        bytecode_cache_dir: str = None  # type: ignore
+
+    _meta: Meta  # type: ignore
+
     def __init__(self, *args: Any, **kw: Any) -> None:
         super().__init__(*args, **kw)
 
         # expose Jinja2 Environment instance so that we can manipulate it
         # higher in application code if necessary
-        self.env = Environment(keep_trailing_newline=True)
+        self.env = Environment(keep_trailing_newline=True,
+                               cache_size=self._meta.cache_size)
+
+        # loaders are kept (and only replaced on the environment when the
+        # template dirs/module change) so that the environment's template
+        # cache, which is keyed by loader, is not discarded on every load
+        self._loaders: dict[tuple[str, Any], BaseLoader] = {}
+        self._compiled: OrderedDict[str, Template] = OrderedDict()
+        # render() may be called from multiple threads (i.e. by copy())
+        self._lock = threading.Lock()
+
+    def _setup(self, app: "App") -> None:
+        super()._setup(app)
+        if self._meta.bytecode_cache is True:
+            path = self._meta.bytecode_cache_dir
+            if path is None:
+                path = fs.join(fs.HOME_DIR, f'.{app._meta.label}', 'cache', 'jinja2')
+            path = fs.abspath(path)
+            fs.ensure_dir_exists(path)
+            LOG.debug(f"caching compiled jinja2 templates in '{path}'")
+            self.env.bytecode_cache = FileSystemBytecodeCache(path)
+
+    def _get_loader(self, template_type: str) -> BaseLoader:
+        loader: BaseLoader | None
+        if template_type == 'directory':
+            template_dirs = tuple(self.app._meta.template_dirs)
+            key: tuple[str, Any] = (template_type, template_dirs)
+            loader = self._loaders.get(key)
+            if loader is None:
+                loader = FileSystemLoader(template_dirs)
+        else:
+            template_module = self.app._meta.template_module
+            if template_module is None:
+                raise exc.FrameworkError('App.Meta.template_module is not set')
+            key = (template_type, template_module)
+            loader = self._loaders.get(key)
+            if loader is None:
+                parts = template_module.rsplit('.', 1)
+                loader = PackageLoader(parts[0], package_path=parts[1])
+
+        self._loaders[key] = loader
+        return loader
 
     def load(self, *args: Any, **kw: Any) -> tuple[str | bytes, str, str | None]:
         """
@@ -123,14 +222,65 @@ class Jinja2TemplateHandler(TemplateHandler):
         """
         content, _type, _path = super().load(*args, **kw)
 
-        if _type == 'directory':
-            self.env.loader = FileSystemLoader(self.app._meta.template_dirs)
-        elif _type == 'module':
-            parts = self.app._meta.template_module.rsplit('.', 1)  # type: ignore
-            self.env.loader = PackageLoader(parts[0], package_path=parts[1])
+        loader = self._get_loader(_type)
+        if self.env.loader is not loader:
+            self.env.loader = loader
 
         return content, _type, _path
 
+    def get_template(self, template_path: str) -> Template:
+        """
+        Loads a template (see :meth:`load`) and returns the compiled Jinja2
+        template, which is served from cache until the template file is
+        modified.  Note that rendering the returned template bypasses
+        :meth:`render`.
+
+        Args:
+            template_path (str): The secondary path of the template **after**
+                either ``template_module`` or ``template_dirs`` prefix (set via
+                ``App.Meta``)
+
+        Returns:
+            jinja2.Template: The compiled template.
+
+        Raises:
+            cement.core.exc.FrameworkError: If the template does not exist in
+                either the ``template_module`` or ``template_dirs``.
+        """
+        content, _type, _path = self.load(template_path)
+        return self._compile(content)
+
+    def _compile(self, content: str | bytes) -> Template:
+        if not isinstance(content, str):
+            content = content.decode('utf-8')
+
+        with self._lock:
+            tmpl = self._compiled.get(content)
+            if tmpl is not None:
+                self._compiled.move_to_end(content)
+                return tmpl
+
+        bcc = self.env.bytecode_cache
+        if bcc is None:
+            tmpl = self.env.from_string(content)
+        else:
+            # content addressed, as templates are compiled from their content
+            name = hashlib.sha1(content.encode('utf-8')).hexdigest()
+            bucket = bcc.get_bucket(self.env, name, None, content)
+            code = bucket.code
+            if code is None:
+                code = self.env.compile(content)
+                bucket.code = code
+                bcc.set_bucket(bucket)
+            tmpl = self.env.template_class.from_code(
+                self.env, code, self.env.make_globals(None), None)
+
+        with self._lock:
+            self._compiled[content] = tmpl
+            if len(self._compiled) > self._meta.cache_size:
+                self._compiled.popitem(last=False)
+        return tmpl
+
     def render(self,
                content: str | bytes,
                data: dict[str, Any],
@@ -148,11 +298,7 @@ class Jinja2TemplateHandler(TemplateHandler):
 
         """
         LOG.debug(f"rendering content as text via {self.__module__}")
-
-        if not isinstance(content, str):
-            content = content.decode('utf-8')
-
-        tmpl = self.env.from_string(content)
+        tmpl = self._compile(content)
         res = tmpl.render(**data)
         return res
 
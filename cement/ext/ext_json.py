@@ -2,6 +2,7 @@
 Cement json extension module.
 """
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 from ..core import output
@@ -14,6 +15,22 @@ if TYPE_CHECKING:
 LOG = minimal_logger(__name__)
 
 
+# D-09: any JSON backend module (`json`, `ujson`, `orjson`, ...).
+def is_bytes_native(json_module: Any) -> bool:
+    """
+    Return whether the ``dumps()`` function of a JSON backend module returns
+    ``bytes`` (i.e. ``orjson``) rather than ``str``.
+
+    Args:
+        json_module (module): The JSON backend module.
+
+    Returns:
+        bool
+
+    """
+    return isinstance(json_module.dumps({}), bytes)
+
+
 def suppress_output_before_run(app: "App") -> None:
     """
     This is a ``post_argument_parsing`` hook that suppresses console output if
@@ -67,6 +84,14 @@ class JsonOutputHandler(output.OutputHandler):
     library.  Please see the developer documentation on
     :cement:`Output Handling <dev/output>`.
 
+    Backends whose ``dumps()`` returns ``bytes`` (i.e. ``orjson``) are
+    supported, in which case ``app.render()`` writes the encoded output
+    directly to the binary buffer of ``out`` (i.e. ``sys.stdout.buffer``).
+    Both ``render()`` and ``app.render()`` still return ``str``, only
+    ``render_bytes()`` returns the encoded ``bytes``.  Additional keyword
+    arguments are passed to the backend as is (i.e.
+    ``option=orjson.OPT_INDENT_2``).
+
     This handler forces Cement to suppress console output until
     ``app.render`` is called (keeping the output pure JSON).  If
     troubleshooting issues, you will need to pass the ``--debug`` option in
@@ -84,19 +109,29 @@ class JsonOutputHandler(output.OutputHandler):
         #: to override the ``output_handler`` via command line options.
         overridable = False
 
-        #: Backend JSON library module to use (`json`, `ujson`)
+        #: Backend JSON library module to use (`json`, `ujson`, `orjson`)
         json_module = 'json'
 
+        #: Reuse one instance per application (i.e. for repeated
+        #: ``app.render(data, handler='json')`` calls).
+        scope = 'app'
+
     _meta: Meta  # type: ignore
 
     def __init__(self, *args: Any, **kw: Any) -> None:
         super().__init__(*args, **kw)
         self._json = None
 
+        # whether the backend dumps() returns bytes rather than str, in which
+        # case App.render() writes the output of render_bytes() directly to
+        # the binary buffer of `out`
+        self.bytes_native = False
+
     def _setup(self, app: "App") -> None:
         super()._setup(app)
         self._json = __import__(self._meta.json_module,         # type: ignore
                                 globals(), locals(), [], 0)
+        self.bytes_native = is_bytes_native(self._json)
 
     def render(self, data: dict[str, Any], template: str = None, **kw: Any) -> str:  # type: ignore
         """
@@ -116,8 +151,61 @@ class JsonOutputHandler(output.OutputHandler):
 
         """
         LOG.debug(f"rendering output as Json via {self.__module__}")
+        if self.bytes_native is True:
+            return self._json.dumps(data, **kw).decode('utf-8')  # type: ignore
         return self._json.dumps(data, **kw)  # type: ignore
 
+    def render_bytes(self, data: dict[str, Any], template: str = None,  # type: ignore
+                     **kw: Any) -> bytes:
+        """
+        Take a data dictionary and render it as UTF-8 encoded Json output,
+        without decoding the output of bytes native backends (i.e.
+        ``orjson``).  Additional keyword arguments passed to
+        ``json.dumps()``.
+
+        Args:
+            data (dict): The data dictionary to render.
+
+        Keyword Args:
+            template: This option is completely ignored.
+
+        Returns:
+            bytes: A JSON encoded byte string.
+
+        """
+        LOG.debug(f"rendering output as Json bytes via {self.__module__}")
+        if self.bytes_native is True:
+            return self._json.dumps(data, **kw)  # type: ignore
+        return self._json.dumps(data, **kw).encode('utf-8')  # type: ignore
+
+    def render_iter(self, data: dict[str, Any],
+                    template: str | None = None, **kw: Any) -> Iterator[str]:
+        """
+        Take a data dictionary and render it as Json output, yielding the
+        encoded output in chunks as it is produced by
+        ``json.JSONEncoder.iterencode()``.  Backends without a
+        ``JSONEncoder`` (i.e. ``ujson``) yield the output of ``render()`` as
+        a single chunk.  Additional keyword arguments are handled the same
+        as ``json.dumps()``.
+
+        Args:
+            data (dict): The data dictionary to render.
+
+        Keyword Args:
+            template: This option is completely ignored.
+
+        Yields:
+            str: Chunks of the JSON encoded string.
+
+        """
+        if not hasattr(self._json, 'JSONEncoder'):
+            yield from super().render_iter(data, template=template, **kw)
+            return
+
+        LOG.debug(f"rendering output as Json via {self.__module__} (streaming)")
+        cls = kw.pop('cls', None) or self._json.JSONEncoder
+        yield from output.buffer_chunks(cls(**kw).iterencode(data))
+
 
 class JsonConfigHandler(ConfigParserConfigHandler):
 
@@ -134,7 +222,7 @@ class JsonConfigHandler(ConfigParserConfigHandler):
 
         label = 'json'
 
-        #: Backend JSON library module to use (`json`, `ujson`).
+        #: Backend JSON library module to use (`json`, `ujson`, `orjson`).
         json_module = 'json'
 
     _meta: Meta  # type: ignore
@@ -142,11 +230,13 @@ class JsonConfigHandler(ConfigParserConfigHandler):
     def __init__(self, *args: Any, **kw: Any) -> None:
         super().__init__(*args, **kw)
         self._json = None
+        self._bytes_native = False
 
     def _setup(self, app: "App") -> None:
         super()._setup(app)
         self._json = __import__(self._meta.json_module,         # type: ignore
                                 globals(), locals(), [], 0)
+        self._bytes_native = is_bytes_native(self._json)
 
     def _parse_file(self, file_path: str) -> bool:
         """
@@ -161,7 +251,9 @@ class JsonConfigHandler(ConfigParserConfigHandler):
             bool
 
         """
-        with open(file_path) as f:
+        # bytes native backends parse the raw (UTF-8) content directly
+        mode = 'rb' if self._bytes_native is True else 'r'
+        with open(file_path, mode) as f:
             content = f.read()
             if content is not None and len(content) > 0:
                 self.merge(self._json.loads(content))
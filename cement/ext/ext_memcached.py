@@ -30,6 +30,10 @@ class MemcachedCacheHandler(cache.CacheHandler):
     This class implements the :ref:`Cache <cement.core.cache>` Handler
     interface.  It provides a caching interface using the
     `pylibmc <http://sendapatch.se/projects/pylibmc/>`_ library.
+
+    Values are pickled by ``pylibmc`` unless a ``serializer`` (``raw``,
+    ``json``, ``pickle``, or ``msgpack``) is configured.  See
+    :class:`cement.core.cache.CacheSerializer`.
     """
 
     class Meta(cache.CacheHandler.Meta):
@@ -40,6 +44,9 @@ class MemcachedCacheHandler(cache.CacheHandler):
         config_defaults = dict(
             hosts=['127.0.0.1'],
             expire_time=0,
+            serializer=None,
+            compression=None,
+            compress_threshold=1024,
         )
 
     _meta: Meta  # type: ignore
@@ -97,7 +104,7 @@ class MemcachedCacheHandler(cache.CacheHandler):
         if res is None:
             return fallback
         else:
-            return res
+            return self._loads(res)
 
     def _config(self, key: str) -> Any:
         """
@@ -133,7 +140,49 @@ class MemcachedCacheHandler(cache.CacheHandler):
         if time is None:
             time = int(self._config('expire_time'))
 
-        self.mc.set(key, value, time=time, **kw)
+        self.mc.set(key, self._dumps(value), time=time, **kw)
+
+    def get_many(self, keys: list[str], fallback: Any = None, **kw: Any) -> dict[str, Any]:
+        """
+        Get the values for multiple keys from the cache in a single round
+        trip.  Any additional keyword arguments will be passed directly to
+        the `pylibmc` get_multi function.
+
+        Args:
+            keys (list): The keys of the items in the cache to get.
+
+        Keyword Args:
+            fallback: The value to return for any item that is not found in
+                the cache.
+
+        Returns:
+            dict: A dictionary of ``key: value`` for every requested key.
+
+        """
+        res = self.mc.get_multi(keys, **kw)
+        return {key: self._loads(res[key]) if key in res else fallback
+                for key in keys}
+
+    def set_many(self, items: dict[str, Any], time: int | None = None, **kw: Any) -> None:
+        """
+        Set multiple values in the cache in a single round trip.  Any
+        additional keyword arguments will be passed directly to the
+        `pylibmc` set_multi function.
+
+        Args:
+            items (dict): A dictionary of ``key: value`` to set.
+
+        Keyword Arguments:
+            time (int): The expiration time (in seconds) to keep the items
+                cached.  Defaults to `expire_time` as defined in the
+                applications configuration.
+
+        """
+        if time is None:
+            time = int(self._config('expire_time'))
+
+        items = {key: self._dumps(value) for key, value in items.items()}
+        self.mc.set_multi(items, time=time, **kw)
 
     def delete(self, key: str, **kw: Any) -> bool:
         """
@@ -148,6 +197,29 @@ class MemcachedCacheHandler(cache.CacheHandler):
         self.mc.delete(key, **kw)
         return True
 
+    def delete_many(self, keys: list[str], **kw: Any) -> int:
+        """
+        Delete multiple items from the cache in a single round trip.  Any
+        additional keyword arguments will be passed directly to the
+        `pylibmc` delete_multi function.
+
+        Note that ``delete_multi`` only reports whether every key was
+        deleted, so the keys that exist are first counted with a single
+        ``get_multi`` round trip.
+
+        Args:
+            keys (list): The keys to delete from the cache.
+
+        Returns:
+            int: The number of keys that were deleted.
+
+        """
+        if not keys:
+            return 0
+        count = len(self.mc.get_multi(keys))
+        self.mc.delete_multi(keys, **kw)
+        return count
+
     def purge(self, **kw: Any) -> None:
         """
         Purge the entire cache, all keys and values will be lost.  Any
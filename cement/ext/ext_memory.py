@@ -0,0 +1,216 @@
+"""
+Cement memory extension module.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from ..core import cache
+from ..utils.misc import minimal_logger
+
+if TYPE_CHECKING:
+    from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
+
+LOG = minimal_logger(__name__)
+
+
+class MemoryCacheHandler(cache.CacheHandler):
+
+    """
+    This class implements the :ref:`Cache <cement.core.cache>` Handler
+    interface.  It provides an in-process cache with least recently used
+    (LRU) eviction, per-key expiration, and no external dependencies.  The
+    cache lives as long as the application object, making it most useful for
+    long running processes.
+
+    The cache is bounded by ``max_entries`` and/or ``max_bytes`` (``0``
+    disables either limit).  Values are stored by reference unless a
+    ``serializer`` is configured (see
+    :class:`cement.core.cache.CacheSerializer`), in which case sizes are
+    measured on the serialized payload rather than estimated with
+    ``sys.getsizeof()``.
+
+    Hit, miss, eviction, and expiration counters are available via
+    :meth:`stats`.
+    """
+
+    class Meta(cache.CacheHandler.Meta):
+
+        """Handler meta-data."""
+
+        label = 'memory'
+        config_defaults = dict(
+            expire_time=0,
+            max_entries=1000,
+            max_bytes=0,
+            serializer=None,
+            compression=None,
+            compress_threshold=1024,
+        )
+
+    _meta: Meta  # type: ignore
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        # key -> (value, expires_at or None, size)
+        self._data: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _setup(self, *args: Any, **kw: Any) -> None:
+        super()._setup(*args, **kw)
+        self._max_entries = int(self._config('max_entries') or 0)
+        self._max_bytes = int(self._config('max_bytes') or 0)
+
+    def _config(self, key: str) -> Any:
+        """
+        This is a simple wrapper, and is equivalent to:
+        ``self.app.config.get('cache.memory', <key>)``.
+
+        Args:
+            key (str): The key to get a config value from the
+                ``cache.memory`` config section.
+
+        Returns:
+            unknown: The value of the given key.
+
+        """
+        return self.app.config.get(self._meta.config_section, key)
+
+    def _size(self, value: Any) -> int:
+        if isinstance(value, (bytes, str)):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self._max_entries and len(self._data) > self._max_entries) or
+            (self._max_bytes and self._bytes > self._max_bytes)
+        ):
+            key, (_, _, size) = self._data.popitem(last=False)
+            LOG.debug(f"evicting cache key '{key}'")
+            self._bytes -= size
+            self.evictions += 1
+
+    def get(self, key: str, fallback: Any = None, **kw: Any) -> Any:
+        """
+        Get a value from the cache.  Additional keyword arguments are ignored.
+
+        Args:
+            key (str): The key of the item in the cache to get.
+
+        Keyword Args:
+            fallback: The value to return if the item is not found in the
+                cache.
+
+        Returns:
+            unknown: The value of the item in the cache, or the ``fallback``
+            value.
+
+        """
+        LOG.debug(f"getting cache value using key '{key}'")
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[1] is not None and item[1] <= monotonic():
+                self._remove(key)
+                self.expirations += 1
+                item = None
+
+            if item is None:
+                self.misses += 1
+                return fallback
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._loads(item[0])
+
+    def set(self, key: str, value: Any, time: int | None = None, **kw: Any) -> None:
+        """
+        Set a value in the cache for the given ``key``, evicting the least
+        recently used items if the cache is full.  Additional keyword
+        arguments are ignored.
+
+        Args:
+            key (str): The key of the item in the cache to set.
+            value: The value of the item to set.
+            time (int): The expiration time (in seconds) to keep the item
+                cached. Defaults to ``expire_time`` as defined in the
+                applications configuration.  ``0`` never expires.
+
+        """
+        if time is None:
+            time = int(self._config('expire_time'))
+
+        value = self._dumps(value)
+        size = self._size(value)
+        expires = monotonic() + time if time else None
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, expires, size)
+            self._bytes += size
+            self._evict()
+
+    def delete(self, key: str, **kw: Any) -> bool:
+        """
+        Delete an item from the cache for the given ``key``.  Additional
+        keyword arguments are ignored.
+
+        Args:
+            key (str): The key to delete from the cache.
+
+        Returns:
+            bool: ``True`` if the key is successfully deleted, ``False``
+            otherwise
+
+        """
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._remove(key)
+            return True
+
+    def purge(self, **kw: Any) -> None:
+        """
+        Purge the entire cache, all keys and values will be lost.  Counters
+        are not reset.  Additional keyword arguments are ignored.
+
+        """
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the cache counters and current usage.
+
+        Returns:
+            dict: A dictionary with the keys ``hits``, ``misses``,
+            ``evictions``, ``expirations``, ``entries``, and ``bytes``.
+
+        """
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                entries=len(self._data),
+                bytes=self._bytes,
+            )
+
+
+def load(app: "App") -> None:
+    app.handler.register(MemoryCacheHandler)
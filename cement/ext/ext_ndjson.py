@@ -0,0 +1,205 @@
+"""
+Cement ndjson extension module.
+"""
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..core import output
+from ..ext.ext_json import is_bytes_native
+from ..utils.misc import minimal_logger
+
+if TYPE_CHECKING:
+    from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
+
+LOG = minimal_logger(__name__)
+
+
+def suppress_output_before_run(app: "App") -> None:
+    """
+    This is a ``post_argument_parsing`` hook that suppresses console output if
+    the ``NdjsonOutputHandler`` is triggered via command line.
+
+    :param app: The application object.
+
+    """
+    if not hasattr(app.pargs, 'output_handler_override'):
+        return
+    elif app.pargs.output_handler_override == 'ndjson':
+        app._suppress_output()
+
+
+def unsuppress_output_before_render(app: "App", data: Any) -> None:
+    """
+    This is a ``pre_render`` that unsuppresses console output if
+    the ``NdjsonOutputHandler`` is triggered via command line so that the
+    JSON records are the only thing in the output.
+
+    :param app: The application object.
+
+    """
+    if not hasattr(app.pargs, 'output_handler_override'):
+        return
+    elif app.pargs.output_handler_override == 'ndjson':
+        app._unsuppress_output()
+
+
+def suppress_output_after_render(app: "App", out_text: str) -> None:
+    """
+    This is a ``post_render`` hook that suppresses console output again after
+    rendering, only if the ``NdjsonOutputHandler`` is triggered via command
+    line.
+
+    :param app: The application object.
+
+    """
+    if not hasattr(app.pargs, 'output_handler_override'):
+        return
+    elif app.pargs.output_handler_override == 'ndjson':
+        app._suppress_output()
+
+
+class NdjsonOutputHandler(output.OutputHandler):
+
+    """
+    This class implements the :ref:`Output <cement.core.output>` Handler
+    interface.  It provides `JSON Lines <https://jsonlines.org/>`_ (NDJSON)
+    output, one JSON encoded record per line, from any iterable (i.e. a list
+    or generator) of records.  A single ``dict`` is rendered as one record.
+    Please see the developer documentation on
+    :cement:`Output Handling <dev/output>`.
+
+    Rendering with ``app.render(records, stream=True)`` serializes and
+    writes the records incrementally, so memory use is bounded by the
+    ``flush_records`` and ``flush_bytes`` thresholds rather than the number
+    of records:
+
+    .. code-block:: python
+
+        def records():
+            for i in range(1000000):
+                yield dict(id=i)
+
+        app.render(records(), handler='ndjson', stream=True)
+
+    This handler forces Cement to suppress console output until
+    ``app.render`` is called (keeping the output pure JSON Lines).  If
+    troubleshooting issues, you will need to pass the ``--debug`` option in
+    order to unsuppress output and see what's happening.
+
+    """
+    class Meta(output.OutputHandler.Meta):
+
+        """Handler meta-data"""
+
+        label = 'ndjson'
+        """The string identifier of this handler."""
+
+        #: Whether or not to include ``ndjson`` as an available choice
+        #: to override the ``output_handler`` via command line options.
+        overridable = False
+
+        #: Backend JSON library module to use (`json`, `ujson`, `orjson`)
+        json_module = 'json'
+
+        #: Number of records after which the buffered output is written
+        #: (and flushed) when streaming.  ``0`` disables the limit.
+        flush_records = 1000
+
+        #: Size (in characters) of buffered output after which it is
+        #: written (and flushed) when streaming.  ``0`` disables the limit.
+        flush_bytes = 65536
+
+        #: Reuse one instance per application (i.e. for repeated
+        #: ``app.render(data, handler='ndjson')`` calls).
+        scope = 'app'
+
+    _meta: Meta  # type: ignore
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self._json = None
+        self._bytes_native = False
+
+    def _setup(self, app: "App") -> None:
+        super()._setup(app)
+        self._json = __import__(self._meta.json_module,         # type: ignore
+                                globals(), locals(), [], 0)
+        self._bytes_native = is_bytes_native(self._json)
+
+    def render(self, data: Any, template: str | None = None, **kw: Any) -> str:
+        """
+        Take an iterable of records and render it as JSON Lines output.  Note
+        that the template option is received here per the interface, however
+        this handler just ignores it.  Additional keyword arguments passed to
+        ``json.dumps()`` for every record.
+
+        Args:
+            data (iterable): The records (or a single ``dict`` record) to
+                render.
+
+        Keyword Args:
+            template: This option is completely ignored.
+
+        Returns:
+            str: One JSON encoded record per line.
+
+        """
+        return ''.join(self.render_iter(data, template=template, **kw))
+
+    def render_iter(self, data: Any,
+                    template: str | None = None, **kw: Any) -> Iterator[str]:
+        """
+        Take an iterable of records and render it as JSON Lines output,
+        yielding the buffered lines whenever ``flush_records`` or
+        ``flush_bytes`` is reached.  Records are consumed from ``data`` as
+        they are rendered.  Additional keyword arguments passed to
+        ``json.dumps()`` for every record.
+
+        Args:
+            data (iterable): The records (or a single ``dict`` record) to
+                render.
+
+        Keyword Args:
+            template: This option is completely ignored.
+
+        Yields:
+            str: Chunks of one or more JSON encoded records per line.
+
+        """
+        LOG.debug(f"rendering output as JSON Lines via {self.__module__}")
+        if isinstance(data, dict):
+            data = [data]
+
+        dumps = self._json.dumps
+        max_records = int(self._meta.flush_records or 0)
+        max_bytes = int(self._meta.flush_bytes or 0)
+
+        # bytes native backends (i.e. orjson) are decoded once per chunk
+        # rather than once per record
+        newline: Any = b'\n' if self._bytes_native is True else '\n'
+
+        def join(lines: list[Any]) -> str:
+            chunk = newline.join(lines) + newline
+            return chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+
+        buf: list[Any] = []
+        size = 0
+        for record in data:
+            line = dumps(record, **kw)
+            buf.append(line)
+            size += len(line) + 1
+            if (max_records and len(buf) >= max_records) or \
+                    (max_bytes and size >= max_bytes):
+                yield join(buf)
+                buf = []
+                size = 0
+        if buf:
+            yield join(buf)
+
+
+def load(app: "App") -> None:
+    app.hook.register('post_argument_parsing', suppress_output_before_run)
+    app.hook.register('pre_render', unsuppress_output_before_render)
+    app.hook.register('post_render', suppress_output_after_render)
+    app.handler.register(NdjsonOutputHandler)
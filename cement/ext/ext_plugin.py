@@ -202,7 +202,8 @@ class CementPluginHandler(plugin.PluginHandler):
 
         """
         for plugin_name in plugin_list:
-            self.load_plugin(plugin_name)
+            with self.app._profile('plugin', plugin_name):
+                self.load_plugin(plugin_name)
 
     def get_loaded_plugins(self) -> list[str]:
         """List of plugins that have been loaded."""
@@ -11,12 +11,13 @@ extensions.
   dependencies.
 """
 
+import re
 from typing import TYPE_CHECKING, Any
 
 import redis
 
 from ..core import cache
-from ..utils.misc import minimal_logger
+from ..utils.misc import is_true, minimal_logger
 
 if TYPE_CHECKING:
     from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
@@ -30,6 +31,17 @@ class RedisCacheHandler(cache.CacheHandler):
     This class implements the :ref:`Cache <cement.core.cache>` Handler
     interface.  It provides a caching interface using the
     `redis <http://github.com/andymccurdy/redis-py>`_ library.
+
+    Connections are shared via a ``redis.ConnectionPool``, sized by the
+    ``max_connections`` and ``socket_keepalive`` settings of the
+    ``cache.redis`` config section.  If ``key_prefix`` is set, it is
+    prepended to all keys and ``purge()`` only removes keys with that
+    prefix.
+
+    Values are returned as decoded UTF-8 strings unless a ``serializer``
+    (``raw``, ``json``, ``pickle``, or ``msgpack``) is configured, in which
+    case they round trip as the original type.  See
+    :class:`cement.core.cache.CacheSerializer`.
     """
 
     class Meta(cache.CacheHandler.Meta):
@@ -42,6 +54,13 @@ class RedisCacheHandler(cache.CacheHandler):
             port=6379,
             db=0,
             expire_time=0,
+            key_prefix='',
+            max_connections=None,
+            socket_keepalive=False,
+            scan_count=1000,
+            serializer=None,
+            compression=None,
+            compress_threshold=1024,
         )
 
     _meta: Meta  # type: ignore
@@ -52,10 +71,26 @@ class RedisCacheHandler(cache.CacheHandler):
 
     def _setup(self, *args: Any, **kw: Any) -> None:
         super()._setup(*args, **kw)
-        self.r = redis.StrictRedis(
+        max_connections = self._config('max_connections')
+        self.pool = redis.ConnectionPool(
             host=self._config('host', default='127.0.0.1'),
-            port=self._config('port', default=6379),
-            db=self._config('db', default=0))
+            port=int(self._config('port', default=6379)),
+            db=int(self._config('db', default=0)),
+            max_connections=int(max_connections) if max_connections else None,
+            socket_keepalive=is_true(self._config('socket_keepalive')))
+        self.r = redis.StrictRedis(connection_pool=self.pool)
+        self._prefix = self._config('key_prefix') or ''
+
+    def _key(self, key: str) -> str:
+        return f'{self._prefix}{key}'
+
+    def _decode(self, res: Any, fallback: Any) -> Any:
+        if res is None:
+            return fallback
+        elif self.serializer is None:
+            return res.decode('utf-8')
+        else:
+            return self.serializer.loads(res)
 
     def _config(self, key: str, default: Any = None) -> Any:
         """
@@ -89,11 +124,30 @@ class RedisCacheHandler(cache.CacheHandler):
 
         """
         LOG.debug(f"getting cache value using key '{key}'")
-        res = self.r.get(key)
-        if res is None:
-            return fallback
-        else:
-            return res.decode('utf-8')  # type: ignore[union-attr]
+        return self._decode(self.r.get(self._key(key)), fallback)
+
+    def get_many(self, keys: list[str], fallback: Any = None, **kw: Any) -> dict[str, Any]:
+        """
+        Get the values for multiple keys from the cache in a single round
+        trip (``MGET``).  Additional keyword arguments are ignored.
+
+        Args:
+            keys (list): The keys of the items in the cache to get.
+
+        Keyword Args:
+            fallback: The value to return for any item that is not found in
+                the cache.
+
+        Returns:
+            dict: A dictionary of ``key: value`` for every requested key.
+
+        """
+        if not keys:
+            return {}
+        LOG.debug(f"getting {len(keys)} cache values")
+        res = self.r.mget([self._key(key) for key in keys])
+        return {key: self._decode(val, fallback)
+                for key, val in zip(keys, res, strict=True)}  # type: ignore[arg-type]
 
     def set(self, key: str, value: Any, time: int | None = None, **kw: Any) -> None:
         """
@@ -111,10 +165,35 @@ class RedisCacheHandler(cache.CacheHandler):
         if time is None:
             time = int(self._config('expire_time'))
 
+        value = self._dumps(value)
         if time == 0:
-            self.r.set(key, value)
+            self.r.set(self._key(key), value)
         else:
-            self.r.setex(key, time, value)
+            self.r.setex(self._key(key), time, value)
+
+    def set_many(self, items: dict[str, Any], time: int | None = None, **kw: Any) -> None:
+        """
+        Set multiple values in the cache using a single pipelined round
+        trip.  Additional keyword arguments are ignored.
+
+        Args:
+            items (dict): A dictionary of ``key: value`` to set.
+            time (int): The expiration time (in seconds) to keep the items
+                cached. Defaults to ``expire_time`` as defined in the
+                applications configuration.
+
+        """
+        if time is None:
+            time = int(self._config('expire_time'))
+
+        pipe = self.r.pipeline(transaction=False)
+        for key, value in items.items():
+            value = self._dumps(value)
+            if time == 0:
+                pipe.set(self._key(key), value)
+            else:
+                pipe.setex(self._key(key), time, value)
+        pipe.execute()
 
     def delete(self, key: str, **kw: Any) -> bool:
         """
@@ -128,19 +207,47 @@ class RedisCacheHandler(cache.CacheHandler):
             bool: ``True`` if the key is successfully deleted, ``False``
             otherwise
         """
-        res = self.r.delete(key)
+        res = self.r.delete(self._key(key))
         return int(res) > 0  # type: ignore[arg-type]
 
+    def delete_many(self, keys: list[str], **kw: Any) -> int:
+        """
+        Delete multiple items from the cache with a single ``DEL`` command.
+        Additional keyword arguments are ignored.
+
+        Args:
+            keys (list): The keys to delete from the cache.
+
+        Returns:
+            int: The number of keys that were deleted.
+
+        """
+        if not keys:
+            return 0
+        res = self.r.delete(*[self._key(key) for key in keys])
+        return int(res)  # type: ignore[arg-type]
+
     def purge(self, **kw: Any) -> None:
         """
-        Purge the entire cache, all keys and values will be lost.  Any
-        additional keyword arguments will be passed directly to the
-        redis ``flush_all()`` function.
+        Purge all keys matching the configured ``key_prefix`` (or the entire
+        database if no prefix is set), all matching keys and values will be
+        lost.  Keys are found incrementally with ``SCAN`` (rather than
+        ``KEYS``, which blocks the server) and deleted in batches of
+        ``scan_count`` as they are found, so memory use does not grow with the
+        number of keys.  Additional keyword arguments are ignored.
 
         """
-        keys = self.r.keys('*')
-        if keys:
-            self.r.delete(*keys)  # type: ignore[misc]
+        count = int(self._config('scan_count') or 1000)
+        # the prefix is matched literally, not as a glob pattern
+        match = re.sub(r'([*?\[\]\\])', r'\\\1', self._prefix) + '*'
+        batch: list[Any] = []
+        for key in self.r.scan_iter(match=match, count=count):
+            batch.append(key)
+            if len(batch) >= count:
+                self.r.delete(*batch)
+                batch = []
+        if batch:
+            self.r.delete(*batch)
 
 
 def load(app: "App") -> None:
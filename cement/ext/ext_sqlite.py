@@ -0,0 +1,276 @@
+"""
+Cement sqlite extension module.
+"""
+
+import sqlite3
+import threading
+from time import time as _now
+from typing import TYPE_CHECKING, Any
+
+from ..core import cache
+from ..utils import fs
+from ..utils.misc import minimal_logger
+
+if TYPE_CHECKING:
+    from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
+
+LOG = minimal_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB,
+    expires REAL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed);
+"""
+
+#: Maximum number of keys bound to a single ``IN (...)`` query, safely below
+#: the lowest ``SQLITE_MAX_VARIABLE_NUMBER`` (999 prior to sqlite 3.32).
+MAX_VARIABLES = 900
+
+
+def _chunks(keys: list[str]) -> list[list[str]]:
+    return [keys[i:i + MAX_VARIABLES] for i in range(0, len(keys), MAX_VARIABLES)]
+
+
+class SqliteCacheHandler(cache.CacheHandler):
+
+    """
+    This class implements the :ref:`Cache <cement.core.cache>` Handler
+    interface.  It provides a persistent cache stored in a
+    `sqlite <https://docs.python.org/3/library/sqlite3.html>`_ database
+    (``~/.<app_label>/cache/cache.db`` by default), so that cached values
+    survive between invocations of the application.
+
+    Every operation runs in its own transaction and the database uses
+    write-ahead logging, so parallel invocations can safely share the same
+    cache.  Writers wait up to ``timeout`` seconds for a lock.  When the
+    cache holds more than ``max_entries`` items (``0`` disables the limit),
+    expired items and then the least recently used items are evicted.
+
+    Values are pickled by default; see the ``serializer`` setting and
+    :class:`cement.core.cache.CacheSerializer`.
+    """
+
+    class Meta(cache.CacheHandler.Meta):
+
+        """Handler meta-data."""
+
+        label = 'sqlite'
+        config_defaults = dict(
+            path=None,
+            expire_time=0,
+            max_entries=10000,
+            timeout=5.0,
+            serializer='pickle',
+            compression=None,
+            compress_threshold=1024,
+        )
+
+    _meta: Meta  # type: ignore
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.conn: sqlite3.Connection = None  # type: ignore
+        self._lock = threading.RLock()
+
+    def _setup(self, *args: Any, **kw: Any) -> None:
+        super()._setup(*args, **kw)
+        path = self._config('path')
+        if path:
+            path = fs.abspath(path)
+        else:
+            path = fs.join(fs.HOME_DIR, f'.{self.app._meta.label}', 'cache', 'cache.db')
+        fs.ensure_parent_dir_exists(path)
+        self.path = path
+        self._max_entries = int(self._config('max_entries') or 0)
+
+        LOG.debug(f"opening sqlite cache database '{path}'")
+        self.conn = sqlite3.connect(path,
+                                    timeout=float(self._config('timeout')),
+                                    check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def _teardown(self) -> None:
+        if self.conn is not None:
+            LOG.debug(f"closing sqlite cache database '{self.path}'")
+            self.conn.close()
+            self.conn = None  # type: ignore
+
+    def _config(self, key: str) -> Any:
+        """
+        This is a simple wrapper, and is equivalent to:
+        ``self.app.config.get('cache.sqlite', <key>)``.
+
+        Args:
+            key (str): The key to get a config value from the
+                ``cache.sqlite`` config section.
+
+        Returns:
+            unknown: The value of the given key.
+
+        """
+        return self.app.config.get(self._meta.config_section, key)
+
+    def _expires(self, time: int | None) -> float | None:
+        if time is None:
+            time = int(self._config('expire_time'))
+        return _now() + time if time else None
+
+    def _evict(self) -> None:
+        if not self._max_entries:
+            return
+        count = self.conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+        if count <= self._max_entries:
+            return
+        self.conn.execute('DELETE FROM cache WHERE expires <= ?', (_now(),))
+        self.conn.execute(
+            'DELETE FROM cache WHERE key IN '
+            '(SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+            (self._max_entries,))
+
+    def get(self, key: str, fallback: Any = None, **kw: Any) -> Any:
+        """
+        Get a value from the cache.  Additional keyword arguments are ignored.
+
+        Args:
+            key (str): The key of the item in the cache to get.
+
+        Keyword Args:
+            fallback: The value to return if the item is not found in the
+                cache.
+
+        Returns:
+            unknown: The value of the item in the cache, or the ``fallback``
+            value.
+
+        """
+        LOG.debug(f"getting cache value using key '{key}'")
+        return self.get_many([key], fallback=fallback)[key]
+
+    def get_many(self, keys: list[str], fallback: Any = None, **kw: Any) -> dict[str, Any]:
+        """
+        Get the values for multiple keys from the cache in a single
+        transaction, querying at most ``MAX_VARIABLES`` keys at a time.
+        Additional keyword arguments are ignored.
+
+        Args:
+            keys (list): The keys of the items in the cache to get.
+
+        Keyword Args:
+            fallback: The value to return for any item that is not found in
+                the cache.
+
+        Returns:
+            dict: A dictionary of ``key: value`` for every requested key.
+
+        """
+        if not keys:
+            return {}
+        now = _now()
+        rows: list[tuple[str, bytes]] = []
+        with self._lock, self.conn:
+            for chunk in _chunks(keys):
+                marks = ','.join('?' * len(chunk))
+                res = self.conn.execute(
+                    f'SELECT key, value FROM cache WHERE key IN ({marks}) '
+                    'AND (expires IS NULL OR expires > ?)',
+                    (*chunk, now)).fetchall()
+                if res:
+                    self.conn.execute(
+                        f'UPDATE cache SET accessed = ? WHERE key IN ({marks})',
+                        (now, *chunk))
+                rows.extend(res)
+        found = {key: self._loads(value) for key, value in rows}
+        return {key: found[key] if key in found else fallback for key in keys}
+
+    def set(self, key: str, value: Any, time: int | None = None, **kw: Any) -> None:
+        """
+        Set a value in the cache for the given ``key``.  Additional
+        keyword arguments are ignored.
+
+        Args:
+            key (str): The key of the item in the cache to set.
+            value: The value of the item to set.
+            time (int): The expiration time (in seconds) to keep the item
+                cached. Defaults to ``expire_time`` as defined in the
+                applications configuration.  ``0`` never expires.
+
+        """
+        self.set_many({key: value}, time=time)
+
+    def set_many(self, items: dict[str, Any], time: int | None = None, **kw: Any) -> None:
+        """
+        Set multiple values in the cache in a single transaction.  Additional
+        keyword arguments are ignored.
+
+        Args:
+            items (dict): A dictionary of ``key: value`` to set.
+            time (int): The expiration time (in seconds) to keep the items
+                cached. Defaults to ``expire_time`` as defined in the
+                applications configuration.  ``0`` never expires.
+
+        """
+        expires = self._expires(time)
+        now = _now()
+        rows = [(key, self._dumps(value), expires, now) for key, value in items.items()]
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO cache (key, value, expires, accessed) '
+                'VALUES (?, ?, ?, ?)', rows)
+            self._evict()
+
+    def delete(self, key: str, **kw: Any) -> bool:
+        """
+        Delete an item from the cache for the given ``key``.  Additional
+        keyword arguments are ignored.
+
+        Args:
+            key (str): The key to delete from the cache.
+
+        Returns:
+            bool: ``True`` if the key is successfully deleted, ``False``
+            otherwise
+
+        """
+        return self.delete_many([key]) > 0
+
+    def delete_many(self, keys: list[str], **kw: Any) -> int:
+        """
+        Delete multiple items from the cache in a single transaction.
+        Additional keyword arguments are ignored.
+
+        Args:
+            keys (list): The keys to delete from the cache.
+
+        Returns:
+            int: The number of keys that were deleted.
+
+        """
+        if not keys:
+            return 0
+        count = 0
+        with self._lock, self.conn:
+            for chunk in _chunks(keys):
+                marks = ','.join('?' * len(chunk))
+                cur = self.conn.execute(
+                    f'DELETE FROM cache WHERE key IN ({marks})', chunk)
+                count += cur.rowcount
+        return count
+
+    def purge(self, **kw: Any) -> None:
+        """
+        Purge the entire cache, all keys and values will be lost.  Additional
+        keyword arguments are ignored.
+
+        """
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM cache')
+
+
+def load(app: "App") -> None:
+    app.handler.register(SqliteCacheHandler)
@@ -0,0 +1,179 @@
+"""
+Cement toml extension module.
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+from ..core import output
+from ..ext.ext_configparser import ConfigParserConfigHandler
+from ..utils.misc import minimal_logger
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: nocover  # python < 3.11
+    import tomli as tomllib  # type: ignore[import-not-found, unused-ignore]
+
+if TYPE_CHECKING:
+    from ..core.foundation import App  # pragma: nocover  # TYPE_CHECKING import
+
+LOG = minimal_logger(__name__)
+
+
+def suppress_output_before_run(app: "App") -> None:
+    """
+    This is a ``post_argument_parsing`` hook that suppresses console output if
+    the ``TomlOutputHandler`` is triggered via command line.
+
+    :param app: The application object.
+
+    """
+    if not hasattr(app.pargs, 'output_handler_override'):
+        return
+    elif app.pargs.output_handler_override == 'toml':
+        app._suppress_output()
+
+
+def unsuppress_output_before_render(app: "App", data: Any) -> None:
+    """
+    This is a ``pre_render`` that unsuppresses console output if
+    the ``TomlOutputHandler`` is triggered via command line so that the TOML
+    is the only thing in the output.
+
+    :param app: The application object.
+
+    """
+    if not hasattr(app.pargs, 'output_handler_override'):
+        return
+    elif app.pargs.output_handler_override == 'toml':
+        app._unsuppress_output()
+
+
+def suppress_output_after_render(app: "App", out_text: str) -> None:
+    """
+    This is a ``post_render`` hook that suppresses console output again after
+    rendering, only if the ``TomlOutputHandler`` is triggered via command
+    line.
+
+    :param app: The application object.
+
+    """
+    if not hasattr(app.pargs, 'output_handler_override'):
+        return
+    elif app.pargs.output_handler_override == 'toml':
+        app._suppress_output()
+
+
+class TomlOutputHandler(output.OutputHandler):
+
+    """
+    This class implements the :ref:`Output <cement.core.output>` Handler
+    interface.  It provides TOML output from a data dictionary using
+    `tomli-w <https://github.com/hukkin/tomli-w>`_.  Please see the developer
+    documentation on :cement:`Output Handling <dev/output>`.
+
+    **Note** This handler has an external dependency on ``tomli-w`` (only
+    imported when the handler is setup).  You must include ``tomli-w`` in
+    your application's dependencies as Cement explicitly does *not* include
+    external dependencies for optional extensions.
+
+    This handler forces Cement to suppress console output until
+    ``app.render`` is called (keeping the output pure TOML).  If
+    troubleshooting issues, you will need to pass the ``--debug`` option in
+    order to unsuppress output and see what's happening.
+
+    """
+    class Meta(output.OutputHandler.Meta):
+
+        """Handler meta-data"""
+
+        label = 'toml'
+        """The string identifier of this handler."""
+
+        #: Whether or not to include ``toml`` as an available choice
+        #: to override the ``output_handler`` via command line options.
+        overridable = False
+
+        #: Reuse one instance per application (i.e. for repeated
+        #: ``app.render(data, handler='toml')`` calls).
+        scope = 'app'
+
+    _meta: Meta  # type: ignore
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        # D-09: the tomli_w module, imported when the handler is setup.
+        self._toml_w: Any = None
+
+    def _setup(self, app: "App") -> None:
+        super()._setup(app)
+        self._toml_w = __import__('tomli_w', globals(), locals(), [], 0)
+
+    def render(self, data: dict[str, Any], template: str | None = None, **kw: Any) -> str:
+        """
+        Take a data dictionary and render it as TOML output.  Note that the
+        template option is received here per the interface, however this
+        handler just ignores it.  Additional keyword arguments passed to
+        ``tomli_w.dumps()``.
+
+        Args:
+            data (dict): The data dictionary to render.
+
+        Keyword Args:
+            template: This option is completely ignored.
+
+        Returns:
+            str: A TOML encoded string.
+
+        """
+        LOG.debug(f"rendering output as TOML via {self.__module__}")
+        return self._toml_w.dumps(data, **kw)  # type: ignore
+
+
+class TomlConfigHandler(ConfigParserConfigHandler):
+
+    """
+    This class implements the :ref:`Config <cement.core.config>` Handler
+    interface, and provides the same functionality of
+    :ref:`ConfigParserConfigHandler <cement.ext.ext_configparser>`
+    (including environment variable overrides) but with TOML configuration
+    files, parsed with the standard library
+    `tomllib <https://docs.python.org/3/library/tomllib.html>`_.
+
+    **Note** On Python < 3.11 this extension has an external dependency on
+    ``tomli`` (the package ``tomllib`` was derived from).
+
+    """
+    class Meta(ConfigParserConfigHandler.Meta):
+
+        """Handler meta-data."""
+
+        label = 'toml'
+
+    _meta: Meta  # type: ignore
+
+    def _parse_file(self, file_path: str) -> bool:
+        """
+        Parse TOML configuration file settings from file_path, overwriting
+        existing config settings.  If the file does not exist, returns False.
+
+        Args:
+            file_path (str): The file system path to the TOML configuration
+            file.
+
+        Returns:
+            bool
+
+        """
+        with open(file_path, 'rb') as f:
+            self.merge(tomllib.load(f))
+
+        return True
+
+
+def load(app: "App") -> None:
+    app.hook.register('post_argument_parsing', suppress_output_before_run)
+    app.hook.register('pre_render', unsuppress_output_before_render)
+    app.hook.register('post_render', suppress_output_after_render)
+    app.handler.register(TomlOutputHandler)
+    app.handler.register(TomlConfigHandler)
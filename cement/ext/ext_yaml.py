@@ -2,12 +2,12 @@
 Cement yaml extension module.
 """
 
-from collections.abc import Callable
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 import yaml  # type: ignore
 
-from ..core import output
+from ..core import exc, output
 from ..ext.ext_configparser import ConfigParserConfigHandler
 from ..utils.misc import minimal_logger
 
@@ -17,6 +17,60 @@ if TYPE_CHECKING:
 LOG = minimal_logger(__name__)
 
 
+def _get_backend(name: str, libyaml: bool | None) -> Any:
+    c_backend = getattr(yaml, f'C{name}', None)
+    if libyaml is True and c_backend is None:
+        raise exc.FrameworkError(
+            f"LibYAML backend 'C{name}' is not available (pyYaml must be "
+            "installed with LibYAML bindings)")
+    elif libyaml is False or c_backend is None:
+        return getattr(yaml, name)
+    return c_backend
+
+
+def yaml_loader(libyaml: bool | None = None) -> Any:
+    """
+    Return the pyYaml loader class used by ``yaml.full_load()``
+    (``FullLoader``), or its LibYAML accelerated equivalent
+    (``CFullLoader``).
+
+    Keyword Args:
+        libyaml (bool): Whether to use the LibYAML backend.  If ``None``,
+            it is used if available.
+
+    Returns:
+        type: The loader class.
+
+    Raises:
+        cement.core.exc.FrameworkError: If ``libyaml`` is ``True`` but pyYaml
+            was not installed with LibYAML bindings.
+
+    """
+    # FullLoader was added in pyYaml 5.1
+    name = 'FullLoader' if hasattr(yaml, 'FullLoader') else 'Loader'
+    return _get_backend(name, libyaml)
+
+
+def yaml_dumper(libyaml: bool | None = None) -> Any:
+    """
+    Return the pyYaml dumper class used by ``yaml.dump()`` (``Dumper``), or
+    its LibYAML accelerated equivalent (``CDumper``).
+
+    Keyword Args:
+        libyaml (bool): Whether to use the LibYAML backend.  If ``None``,
+            it is used if available.
+
+    Returns:
+        type: The dumper class.
+
+    Raises:
+        cement.core.exc.FrameworkError: If ``libyaml`` is ``True`` but pyYaml
+            was not installed with LibYAML bindings.
+
+    """
+    return _get_backend('Dumper', libyaml)
+
+
 def suppress_output_before_run(app: "App") -> None:
     """
     This is a ``post_argument_parsing`` hook that suppresses console output if
@@ -87,14 +141,25 @@ class YamlOutputHandler(output.OutputHandler):
         #: to override the ``output_handler`` via command line options.
         overridable = False
 
+        #: Reuse one instance per application (i.e. for repeated
+        #: ``app.render(data, handler='yaml')`` calls).
+        scope = 'app'
+
+        #: Whether to dump with the LibYAML backend (``CDumper``).  If
+        #: ``None``, it is used if pyYaml was installed with LibYAML
+        #: bindings.
+        libyaml = None
+
     _meta: Meta  # type: ignore
 
     def __init__(self, *args: Any, **kw: Any) -> None:
         super().__init__(*args, **kw)
         self.config = None
+        self._dumper = None
 
     def _setup(self, app_obj: "App") -> None:
         self.app = app_obj
+        self._dumper = yaml_dumper(self._meta.libyaml)
 
     def render(self, data: dict[str, Any], template: str | None = None, **kw: Any) -> str:
         """
@@ -114,8 +179,48 @@ class YamlOutputHandler(output.OutputHandler):
 
         """
         LOG.debug(f"rendering output as yaml via {self.__module__}")
+        kw.setdefault('Dumper', self._dumper)
         return yaml.dump(data, **kw)  # type: ignore
 
+    def render_iter(self, data: dict[str, Any], template: str | None = None,
+                    **kw: Any) -> Iterator[str]:
+        """
+        Take a data dictionary and render it as Yaml output, yielding it in
+        chunks by dumping one top level key (or list item) at a time.  The
+        output is the same as ``render()``, except that objects referenced
+        under more than one top level key are repeated rather than written
+        as Yaml aliases.  Flow style and document level options
+        (``default_flow_style``, ``explicit_start``, etc) are dumped as a
+        single chunk.  Additional keyword arguments passed to
+        ``yaml.dump()``.
+
+        Args:
+            data (dict): The data dictionary to render.
+
+        Keyword Args:
+            template: This option is completely ignored.
+
+        Yields:
+            str: Chunks of the YAML encoded string.
+
+        """
+        document_opts = ['explicit_start', 'explicit_end', 'version', 'tags']
+        if not data or not isinstance(data, (dict, list)) or \
+                kw.get('default_flow_style', False) is not False or \
+                any(kw.get(opt) for opt in document_opts):
+            yield self.render(data, template=template, **kw)
+            return
+
+        LOG.debug(f"rendering output as Yaml via {self.__module__} (streaming)")
+        kw.setdefault('Dumper', self._dumper)
+        items: Any
+        if isinstance(data, dict):
+            keys = sorted(data) if kw.get('sort_keys', True) else list(data)
+            items = ({key: data[key]} for key in keys)
+        else:
+            items = ([item] for item in data)
+        yield from output.buffer_chunks(yaml.dump(item, **kw) for item in items)
+
 
 class YamlConfigHandler(ConfigParserConfigHandler):
 
@@ -138,14 +243,28 @@ class YamlConfigHandler(ConfigParserConfigHandler):
     the FullLoader, which is the default Loader when none is provided.  See
     the pyYaml message on this deprecation: https://msg.pyyaml.org/load
 
+    The LibYAML accelerated equivalent of the loader (``CFullLoader``) is
+    used if pyYaml was installed with LibYAML bindings (see
+    ``Meta.libyaml``).
+
     """
     class Meta(ConfigParserConfigHandler.Meta):
         label = 'yaml'
 
+        #: Whether to parse with the LibYAML backend (``CFullLoader``).  If
+        #: ``None``, it is used if pyYaml was installed with LibYAML
+        #: bindings.
+        libyaml = None
+
     _meta: Meta  # type: ignore
 
     def __init__(self, *args: Any, **kw: Any) -> None:
         super().__init__(*args, **kw)
+        self._loader = None
+
+    def _setup(self, app: "App") -> None:
+        super()._setup(app)
+        self._loader = yaml_loader(self._meta.libyaml)
 
     def _parse_file(self, file_path: str) -> bool:
         """
@@ -157,12 +276,10 @@ class YamlConfigHandler(ConfigParserConfigHandler):
                              file.
 
         """
-        yaml_load: Callable = yaml.full_load if hasattr(yaml, 'full_load') else yaml.load
-
         with open(file_path) as f:
             content = f.read()
             if content is not None and len(content) > 0:
-                self.merge(yaml_load(content))
+                self.merge(yaml.load(content, Loader=self._loader))
 
         return True
 
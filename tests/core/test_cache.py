@@ -1,5 +1,10 @@
 
-from cement.core.cache import CacheHandler, CacheInterface
+from pytest import raises
+
+from cement.core.cache import CacheHandler, CacheInterface, CacheSerializer
+from cement.core.exc import FrameworkError
+from cement.utils.misc import init_defaults
+from cement.utils.test import TestApp
 
 # module tests
 
@@ -30,4 +35,121 @@ class TestCacheHandler:
         assert h._meta.interface == 'cache'
         assert h._meta.label == 'my_cache_handler'
 
+class TestCacheSerializer:
+    def test_raw(self):
+        s = CacheSerializer('raw')
+        assert s.dumps(b'\x00bytes') == b'\x00bytes'
+        assert s.dumps('text') == b'text'
+        assert s.dumps(1001) == b'1001'
+        assert s.loads(b'text') == b'text'
+
+    def test_json(self):
+        s = CacheSerializer('json')
+        data = dict(foo=['bar', 1, None])
+        assert isinstance(s.dumps(data), bytes)
+        assert s.loads(s.dumps(data)) == data
+
+    def test_pickle(self):
+        s = CacheSerializer('pickle')
+        data = dict(foo={'bar', 'baz'}, one=(1, 2))
+        assert s.loads(s.dumps(data)) == data
+
+    def test_msgpack(self):
+        s = CacheSerializer('msgpack')
+        data = dict(foo=['bar', 1, None], raw=b'\x00bytes')
+        assert isinstance(s.dumps(data), bytes)
+        assert s.loads(s.dumps(data)) == data
+
+    def test_compression(self):
+        s = CacheSerializer('json', compression='zlib', compress_threshold=100)
+        small = 'x' * 10
+        large = 'x' * 1000
+        assert s.dumps(small) == b'\x00' + b'"' + small.encode() + b'"'
+        assert s.dumps(large)[:1] == b'\x01'
+        assert len(s.dumps(large)) < len(large)
+        assert s.loads(s.dumps(small)) == small
+        assert s.loads(s.dumps(large)) == large
+
+    def test_compression_lz4(self):
+        s = CacheSerializer('msgpack', compression='lz4', compress_threshold=100)
+        small = 'x' * 10
+        large = 'x' * 1000
+        assert s.dumps(small)[:1] == b'\x00'
+        assert s.dumps(large)[:1] == b'\x01'
+        assert len(s.dumps(large)) < len(large)
+        assert s.loads(s.dumps(small)) == small
+        assert s.loads(s.dumps(large)) == large
+
+    def test_unknown(self):
+        with raises(FrameworkError, match="Unknown cache serializer 'bogus'"):
+            CacheSerializer('bogus')
+        with raises(FrameworkError, match="Unknown cache compression 'bogus'"):
+            CacheSerializer('json', compression='bogus')
+
+
 # app functionality and coverage tests
+
+
+def test_many_defaults():
+    class DictCacheHandler(CacheHandler):
+        class Meta:
+            label = 'dict_cache_handler'
+
+        def __init__(self, *args, **kw):
+            super().__init__(*args, **kw)
+            self.data = {}
+
+        def get(self, key, fallback=None):
+            return self.data.get(key, fallback)
+
+        def set(self, key, value, time=None):
+            self.data[key] = value
+
+        def delete(self, key):
+            return self.data.pop(key, None) is not None
+
+        def purge(self):
+            self.data = {}
+
+    h = DictCacheHandler()
+    h.set_many({'a': 1, 'b': 2})
+    assert h.get_many(['a', 'b', 'c'], fallback=0) == {'a': 1, 'b': 2, 'c': 0}
+    assert h.delete_many(['a', 'c']) == 1
+    assert h.get_many(['a', 'b']) == {'a': None, 'b': 2}
+
+
+def test_handler_serializer():
+    class MyCacheHandler(CacheHandler):
+        class Meta:
+            label = 'my_cache_handler'
+
+        def get(self, key, fallback=None):
+            pass    # pragma: nocover
+
+        def set(self, key, value, time=None):
+            pass    # pragma: nocover
+
+        def delete(self, key):
+            pass    # pragma: nocover
+
+        def purge(self):
+            pass    # pragma: nocover
+
+    # no serializer configured, values pass through
+    with TestApp(handlers=[MyCacheHandler], cache_handler='my_cache_handler') as app:
+        assert app.cache.serializer is None
+        assert app.cache._dumps({'a': 1}) == {'a': 1}
+        assert app.cache._loads({'a': 1}) == {'a': 1}
+
+    defaults = init_defaults('cache.my_cache_handler')
+    defaults['cache.my_cache_handler']['serializer'] = 'json'
+    defaults['cache.my_cache_handler']['compression'] = 'zlib'
+    defaults['cache.my_cache_handler']['compress_threshold'] = 10
+    with TestApp(handlers=[MyCacheHandler],
+                 cache_handler='my_cache_handler',
+                 config_defaults=defaults) as app:
+        s = app.cache.serializer
+        assert s.name == 'json'
+        assert s.compression == 'zlib'
+        assert s.compress_threshold == 10
+        assert app.cache._loads(app.cache._dumps({'a': 1})) == {'a': 1}
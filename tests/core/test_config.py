@@ -17,7 +17,7 @@ class MyConfigHandler(ConfigHandler):
         pass
 
     def get_dict(self, *args, **kw):
-        pass
+        return {'section': {'key': 'value'}}
 
     def get_sections(self, *args, **kw):
         pass
@@ -57,4 +57,8 @@ class TestConfigHandler:
         assert h.parse_file(tmp.file)
         assert not h.parse_file('/path/to/some/bogus/file')
 
+    def test_get_parsed_dict(self):
+        h = MyConfigHandler()
+        assert h._get_parsed_dict() == {'section': {'key': 'value'}}
+
 # app functionality and coverage tests
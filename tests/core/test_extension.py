@@ -1,7 +1,7 @@
 
 import pytest
 
-from cement.core.exc import FrameworkError
+from cement.core.exc import FrameworkError, InterfaceError
 from cement.core.extension import ExtensionHandler, ExtensionInterface
 from cement.core.foundation import TestApp
 from cement.core.handler import Handler
@@ -102,3 +102,98 @@ def test_list():
         ext.load_extensions(['json'])
 
         assert 'cement.ext.ext_json' in ext.list()
+
+
+def test_lazy_extensions():
+    class MyApp(TestApp):
+        class Meta:
+            lazy_extensions = True
+            extensions = ['json', 'memory', 'sqlite', 'jinja2', 'mustache',
+                          'cement.ext.ext_print']
+            handler_override_options = None
+
+    with MyApp() as app:
+        # extensions not declared in the registry are loaded immediately
+        assert 'cement.ext.ext_print' in app.ext.get_loaded_extensions()
+        assert 'cement.ext.ext_argparse' in app.ext.get_loaded_extensions()
+
+        # including those that register hooks
+        assert 'cement.ext.ext_json' in app.ext.get_loaded_extensions()
+        assert 'cement.ext.ext_json' not in app.ext.get_deferred_extensions()
+
+        deferred = app.ext.get_deferred_extensions()
+        assert 'cement.ext.ext_memory' in deferred
+        assert 'cement.ext.ext_sqlite' in deferred
+        assert 'cement.ext.ext_smtp' in deferred
+
+        # loaded on first use
+        app.handler.get('cache', 'memory')
+        assert 'cement.ext.ext_memory' in app.ext.get_loaded_extensions()
+        assert 'cement.ext.ext_memory' not in app.ext.get_deferred_extensions()
+        assert 'cement.ext.ext_sqlite' in app.ext.get_deferred_extensions()
+
+        # listing an interface loads all deferred extensions providing it
+        labels = [h.Meta.label for h in app.handler.list('template')]
+        assert 'jinja2' in labels
+        assert 'mustache' in labels
+        assert 'cement.ext.ext_jinja2' in app.ext.get_loaded_extensions()
+
+        # ... unless told not to
+        labels = [h.Meta.label for h in app.handler.list('cache', load_deferred=False)]
+        assert 'sqlite' not in labels
+        assert 'cement.ext.ext_sqlite' in app.ext.get_deferred_extensions()
+
+        # deferring an already loaded extension is a no-op
+        assert app.ext.defer_extension('memory') is True
+        assert 'cement.ext.ext_memory' not in app.ext.get_deferred_extensions()
+
+        assert app.ext.load_deferred_extensions('output', 'bogus') is False
+
+
+def test_lazy_extensions_override_options():
+    class MyApp(TestApp):
+        class Meta:
+            lazy_extensions = True
+            extensions = ['json', 'yaml', 'jinja2', 'mustache']
+            meta_defaults = {
+                'output.json': {'overridable': True},
+                'output.yaml': {'overridable': True},
+            }
+
+    # building the handler override options does not load deferred
+    # extensions whose handlers are not overridable
+    with MyApp(argv=['-o', 'yaml']) as app:
+        app.run()
+        assert app.pargs.output_handler_override == 'yaml'
+        assert 'cement.ext.ext_jinja2' in app.ext.get_deferred_extensions()
+        assert 'cement.ext.ext_mustache' in app.ext.get_deferred_extensions()
+
+    class MyOverridableApp(MyApp):
+        class Meta:
+            meta_defaults = {
+                'output.json': {'overridable': True},
+                'output.jinja2': {'overridable': True},
+            }
+
+    with MyOverridableApp(argv=['-o', 'jinja2']) as app:
+        app.run()
+        assert app.pargs.output_handler_override == 'jinja2'
+        assert 'cement.ext.ext_jinja2' in app.ext.get_loaded_extensions()
+        assert 'cement.ext.ext_mustache' in app.ext.get_deferred_extensions()
+
+
+def test_lazy_extensions_app_registry():
+    class MyApp(TestApp):
+        class Meta:
+            lazy_extensions = True
+            extensions = ['tests.bootstrap']
+            extension_registry = {
+                'tests.bootstrap': [('output', 'bogus')],
+            }
+            handler_override_options = None
+
+    with MyApp() as app:
+        assert 'tests.bootstrap' in app.ext.get_deferred_extensions()
+        with pytest.raises(InterfaceError, match="handlers.* does not exist"):
+            app.handler.get('output', 'bogus')
+        assert 'tests.bootstrap' in app.ext.get_loaded_extensions()
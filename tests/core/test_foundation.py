@@ -1,11 +1,13 @@
 
+import asyncio
 import json
 import os
+import pickle
 import platform
 import re
 import signal
 import sys
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -19,6 +21,7 @@ from cement.core.foundation import (
 )
 from cement.core.handler import Handler
 from cement.core.interface import Interface
+from cement.core.output import OutputHandler, OutputInterface
 from cement.utils import fs, misc, test
 from cement.utils.misc import init_defaults, minimal_logger
 
@@ -443,6 +446,95 @@ def test_last_rendered():
         assert app.last_rendered == ({'foo': 'bar'}, output_text)
 
 
+def test_render_stream(tmp):
+    class ChunkedOutputHandler(OutputHandler):
+        class Meta:
+            label = 'chunked'
+
+        def render(self, data, **kw):
+            return ''.join(self.render_iter(data, **kw))
+
+        def render_iter(self, data, **kw):
+            for key, value in data.items():
+                yield f'{key}={value}\n'
+
+    chunks = []
+
+    def post_render(app, out_text):
+        chunks.append(out_text)
+        return out_text.upper()
+
+    data = {'foo': 'bar', 'baz': 'qux'}
+    with TestApp(handlers=[ChunkedOutputHandler], output_handler='chunked') as app:
+        app.hook.register('post_render', post_render)
+        app.run()
+
+        with open(tmp.file, 'w') as f:
+            assert app.render(data, out=f, stream=True) == ''
+        with open(tmp.file) as f:
+            assert f.read() == 'FOO=BAR\nBAZ=QUX\n'
+        assert chunks == ['foo=bar\n', 'baz=qux\n']
+        assert app.last_rendered == (data, None)
+
+        # the reader went away (i.e. `myapp | head`)
+        out = Mock()
+        out.write.side_effect = [None, BrokenPipeError]
+        app.render(dict(a=1, b=2, c=3), out=out, stream=True)
+        assert out.write.call_count == 2
+
+        # a closed stdout is pointed to devnull, so that python does not fail
+        # again flushing it at exit
+        class ClosedPipe:
+            def __init__(self, f):
+                self.fileno = f.fileno
+
+            def write(self, text):
+                raise BrokenPipeError
+
+        with open(tmp.file, 'w') as f:
+            stdout = ClosedPipe(f)
+            with patch('sys.stdout', stdout):
+                app.render(data, out=stdout, stream=True)
+            os.write(f.fileno(), b'discarded')
+        assert os.stat(tmp.file).st_size == 0
+
+        stdout = Mock(spec=['write'])
+        stdout.write.side_effect = BrokenPipeError
+        with patch('sys.stdout', stdout):
+            app.render(data, out=stdout, stream=True)
+
+        # the default render_iter() of the dummy handler yields nothing
+        with open(tmp.file, 'w') as f:
+            app.render(data, out=f, stream=True, handler='dummy')
+        with open(tmp.file) as f:
+            assert f.read() == ''
+
+    # handlers implementing the interface without render_iter()
+    class PlainOutputHandler(OutputInterface, Handler):
+        class Meta:
+            label = 'plain'
+
+        def render(self, data, **kw):
+            return 'plain'
+
+    with TestApp(handlers=[PlainOutputHandler], output_handler='plain') as app:
+        app.run()
+        with open(tmp.file, 'w') as f:
+            app.render(data, out=f, stream=True)
+        with open(tmp.file) as f:
+            assert f.read() == 'plain'
+
+    with TestApp() as app:
+        app.run()
+
+        with pytest.raises(TypeError, match="must be a 'file' like object"):
+            app.render(data, out='bogus', stream=True)
+
+    with TestApp(output_handler=None) as app:
+        app.output = None
+        assert app.render(data, stream=True) == ''
+
+
 def test_close_with_code():
     with pytest.raises(SystemExit) as e:
         with TestApp(exit_on_close=True) as app:
@@ -594,6 +686,126 @@ def test_reload():
         app.run()
 
 
+def test_reload_incremental(tmp, rando):
+    conf_path = os.path.join(tmp.dir, 'test.conf')
+
+    def write(content):
+        with open(conf_path, 'w') as f:
+            f.write(content)
+        # make sure the modification is detected on fast filesystems
+        st = os.stat(conf_path)
+        os.utime(conf_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000))
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_files = [conf_path]
+            reload_incremental = True
+
+    write(f"[{rando}]\nfoo = bar\n[log.logging]\nlevel = info\n")
+    with ThisTestApp() as app:
+        app.hook.define('bogus_hook1')
+        assert app.config.get(rando, 'foo') == 'bar'
+        assert app.log.get_level() == 'INFO'
+        log = app.log
+
+        # nothing changed
+        with patch.object(app, '_unlay_cement') as unlay:
+            app.reload()
+            assert not unlay.called
+
+        # only the log handler is setup again
+        write(f"[{rando}]\nfoo = baz\n[log.logging]\nlevel = warning\n")
+        with patch.object(app.output, '_setup') as output_setup:
+            app.reload()
+            assert not output_setup.called
+        assert app.hook.defined('bogus_hook1') is True
+        assert app.log is log
+        assert app.config.get(rando, 'foo') == 'baz'
+        assert app.log.get_level() == 'WARNING'
+
+        # environment variable overrides are not merged as file settings
+        env_var = f'{rando}_FOO'.upper()
+        write(f"[{rando}]\nfoo = qux\n[log.logging]\nlevel = warning\n")
+        with patch.dict(os.environ, {env_var: 'from-env'}):
+            app.reload()
+            assert app.config.get(rando, 'foo') == 'from-env'
+        assert app.config.get(rando, 'foo') == 'qux'
+        with patch.object(app, '_unlay_cement') as unlay:
+            app.reload()
+            assert not unlay.called
+
+        # changing the default section requires a full reload
+        write(f"[DEFAULT]\nshared = value\n[{rando}]\nfoo = qux\n"
+              "[log.logging]\nlevel = warning\n")
+        app.reload()
+        assert app.hook.defined('bogus_hook1') is False
+        assert app.log is not log
+        assert app.config.get(rando, 'shared') == 'value'
+        app.hook.define('bogus_hook1')
+        log = app.log
+
+        # removing a setting requires a full reload
+        write("[log.logging]\nlevel = warning\n")
+        app.reload()
+        assert app.hook.defined('bogus_hook1') is False
+        assert app.log is not log
+        assert not app.config.has_option(rando, 'foo')
+
+        # as does changing a setting that overrides App.Meta
+        log = app.log
+        write(f"[log.logging]\nlevel = warning\n[{rando}]\ndebug = true\n")
+        app.reload()
+        assert app.log is not log
+        assert app.debug is True
+
+
+def test_reload_incremental_full_fallbacks(tmp, rando):
+    conf_dir = os.path.join(tmp.dir, 'conf.d')
+    conf_path = os.path.join(tmp.dir, 'test.conf')
+    os.makedirs(conf_dir)
+    with open(conf_path, 'w') as f:
+        f.write(f"[{rando}]\nfoo = bar\n")
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_files = [conf_path]
+            config_dirs = [conf_dir]
+            reload_incremental = True
+
+    with ThisTestApp() as app:
+        # a config file added to a config dir
+        with open(os.path.join(conf_dir, 'new.conf'), 'w') as f:
+            f.write(f"[{rando}]\nnew = value\n")
+        app.reload()
+        assert app.config.get(rando, 'new') == 'value'
+
+        # nothing changed since the full reload
+        with patch.object(app, '_unlay_cement') as unlay:
+            app.reload()
+            assert not unlay.called
+
+        # a config file that can no longer be stat'ed is parsed again, and
+        # its removed settings require a full reload
+        os.remove(conf_path)
+        with patch.object(app, '_unlay_cement', wraps=app._unlay_cement) as unlay:
+            app.reload()
+            assert unlay.called
+        assert not app.config.has_option(rando, 'foo')
+
+    # config files that were not parsed individually (i.e. from a snapshot)
+    class SnapshotTestApp(ThisTestApp):
+        class Meta:
+            config_snapshot = True
+            config_snapshot_file = os.path.join(tmp.dir, 'config.snapshot')
+
+    with SnapshotTestApp() as app:
+        with patch.object(app, '_unlay_cement', wraps=app._unlay_cement) as unlay:
+            app.reload()
+            assert unlay.called
+
+
 def test_run_forever():
     if platform.system().lower() in ['windows']:
         pytest.skip('Unable to test run_forever on Windows')
@@ -776,6 +988,106 @@ def test_config_dirs(tmp, rando):
         assert app.config.get(app._meta.label, 'foo') == rando
 
 
+def test_config_snapshot(tmp, rando):
+    conf_path = os.path.join(tmp.dir, 'test.conf')
+    snapshot_path = os.path.join(tmp.dir, 'config.snapshot')
+    defaults = init_defaults(rando)
+    defaults[rando]['bar'] = 'default-bar'
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_files = [conf_path]
+            config_defaults = defaults
+            config_snapshot = True
+            config_snapshot_file = snapshot_path
+
+    with open(conf_path, 'w') as f:
+        f.write(f"[{rando}]\nfoo = {rando}\n[other]\nkey = value\n")
+
+    with ThisTestApp() as app:
+        assert os.path.exists(snapshot_path)
+        assert app.config.get(rando, 'foo') == rando
+        assert app.config.get(rando, 'bar') == 'default-bar'
+
+    # nothing changed, so the files are not parsed again
+    target = 'cement.ext.ext_configparser.ConfigParserConfigHandler._parse_file'
+    with patch(target) as parse:
+        with ThisTestApp() as app:
+            assert app.config.get(rando, 'foo') == rando
+            assert app.config.get('other', 'key') == 'value'
+            assert app.config.get(rando, 'bar') == 'default-bar'
+        assert not parse.called
+
+    # changing a file invalidates the snapshot, and environment variable
+    # overrides are applied on top of it rather than stored in it
+    with open(conf_path, 'w') as f:
+        f.write(f"[{rando}]\nfoo = changed\n")
+    env_var = f'{rando}_FOO'.upper()
+    with patch.dict(os.environ, {env_var: 'from-env'}):
+        with ThisTestApp() as app:
+            assert app.config.get(rando, 'foo') == 'from-env'
+            assert not app.config.has_section('other')
+
+        with patch(target) as parse:
+            with ThisTestApp() as app:
+                assert app.config.get(rando, 'foo') == 'from-env'
+            assert not parse.called
+
+    with patch(target) as parse:
+        with ThisTestApp() as app:
+            assert app.config.get(rando, 'foo') == 'changed'
+        assert not parse.called
+
+    # an unreadable snapshot is replaced
+    with open(snapshot_path, 'w') as f:
+        f.write('bogus')
+    with ThisTestApp() as app:
+        assert app.config.get(rando, 'foo') == 'changed'
+
+    # failing to write the snapshot is not fatal
+    os.remove(snapshot_path)
+    with patch('cement.core.foundation.os.replace', side_effect=OSError):
+        with ThisTestApp() as app:
+            assert app.config.get(rando, 'foo') == 'changed'
+    assert not os.path.exists(snapshot_path)
+
+
+def test_config_snapshot_default_section(tmp, rando):
+    conf_path = os.path.join(tmp.dir, 'test.conf')
+    snapshot_path = os.path.join(tmp.dir, 'config.snapshot')
+    with open(conf_path, 'w') as f:
+        f.write(f"[DEFAULT]\nshared = default\n[{rando}]\nfoo = bar\n"
+                "[other]\nshared = other\n")
+
+    class ThisTestApp(TestApp):
+        class Meta:
+            label = rando
+            config_files = [conf_path]
+            config_snapshot = True
+            config_snapshot_file = snapshot_path
+
+    for _i in range(2):
+        with ThisTestApp() as app:
+            assert app.config.get(rando, 'shared') == 'default'
+            assert app.config.get('other', 'shared') == 'other'
+
+    # default settings are not copied into every section
+    with open(snapshot_path, 'rb') as f:
+        config = pickle.load(f)['config']
+    assert config['DEFAULT'] == {'shared': 'default'}
+    assert config[rando] == {'foo': 'bar'}
+    assert config['other'] == {'shared': 'other'}
+
+
+def test_config_snapshot_default_file(tmp, rando):
+    with patch('cement.core.foundation.fs.HOME_DIR', tmp.dir):
+        with TestApp(label=rando, config_snapshot=True) as app:
+            path = os.path.join(tmp.dir, f'.{rando}', 'cache', 'config.snapshot')
+            assert app._meta.config_snapshot_file == path
+            assert os.path.exists(path)
+
+
 def test_core_system_template_dirs(tmp, rando):
     class ThisTestApp(TestApp):
         class Meta:
@@ -937,3 +1249,102 @@ def test_plugin_dirs(tmp, rando):
     with ThisTestApp() as app:
         app.run()
         assert tmp.dir in app._meta.plugin_dirs
+
+
+def test_run_async_controller():
+    loops = []
+
+    class MyController(Controller):
+        class Meta:
+            label = 'base'
+
+        @ex()
+        async def async_cmd(self):
+            loops.append(asyncio.get_running_loop())
+            await asyncio.sleep(0)
+            return 'async result'
+
+    async def async_hook(app):
+        loops.append(asyncio.get_running_loop())
+
+    class MyApp(TestApp):
+        class Meta:
+            handlers = [MyController]
+            argv = ['async-cmd']
+            hooks = [
+                ('pre_run', async_hook),
+                ('post_run', async_hook),
+                ('pre_close', async_hook),
+                ('post_close', async_hook),
+            ]
+
+    with MyApp() as app:
+        assert app.run() == 'async result'
+        loop = app._loop
+
+    # everything ran on one event loop, which is closed on close()
+    assert len(loops) == 5
+    assert all(x is loop for x in loops)
+    assert loop.is_closed()
+    assert app._loop is None
+
+
+def test_run_async():
+    class MyController(Controller):
+        class Meta:
+            label = 'base'
+
+        @ex()
+        async def async_cmd(self):
+            await asyncio.sleep(0)
+            return 'async result'
+
+        @ex()
+        def sync_cmd(self):
+            return 'sync result'
+
+    hook = Mock()
+
+    async def async_hook(app):
+        hook(app)
+
+    class MyApp(TestApp):
+        class Meta:
+            handlers = [MyController]
+            hooks = [
+                ('pre_run', async_hook),
+                ('post_run', async_hook),
+                ('pre_close', async_hook),
+                ('post_close', async_hook),
+            ]
+
+    async def main(argv):
+        app = MyApp(argv=argv)
+        app.setup()
+        res = await app.run_async()
+        await app.close_async()
+        return res
+
+    assert asyncio.run(main(['async-cmd'])) == 'async result'
+    assert hook.call_count == 4
+    assert asyncio.run(main(['sync-cmd'])) == 'sync result'
+
+
+def test_run_in_running_loop():
+    class MyController(Controller):
+        class Meta:
+            label = 'base'
+
+        @ex()
+        async def async_cmd(self):
+            pass
+
+    async def main():
+        with MyApp(handlers=[MyController], argv=['async-cmd']) as app:
+            app.run()
+
+    class MyApp(TestApp):
+        pass
+
+    with pytest.raises(FrameworkError, match='use `await app.run_async\\(\\)`'):
+        asyncio.run(main())
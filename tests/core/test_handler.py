@@ -1,4 +1,6 @@
 
+import threading
+
 from pytest import raises
 
 from cement.core.exc import FrameworkError, InterfaceError
@@ -214,3 +216,181 @@ def test_list_bogus_interface():
     with raises(InterfaceError, match='Interface .* does not exist.'):
         with TestApp() as app:
             app.handler.list('bogus')
+
+
+class ScopedOutputHandler(DummyOutputHandler):
+    class Meta:
+        label = 'scoped'
+        scope = 'app'
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.setup_count = 0
+        self.torn_down = False
+
+    def _setup(self, app):
+        super()._setup(app)
+        self.setup_count += 1
+
+    def _teardown(self):
+        assert self.torn_down is False
+        self.torn_down = True
+
+    def render(self, data, **kw):
+        return 'scoped'
+
+
+def test_scope_call():
+    with TestApp() as app:
+        h1 = app.handler.resolve('output', 'dummy', setup=True)
+        h2 = app.handler.resolve('output', 'dummy', setup=True)
+        assert h1 is not h2
+
+
+def test_scope_app():
+    with TestApp(handlers=[ScopedOutputHandler]) as app:
+        h1 = app.handler.resolve('output', 'scoped', setup=True)
+        h2 = app.handler.resolve('output', ScopedOutputHandler, setup=True)
+        assert h1 is h2
+        assert h1.setup_count == 1
+
+        # not cached until it has been setup
+        h3 = app.handler.resolve('output', 'scoped', meta_defaults=dict(foo='bar'))
+        h4 = app.handler.resolve('output', 'scoped', meta_defaults=dict(foo='bar'))
+        assert h3 is not h4
+        assert h3 is not h1
+
+        # cached per meta_defaults
+        h5 = app.handler.resolve('output', 'scoped', setup=True,
+                                 meta_defaults=dict(foo='bar'))
+        h6 = app.handler.resolve('output', 'scoped', setup=True,
+                                 meta_defaults=dict(foo='bar'))
+        assert h5 is h6
+        assert h5 is not h1
+
+        # render() reuses the instance
+        for _ in range(3):
+            assert app.render({}, handler='scoped', out=None) == 'scoped'
+        assert h1.setup_count == 1
+
+    assert h1.torn_down is True
+    assert h5.torn_down is True
+
+
+def test_scope_thread():
+    class ThreadScopedOutputHandler(ScopedOutputHandler):
+        class Meta:
+            label = 'thread_scoped'
+            scope = 'thread'
+
+    with TestApp(handlers=[ThreadScopedOutputHandler]) as app:
+        res = []
+
+        def resolve():
+            h1 = app.handler.resolve('output', 'thread_scoped', setup=True)
+            h2 = app.handler.resolve('output', 'thread_scoped', setup=True)
+            assert h1 is h2
+            res.append(h1)
+
+        threads = [threading.Thread(target=resolve) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(res)) == 3
+
+    assert all(h.torn_down for h in res)
+
+
+def test_teardown_primary_handlers():
+    class CallScopedOutputHandler(ScopedOutputHandler):
+        class Meta:
+            label = 'call_scoped'
+            scope = 'call'
+
+    with TestApp(handlers=[CallScopedOutputHandler],
+                 output_handler='call_scoped') as app:
+        h1 = app.output
+        h2 = app.handler.resolve('output', 'call_scoped', setup=True)
+        assert h1 is not h2
+
+    assert h1.torn_down is True
+    assert h2.torn_down is False
+
+    # primary handlers that are also reused are torn down once
+    with TestApp(handlers=[ScopedOutputHandler],
+                 output_handler='scoped') as app:
+        h3 = app.output
+        assert app.handler.resolve('output', 'scoped', setup=True) is h3
+
+    assert h3.torn_down is True
+
+
+def test_scope_invalid():
+    class BogusScopedOutputHandler(DummyOutputHandler):
+        class Meta:
+            label = 'bogus_scoped'
+            scope = 'bogus'
+
+    msg = "Invalid handler scope 'bogus'"
+    with raises(FrameworkError, match=msg):
+        with TestApp(handlers=[BogusScopedOutputHandler]) as app:
+            app.handler.resolve('output', 'bogus_scoped', setup=True)
+
+
+def test_registry_view():
+    with TestApp() as app:
+        registry = app.handler.registry
+        assert registry['output']['dummy'] is DummyOutputHandler
+        assert app.handler.registry is registry
+
+        with raises(TypeError):
+            registry['output']['dummy'] = None
+
+        # inner views are live
+        class MyOutputHandler(DummyOutputHandler):
+            class Meta:
+                label = 'my_output_handler'
+
+        app.handler.register(MyOutputHandler)
+        assert registry['output']['my_output_handler'] is MyOutputHandler
+        assert app.handler.registry is registry
+
+
+def test_lookup_stats():
+    with TestApp() as app:
+        before = app.handler.stats()
+        app.handler.get('output', 'dummy')
+        app.handler.registered('output', 'dummy')
+        app.handler.registered('bogus', 'dummy')
+        app.handler.resolve('output', 'dummy')
+        app.handler.list('output')
+        after = app.handler.stats()
+        assert after['get'] - before['get'] == 2
+        assert after['registered'] - before['registered'] == 2
+        assert after['resolve'] - before['resolve'] == 1
+        assert after['list'] - before['list'] == 1
+        assert app.interface.stats()['defined'] > 0
+
+
+def test_freeze_handlers():
+    class MyOutputHandler(DummyOutputHandler):
+        class Meta:
+            label = 'my_output_handler'
+
+    with TestApp() as app:
+        # not frozen by default
+        app.handler.register(MyOutputHandler)
+
+    with TestApp(freeze_handlers=True) as app:
+        msg = 'the handler registry is frozen'
+        with raises(InterfaceError, match=msg):
+            app.handler.register(MyOutputHandler)
+
+    with TestApp(freeze_handlers=True,
+                 lazy_extensions=True,
+                 extensions=['memory'],
+                 handler_override_options=None) as app:
+        assert not app.handler.registered('cache', 'memory')
+        assert app.handler.get('cache', 'memory').Meta.label == 'memory'
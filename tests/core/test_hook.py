@@ -1,5 +1,6 @@
 """Tests for cement.core.hook."""
 
+import asyncio
 from unittest.mock import Mock
 
 from pytest import raises
@@ -131,3 +132,124 @@ def test_generate_type_hook():
 def test_list():
     with TestApp() as app:
         assert 'pre_setup' in app.hook.list()
+
+
+def test_register_keeps_weight_order():
+    def hook_one():
+        return 1
+
+    def hook_two():
+        return 2
+
+    def hook_three():
+        return 3
+
+    with TestApp() as app:
+        app.hook.define('test_hook')
+        app.hook.register('test_hook', hook_one, weight=10)
+        app.hook.register('test_hook', hook_two, weight=-10)
+        app.hook.register('test_hook', hook_three, weight=10)
+
+        # sorted on registration, equal weights keep registration order
+        assert [x[2] for x in app.hook.__hooks__['test_hook']] == \
+            [hook_two, hook_one, hook_three]
+        assert list(app.hook.run('test_hook')) == [2, 1, 3]
+
+
+def test_run_call_list_cache():
+    def hook_one():
+        return 1
+
+    def hook_two():
+        return 2
+
+    with TestApp() as app:
+        app.hook.define('test_hook')
+        app.hook.register('test_hook', hook_one, weight=10)
+
+        call_list = app.hook._get_call_list('test_hook')
+        assert app.hook._get_call_list('test_hook') is call_list
+
+        # registration invalidates the cached call list
+        app.hook.register('test_hook', hook_two, weight=-10)
+        assert app.hook._get_call_list('test_hook') is not call_list
+        assert list(app.hook.run('test_hook')) == [2, 1]
+
+        # as does appending directly to the hook list
+        app.hook.__hooks__['test_hook'].append((-99, 'hook_one', hook_one))
+        assert list(app.hook.run('test_hook')) == [1, 2, 1]
+
+
+def test_run_async():
+    async def hook_one():
+        await asyncio.sleep(0)
+        return 1
+
+    def hook_two():
+        return 2
+
+    def hook_three():
+        yield from [3, 3]
+
+    async def hook_four():
+        for i in [4, 4]:
+            yield i
+
+    with TestApp() as app:
+        app.hook.define('test_hook')
+        app.hook.register('test_hook', hook_four, weight=4)
+        app.hook.register('test_hook', hook_three, weight=3)
+        app.hook.register('test_hook', hook_two, weight=2)
+        app.hook.register('test_hook', hook_one, weight=1)
+
+        async def main():
+            return [res async for res in app.hook.run_async('test_hook')]
+
+        assert asyncio.run(main()) == [1, 2, 3, 3, 4, 4]
+
+
+def test_run_async_concurrent():
+    async def hook_slow(results):
+        await asyncio.sleep(0.2)
+        results.append('slow')
+        return 'slow'
+
+    async def hook_fast(results):
+        results.append('fast')
+        return 'fast'
+
+    async def hook_last(results):
+        results.append('last')
+        return 'last'
+
+    with TestApp() as app:
+        app.hook.define('test_hook')
+        app.hook.register('test_hook', hook_last, weight=1)
+        app.hook.register('test_hook', hook_slow)
+        app.hook.register('test_hook', hook_fast)
+
+        async def main(concurrent):
+            results = []
+            yielded = [res async for res in app.hook.run_async(
+                'test_hook', results, concurrent=concurrent
+            )]
+            return (yielded, results)
+
+        # equal weight hooks ran together, but yield in registration order
+        yielded, results = asyncio.run(main(concurrent=True))
+        assert yielded == ['slow', 'fast', 'last']
+        assert results == ['fast', 'slow', 'last']
+
+        yielded, results = asyncio.run(main(concurrent=False))
+        assert yielded == ['slow', 'fast', 'last']
+        assert results == ['slow', 'fast', 'last']
+
+
+def test_run_async_bad_hook():
+    async def main(app):
+        async for _res in app.hook.run_async('some_bogus_hook'):
+            pass
+
+    with TestApp() as app:
+        with raises(FrameworkError, match='Hook name .* is not defined!'):
+            asyncio.run(main(app))
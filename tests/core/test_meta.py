@@ -1,5 +1,7 @@
 
-from cement.core.meta import Meta, MetaMixin
+from time import perf_counter
+
+from cement.core.meta import Meta, MetaMixin, _get_meta_defaults, reset_meta_cache
 
 
 class TestMeta:
@@ -20,3 +22,47 @@ class TestMetaMixin:
         assert hasattr(sc, '_meta')
         assert sc._meta.k1 == 'v1'
         assert sc._meta.k2 == 'not-v2'
+
+    def test_metamixin_cache(self):
+        class SomeClass(MetaMixin):
+            class Meta:
+                k1 = 'v1'
+                k2 = ['v2']
+
+        class SubClass(SomeClass):
+            class Meta:
+                k2 = ['sub-v2']
+                k3 = 'v3'
+
+        sc1 = SubClass(k1='not-v1')
+        sc2 = SubClass()
+        assert _get_meta_defaults(SubClass) == dict(k1='v1', k2=['sub-v2'], k3='v3')
+        assert sc1._meta.k1 == 'not-v1'
+        assert sc2._meta.k1 == 'v1'
+        assert sc2._meta.k2 is SubClass.Meta.k2
+
+        # instance meta does not leak into the class defaults
+        sc2._meta.k3 = 'changed'
+        assert SubClass()._meta.k3 == 'v3'
+
+        # class meta changes require a reset
+        SubClass.Meta.k3 = 'new-v3'
+        assert SubClass()._meta.k3 == 'v3'
+        reset_meta_cache()
+        assert SubClass()._meta.k3 == 'new-v3'
+
+    def test_metamixin_deep_inheritance(self):
+        klass = MetaMixin
+        for i in range(50):
+            meta = type('Meta', (), {f'k{i}': i})
+            klass = type(f'Class{i}', (klass,), dict(Meta=meta))
+
+        obj = klass(k0='zero')
+        assert obj._meta.k0 == 'zero'
+        assert obj._meta.k49 == 49
+
+        start = perf_counter()
+        for _ in range(1000):
+            klass(k0='zero')
+        per_call = (perf_counter() - start) / 1000
+        assert per_call < 0.00005, f"{per_call * 1e6:.1f}us per instantiation"
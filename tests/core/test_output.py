@@ -1,5 +1,5 @@
 
-from cement.core.output import OutputHandler, OutputInterface
+from cement.core.output import OutputHandler, OutputInterface, buffer_chunks
 
 # module tests
 
@@ -21,6 +21,25 @@ class TestOutputHandler:
         assert h._meta.interface == 'output'
         assert h._meta.label == 'my_output_handler'
 
+    def test_render_iter(self):
+        class MyOutputHandler(OutputHandler):
+            class Meta:
+                label = 'my_output_handler'
+
+            def render(self, data, *args, **kw):
+                return data['text']
+
+        h = MyOutputHandler()
+        assert list(h.render_iter({'text': 'foo'})) == ['foo']
+        assert list(h.render_iter({'text': None})) == []
+
+
+def test_buffer_chunks():
+    chunks = ['a'] * 10
+    assert list(buffer_chunks(chunks, size=4)) == ['aaaa', 'aaaa', 'aa']
+    assert list(buffer_chunks(chunks)) == ['a' * 10]
+    assert list(buffer_chunks([])) == []
+
 
 # app functionality and coverage tests
 
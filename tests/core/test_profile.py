@@ -0,0 +1,99 @@
+"""Tests for cement.core.profile."""
+
+import json
+
+from pytest import raises
+
+from cement.core.foundation import TestApp
+from cement.core.profile import Profiler
+
+# module tests
+
+class TestProfiler:
+    def test_report(self):
+        p = Profiler('myapp')
+        with p.timeit('setup', 'fast'):
+            pass
+        with p.timeit('setup', 'slow'):
+            sum(range(100000))
+
+        report = p.report()
+        assert [x['label'] for x in report] == ['slow', 'fast']
+        assert report[0]['category'] == 'setup'
+
+        text = p.render_text()
+        assert text.startswith('Cement Profile Report (myapp)')
+        assert text.index('slow') < text.index('fast')
+
+        data = json.loads(p.render_json())
+        assert data['label'] == 'myapp'
+        assert data['timings'] == report
+
+    def test_timeit_exception(self):
+        p = Profiler('myapp')
+        with raises(ValueError, match='broken'):
+            with p.timeit('setup', 'broken'):
+                raise ValueError('broken')
+        assert p.report()[0]['label'] == 'broken'
+
+
+# app functionality and coverage tests
+
+def test_profile_disabled():
+    with TestApp() as app:
+        assert app.profiler is None
+
+
+def test_profile(tmp, capsys):
+    def my_hook(app):
+        pass
+
+    config_file = f'{tmp.dir}/myapp.conf'
+    with open(config_file, 'w') as f:
+        f.write('[myapp]\nfoo = bar\n')
+
+    with open(f'{tmp.dir}/myplugin.py', 'w') as f:
+        f.write('def load(app):\n    pass\n')
+
+    json_file = f'{tmp.dir}/profile.json'
+
+    class MyApp(TestApp):
+        class Meta:
+            label = 'myapp'
+            profile = True
+            profile_file = json_file
+            config_files = [config_file]
+            extensions = ['json']
+            plugins = ['myplugin']
+            plugin_dir = tmp.dir
+            plugin_module = None
+            hooks = [('pre_run', my_hook)]
+
+    with MyApp() as app:
+        app.run()
+
+    labels = [(x['category'], x['label']) for x in app.profiler.report()]
+    assert ('setup', '_setup_config_handler') in labels
+    assert ('extension', 'cement.ext.ext_json') in labels
+    assert ('config', config_file) in labels
+    assert ('plugin', 'myplugin') in labels
+    assert ('hook', f'pre_run: {__name__}.my_hook') in labels
+
+    err = capsys.readouterr().err
+    assert err.count('Cement Profile Report (myapp)') == 2
+
+    with open(json_file) as f:
+        data = json.load(f)
+    assert data['label'] == 'myapp'
+    assert 'pre_run: tests.core.test_profile.my_hook' in \
+        [x['label'] for x in data['timings']]
+
+
+def test_profile_env_var(monkeypatch):
+    monkeypatch.setenv('CEMENT_PROFILE', '1')
+    with TestApp() as app:
+        assert app.profiler is not None
+
+    monkeypatch.setenv('CEMENT_PROFILE', '0')
+    with TestApp(profile=True) as app:
+        assert app.profiler is None
@@ -1,6 +1,12 @@
 
 import os
+import threading
+from time import sleep
+from unittest.mock import patch
 
+from watchdog.observers.api import BaseObserver
+
+from cement.core.exc import FrameworkError
 from cement.core.template import TemplateHandler, TemplateInterface
 from cement.utils.test import TestApp, raises
 
@@ -105,6 +111,76 @@ def test_copy(tmp, rando):
                           force=True)
 
 
+def test_copy_parallel_incremental(tmp, rando):
+    src = os.path.join(tmp.dir, 'src')
+    dest = os.path.join(tmp.dir, 'dest')
+    os.makedirs(os.path.join(src, 'sub'))
+    for i in range(10):
+        with open(os.path.join(src, 'sub', f'file{i}'), 'w') as f:
+            f.write(f'{i} {{{{ rando }}}}')
+    with open(os.path.join(src, 'binary.bin'), 'wb') as f:
+        f.write(bytes(range(256)))
+
+    defaults = {'template.jinja2': {'copy_workers': 4, 'hardlink_excluded': True}}
+    with TestApp(extensions=['jinja2'], template_handler='jinja2',
+                 meta_defaults=defaults) as app:
+        app.template.copy(src, dest, {'rando': rando}, exclude=[r'.*\.bin$'])
+        for i in range(10):
+            with open(os.path.join(dest, 'sub', f'file{i}')) as f:
+                assert f.read() == f'{i} {rando}'
+        assert os.path.samefile(os.path.join(src, 'binary.bin'),
+                                os.path.join(dest, 'binary.bin'))
+
+        # files that are up to date are not written again
+        path = os.path.join(dest, 'sub', 'file0')
+        os.utime(path, ns=(0, 0))
+        app.template.copy(src, dest, {'rando': rando}, exclude=[r'.*\.bin$'],
+                          force=True)
+        assert os.stat(path).st_mtime_ns == 0
+
+        app.template.copy(src, dest, {'rando': 'changed'}, exclude=[r'.*\.bin$'],
+                          force=True)
+        with open(path) as f:
+            assert f.read() == '0 changed'
+
+    with TestApp(extensions=['jinja2'], template_handler='jinja2') as app:
+        # copied rather than hard linked (copy_file_range, or shutil)
+        dest = os.path.join(tmp.dir, 'dest2')
+        app.template.copy(src, dest, {'rando': rando}, exclude=[r'.*\.bin$'])
+        copied = os.path.join(dest, 'binary.bin')
+        assert not os.path.samefile(os.path.join(src, 'binary.bin'), copied)
+        with open(copied, 'rb') as f:
+            assert f.read() == bytes(range(256))
+
+        # unmodified excluded files are not copied again
+        with patch('cement.core.template.shutil.copy') as mock_copy:
+            app.template.copy(src, dest, {'rando': rando}, exclude=[r'.*\.bin$'],
+                              force=True)
+            assert not mock_copy.called
+
+        # fallbacks
+        app.template._meta.hardlink_excluded = True
+        os.remove(copied)
+        with patch('cement.core.template.os.link', side_effect=OSError('no links')), \
+                patch('cement.core.template.os.copy_file_range',
+                      side_effect=OSError('not supported'), create=True):
+            app.template.copy(src, dest, {'rando': rando}, exclude=[r'.*\.bin$'],
+                              force=True)
+        with open(copied, 'rb') as f:
+            assert f.read() == bytes(range(256))
+
+        # copy_file_range copying nothing (i.e. unsupported file systems)
+        app.template._meta.hardlink_excluded = False
+        os.remove(copied)
+        with patch('cement.core.template.os.copy_file_range', return_value=0,
+                   create=True) as copy_file_range:
+            app.template.copy(src, dest, {'rando': rando}, exclude=[r'.*\.bin$'],
+                              force=True)
+            assert copy_file_range.call_count == 1
+        with open(copied, 'rb') as f:
+            assert f.read() == bytes(range(256))
+
+
 def test_copy_source_not_a_directory(tmp):
     # `template.copy()` requires `src` to be an existing directory; passing
     # a regular file (or a non-existent path) must raise NotADirectoryError
@@ -135,3 +211,118 @@ def test_load_template_from_file_does_not_exist(tmp):
         app.run()
         res = app.template._load_template_from_file('bogus')
         assert res == (None, None)
+
+
+def test_load_template_index(tmp, rando):
+    # dirs are reversed at setup, the last one has precedence
+    low = os.path.join(tmp.dir, 'low')
+    high = os.path.join(tmp.dir, 'high')
+    os.makedirs(low)
+    os.makedirs(high)
+    path = os.path.join(low, 'test.txt')
+    with open(path, 'w') as f:
+        f.write(rando)
+
+    with TestApp(template_dirs=[low, high]) as app:
+        assert app.template.load('test.txt') == (rando, 'directory', path)
+        # only indexed while watching
+        assert app.template._index == {}
+
+        # served from cache while the file is unchanged
+        with patch('cement.core.template.open') as mock_open:
+            assert app.template.load('/test.txt')[0] == rando
+            assert not mock_open.called
+
+        # modified files are read again
+        with open(path, 'w') as f:
+            f.write('changed')
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        assert app.template.load('test.txt')[0] == 'changed'
+
+        # templates created later in a higher precedence dir take over
+        high_path = os.path.join(high, 'test.txt')
+        with open(high_path, 'w') as f:
+            f.write('high')
+        assert app.template.load('test.txt') == ('high', 'directory', high_path)
+
+        # changing the template dirs rebuilds the index
+        app.remove_template_dir(high)
+        assert app.template.load('test.txt')[2] == path
+        app.add_template_dir(high)
+        assert app.template.load('test.txt')[2] == path
+
+        # removed files are resolved again
+        os.remove(path)
+        assert app.template.load('test.txt')[2] == high_path
+
+
+def test_load_template_from_module_cache():
+    with TestApp(template_module='tests.data.templates') as app:
+        res = app.template.load('test_template.jinja2')
+        assert res[1] == 'module'
+        with patch('cement.core.template.pkgutil.get_data') as get_data:
+            assert app.template.load('test_template.jinja2') == res
+            assert not get_data.called
+
+
+def test_watch_template_dirs(tmp, rando):
+    path = os.path.join(tmp.dir, 'test.txt')
+    with open(path, 'w') as f:
+        f.write(rando)
+
+    defaults = {'template.dummy': {'watch_template_dirs': True}}
+    with TestApp(template_dirs=[tmp.dir], meta_defaults=defaults) as app:
+        assert app.template.load('test.txt')[0] == rando
+        assert app.template._observer is not None
+        assert app.template._index['test.txt'] == path
+        with raises(FrameworkError, match='Could not locate template'):
+            app.template.load('missing.txt')
+
+        # no stat calls while watching
+        with patch('cement.core.template.os.stat') as stat:
+            assert app.template.load('test.txt')[0] == rando
+            with raises(FrameworkError, match='Could not locate template'):
+                app.template.load('missing.txt')
+            assert not stat.called
+
+        # indexed files removed before the watcher clears the index are
+        # resolved again
+        app.template._index['gone.txt'] = os.path.join(tmp.dir, 'gone.txt')
+        with raises(FrameworkError, match='Could not locate template'):
+            app.template.load('gone.txt')
+        assert app.template._index['gone.txt'] is None
+
+        # changes invalidate the cache
+        with open(os.path.join(tmp.dir, 'missing.txt'), 'w') as f:
+            f.write('found')
+        for _i in range(100):
+            if 'missing.txt' not in app.template._index:
+                break
+            sleep(0.05)
+        assert app.template.load('missing.txt')[0] == 'found'
+        observer = app.template._observer
+
+    # observers are stopped on close
+    assert app.template._observer is None
+    assert not observer.is_alive()
+    assert not any(isinstance(t, BaseObserver) for t in threading.enumerate())
+
+
+def test_load_without_module():
+    with TestApp() as app:
+        app._meta.template_module = None
+        with raises(FrameworkError, match='Could not locate template'):
+            app.template.load('test_template.jinja2')
+
+
+def test_watch_template_dirs_missing_dir(tmp, rando):
+    bogus_dir = os.path.join(tmp.dir, 'bogus')
+    defaults = {'template.dummy': {'watch_template_dirs': True}}
+    with TestApp(template_dirs=[tmp.dir, bogus_dir], meta_defaults=defaults) as app:
+        with raises(FrameworkError, match='Could not locate template'):
+            app.template.load('missing.txt')
+        assert app.template._watching_all is False
+
+        # templates may be created in a directory that is not watched
+        assert 'missing.txt' not in app.template._index
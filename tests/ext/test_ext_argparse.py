@@ -663,6 +663,47 @@ def test_get_exposed_commands():
         assert 'cmd2-two' in app.controller._get_exposed_commands()
 
 
+def test_command_index():
+    class CommandMixin:
+        @expose()
+        def mixin_cmd(self):
+            pass
+
+        @expose()
+        def overridden(self):
+            pass
+
+    class MyController(CommandMixin, ArgparseController):
+        class Meta:
+            label = 'base'
+
+        @property
+        def boom(self):
+            raise AssertionError('properties must not be evaluated')
+
+        @expose()
+        def cmd1(self):
+            pass
+
+        def overridden(self):
+            pass
+
+    class SubController(MyController):
+        @expose(hide=True)
+        def _hidden(self):
+            pass
+
+    assert [c[0] for c in MyController.__cement_commands__] == ['cmd1', 'mixin_cmd']
+    assert MyController.__cement_commands__[0][1] is MyController.cmd1.__cement_meta__
+    assert [c[0] for c in SubController.__cement_commands__] == \
+        ['_hidden', 'cmd1', 'mixin_cmd']
+
+    with TestApp(handlers=[SubController]) as app:
+        app.run()
+        assert app.controller._get_exposed_commands() == ['-hidden', 'cmd1', 'mixin-cmd']
+        assert [c.label for c in app.controller._collect_commands()] == ['cmd1', 'mixin-cmd']
+
+
 def test_hide_help():
     class MyController(ArgparseController):
         class Meta:
@@ -678,3 +719,54 @@ def test_hide_help():
             # help='should not be visible' should not
             # get sent to the parser if hide=True
             mock.assert_called_once_with('hidden')
+
+
+def test_lazy_parsers():
+    class MyBase(Base):
+        class Meta:
+            label = 'base'
+            lazy_parsers = True
+
+    class MyApp(ArgparseApp):
+        class Meta:
+            handlers = [MyBase, Second, Third, Fourth, Fifth, Sixth, Seventh]
+
+    argv = ['--foo=bar', 'third', '--foo3=bar3', 'fifth', 'cmd5']
+    with MyApp(argv=argv) as app:
+        res = app.run()
+        assert res == "Inside Fifth.cmd5"
+        assert app.pargs.foo == 'bar'
+        assert app.pargs.foo3 == 'bar3'
+
+        # only the selected command sub-parsers were built (nested
+        # controller parsers are built during setup)
+        choices = app.controller._get_parser_parent('base').choices
+        assert choices['cmd1']._lazy_parser is None
+        assert choices['cmd2']._lazy_parser is None
+        assert choices['third']._lazy_parser is not None
+
+    with MyApp(argv=['cmd2', '--cmd2-foo=bar']) as app:
+        res = app.run()
+        assert res == "Inside Second.cmd2 : Foo > bar"
+
+        # attribute access after materializing is passed through
+        parser = app.controller._get_parser_parent('base').choices['cmd2']
+        parser.add_argument('--late')
+        parser.epilog = 'late epilog'
+        assert parser.epilog == 'late epilog'
+
+    with MyApp(argv=['third']) as app:
+        res = app.run()
+        assert res == "Inside Third.default"
+
+    # attributes set before materializing are recorded and replayed
+    with MyApp(argv=['cmd1']) as app:
+        app.run()
+        parser = app.controller._get_parser_parent('base').choices['cmd2']
+        assert parser._lazy_parser is None
+        parser.epilog = 'early epilog'
+        parser.add_argument('--early')
+        assert parser._lazy_parser is None
+        assert parser.epilog == 'early epilog'
+        assert parser._lazy_parser is not None
+        assert parser.parse_args(['--early=yes']).early == 'yes'
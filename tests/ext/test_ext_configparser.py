@@ -1,5 +1,9 @@
 
+import io
 import os
+from configparser import NoOptionError, NoSectionError
+
+import pytest
 
 from cement.core.foundation import TestApp
 from cement.ext.ext_configparser import ConfigParserConfigHandler
@@ -76,3 +80,115 @@ def test_get_boolean():
 
         os.environ['TESTAPP_FOOBOOL'] = '1'
         assert app.config['testapp'].getboolean('foobool') is True
+
+
+def test_snapshot_invalidation():
+    with TestApp(config_section='testapp') as app:
+        app.config.set('testapp', 'snap', 'bar')
+        assert app.config.get('testapp', 'snap') == 'bar'
+        assert app.config.get_dict()['testapp']['snap'] == 'bar'
+
+        app.config.set('testapp', 'snap', 'baz')
+        assert app.config.get('testapp', 'snap') == 'baz'
+
+        app.config.merge(dict(testapp=dict(snap='qux')))
+        assert app.config.get_section_dict('testapp')['snap'] == 'qux'
+
+        app.config.remove_option('testapp', 'snap')
+        assert 'snap' not in app.config.get_dict()['testapp']
+        with pytest.raises(NoOptionError):
+            app.config.get('testapp', 'snap')
+
+        app.config.add_section('dummy')
+        assert app.config.get_dict()['dummy'] == {}
+        app.config.remove_section('dummy')
+        assert 'dummy' not in app.config.get_dict()
+        with pytest.raises(NoSectionError):
+            app.config.get_section_dict('dummy')
+
+        # returned dicts are copies
+        app.config.get_dict()['testapp']['snap'] = 'bogus'
+        assert 'snap' not in app.config.get_dict()['testapp']
+
+        app.config.read_file(io.StringIO('[testapp]\nsnap = from-file\n'))
+        assert app.config.get('testapp', 'snap') == 'from-file'
+
+
+def test_snapshot_update_in_place():
+    with TestApp(config_section='testapp') as app:
+        app.config.merge(dict(testapp=dict(num='3', other='1')))
+        assert app.config.get_int('testapp', 'num') == 3
+        assert app.config.get_int('testapp', 'other') == 1
+        snapshot = app.config._get_snapshot()
+
+        # setting and removing keys only drops their own typed values
+        app.config.set('testapp', 'NUM', '4')
+        assert app.config._get_snapshot() is snapshot
+        assert app.config.get('testapp', 'num') == '4'
+        app.config.set('testapp', 'num', '5')
+        assert ('testapp', 'num', 'int') not in app.config._typed
+        assert ('testapp', 'other', 'int') in app.config._typed
+        assert app.config.get_int('testapp', 'num') == 5
+
+        app.config.remove_option('testapp', 'num')
+        assert app.config._get_snapshot() is snapshot
+        assert 'num' not in app.config.get_section_dict('testapp')
+        assert not app.config.remove_option('testapp', 'num')
+
+        # the default section applies to all sections
+        app.config.set('DEFAULT', 'num', '6')
+        assert app.config._get_snapshot() is not snapshot
+        assert app.config.get_int('testapp', 'num') == 6
+        app.config.set('testapp', 'num', '7')
+        app.config.remove_option('testapp', 'num')
+        assert app.config.get('testapp', 'num') == '6'
+
+
+def test_typed_accessors():
+    with TestApp(config_section='testapp') as app:
+        app.config.merge(dict(testapp=dict(
+            num='3', flag='yes', items='a, b,,c', real_list=['x', 'y'],
+        )))
+        assert app.config.get_int('testapp', 'num') == 3
+        assert app.config.get_bool('testapp', 'flag') is True
+        assert app.config.get_list('testapp', 'items') == ['a', 'b', 'c']
+        assert app.config.get_list('testapp', 'real_list') == ['x', 'y']
+
+        # cached values are refreshed when the underlying value changes
+        app.config.set('testapp', 'num', '4')
+        assert app.config.get_int('testapp', 'num') == 4
+        os.environ['TESTAPP_FLAG'] = 'false'
+        try:
+            assert app.config.get_bool('testapp', 'flag') is False
+        finally:
+            del os.environ['TESTAPP_FLAG']
+
+        # cached lists can't be modified by the caller
+        app.config.get_list('testapp', 'items').append('d')
+        assert app.config.get_list('testapp', 'items') == ['a', 'b', 'c']
+
+        assert app.config.get_int('testapp', 'missing', fallback=7) == 7
+        assert app.config.get_bool('missing', 'missing', fallback=None) is None
+        with pytest.raises(NoOptionError):
+            app.config.get_list('testapp', 'missing')
+
+
+def test_cache_env():
+    class MyConfigHandler(ConfigParserConfigHandler):
+        class Meta:
+            label = 'my_config_handler'
+            cache_env = True
+
+    with TestApp(config_section='testapp',
+                 config_handler=MyConfigHandler) as app:
+        app.config.set('testapp', 'cached', 'bar')
+        assert app.config.get('testapp', 'cached') == 'bar'
+
+        os.environ['TESTAPP_CACHED'] = 'not-bar'
+        try:
+            assert app.config.get('testapp', 'cached') == 'bar'
+            app.config.refresh_env()
+            assert app.config.get('testapp', 'cached') == 'not-bar'
+            assert app.config.get_section_dict('testapp')['cached'] == 'not-bar'
+        finally:
+            del os.environ['TESTAPP_CACHED']
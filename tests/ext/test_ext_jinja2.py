@@ -1,10 +1,14 @@
 
 import os
+import threading
 from shutil import copyfile
+from unittest.mock import patch
 
 import jinja2
+from watchdog.observers.api import BaseObserver
 
 from cement.core.exc import FrameworkError
+from cement.ext.ext_jinja2 import Jinja2OutputHandler, Jinja2TemplateHandler
 from cement.utils import fs
 from cement.utils.test import TestApp, raises
 
@@ -24,6 +28,9 @@ def test_jinja2(rando):
         jinja2_res = f"foo equals {rando}\n"
         assert res == jinja2_res
 
+        chunks = list(app.output.render_iter(dict(foo=rando), 'test_template.jinja2'))
+        assert ''.join(chunks) == jinja2_res
+
 
 def test_jinja2_utf8(rando):
     with Jinja2App() as app:
@@ -91,3 +98,131 @@ def test_jinja2_bad_module():
         with raises(FrameworkError, match=msg):
             app._meta.template_module = 'this_is_a_bogus_module'
             app.render(dict(foo='bar'), 'bad_template.jinja2')
+
+
+def test_jinja2_loader_without_module():
+    with Jinja2App() as app:
+        templater = app.handler.resolve('template', 'jinja2', setup=True)
+        app._meta.template_module = None
+        msg = "App.Meta.template_module is not set"
+        with raises(FrameworkError, match=msg):
+            templater._get_loader('module')
+
+
+def test_jinja2_template_cache(tmp, rando):
+    with Jinja2App(template_dirs=[tmp.dir]) as app:
+        path = fs.join(tmp.dir, 'cached.jinja2')
+        with open(path, 'w') as f:
+            f.write('foo equals {{ foo }}\n')
+
+        templater = app.output.templater
+        assert app.render(dict(foo=rando), 'cached.jinja2') == f"foo equals {rando}\n"
+        loader = templater.env.loader
+        tmpl = templater.get_template('cached.jinja2')
+        assert app.render(dict(foo=rando), 'cached.jinja2') == f"foo equals {rando}\n"
+        assert templater.env.loader is loader
+        assert templater.get_template('cached.jinja2') is tmpl
+
+        # modifying the template file recompiles it
+        with open(path, 'w') as f:
+            f.write('foo is {{ foo }}\n')
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        assert app.render(dict(foo=rando), 'cached.jinja2') == f"foo is {rando}\n"
+
+        # module templates get their own (also stable) loader
+        app.render(dict(foo=rando), 'test_template.jinja2')
+        assert templater.env.loader is not loader
+        app.render(dict(foo=rando), 'cached.jinja2')
+        assert templater.env.loader is loader
+
+
+def test_jinja2_render_override(rando):
+    class MyTemplateHandler(Jinja2TemplateHandler):
+        class Meta:
+            label = 'my_jinja2'
+
+        def render(self, content, data, *args, **kw):
+            return super().render(content, data).upper()
+
+    class MyOutputHandler(Jinja2OutputHandler):
+        class Meta:
+            label = 'my_jinja2'
+
+    class MyApp(Jinja2App):
+        class Meta:
+            output_handler = 'my_jinja2'
+            handlers = [MyTemplateHandler, MyOutputHandler]
+
+    with MyApp() as app:
+        res = app.render(dict(foo=rando), 'test_template.jinja2')
+        assert res == f"FOO EQUALS {rando.upper()}\n"
+
+
+def test_jinja2_watch_template_dirs(tmp, rando):
+    with open(fs.join(tmp.dir, 'watched.jinja2'), 'w') as f:
+        f.write('foo equals {{ foo }}\n')
+
+    defaults = {'template.jinja2': {'watch_template_dirs': True}}
+    with Jinja2App(template_dirs=[tmp.dir], template_handler='jinja2',
+                   meta_defaults=defaults) as app:
+        # the output handler shares the application's template handler
+        assert app.output.templater is app.template
+        assert app.render(dict(foo=rando), 'watched.jinja2') == f"foo equals {rando}\n"
+        observer = app.template._observer
+        assert observer.is_alive()
+
+        # as do output handlers resolved for a single render
+        app.render(dict(foo=rando), 'watched.jinja2', handler='jinja2')
+        assert app.template._observer is observer
+
+        # and full reloads stop the previous observer
+        app.reload()
+        assert not observer.is_alive()
+        app.render(dict(foo=rando), 'watched.jinja2')
+        observer = app.template._observer
+
+    assert not observer.is_alive()
+    assert not any(isinstance(t, BaseObserver) for t in threading.enumerate())
+
+
+def test_jinja2_render_cache(rando):
+    with Jinja2App() as app:
+        templater = app.output.templater
+        templater._meta.cache_size = 2
+        assert templater.render('{{ foo }}', dict(foo=rando)) == rando
+        assert templater.render(b'{{ foo }}', dict(foo='bar')) == 'bar'
+        assert len(templater._compiled) == 1
+
+        templater.render('a{{ foo }}', dict(foo=rando))
+        templater.render('b{{ foo }}', dict(foo=rando))
+        assert list(templater._compiled) == ['a{{ foo }}', 'b{{ foo }}']
+
+
+def test_jinja2_bytecode_cache(tmp, rando):
+    defaults = {
+        'template.jinja2': {
+            'bytecode_cache': True,
+            'bytecode_cache_dir': fs.join(tmp.dir, 'cache'),
+        },
+    }
+    with Jinja2App(meta_defaults=defaults) as app:
+        res = app.render(dict(foo=rando), 'test_template.jinja2')
+        assert res == f"foo equals {rando}\n"
+        assert len(os.listdir(fs.join(tmp.dir, 'cache'))) == 1
+
+    # later invocations load the bytecode rather than compiling again
+    with Jinja2App(meta_defaults=defaults) as app:
+        with patch.object(app.output.templater.env, 'compile') as compile:
+            res = app.render(dict(foo=rando), 'test_template.jinja2')
+            assert res == f"foo equals {rando}\n"
+            assert not compile.called
+
+
+def test_jinja2_bytecode_cache_default_dir(tmp, rando):
+    defaults = {'template.jinja2': {'bytecode_cache': True}}
+    with patch('cement.ext.ext_jinja2.fs.HOME_DIR', tmp.dir):
+        with Jinja2App(label=rando, meta_defaults=defaults) as app:
+            app.render(dict(foo=rando), 'test_template.jinja2')
+            path = fs.join(tmp.dir, f'.{rando}', 'cache', 'jinja2')
+            assert len(os.listdir(path)) == 1
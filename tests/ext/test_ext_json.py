@@ -1,6 +1,9 @@
+import io
 import json
 import os
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+import orjson
 
 from cement.utils import fs
 from cement.utils.test import TestApp
@@ -38,6 +41,79 @@ def test_json():
         assert res == json_res
 
 
+def test_render_stream(tmp):
+    data = dict(rows=[dict(id=i, name=f'row{i}') for i in range(10000)])
+    with JsonApp() as app:
+        app.run()
+        chunks = list(app.output.render_iter(data, indent=2))
+        assert len(chunks) > 1
+        assert ''.join(chunks) == json.dumps(data, indent=2)
+
+        with open(tmp.file, 'w') as f:
+            app.render(data, out=f, stream=True)
+        with open(tmp.file) as f:
+            assert json.load(f) == data
+
+    # backends without a JSONEncoder
+    with JsonApp() as app:
+        app.run()
+        with patch.object(app.output, '_json', Mock(spec=['dumps'])) as mock:
+            mock.dumps.return_value = '{}'
+            assert list(app.output.render_iter(data)) == ['{}']
+
+
+def test_bytes_native():
+    class OrjsonApp(JsonApp):
+        class Meta:
+            meta_defaults = {
+                'output.json': {'overridable': True, 'json_module': 'orjson'},
+                'config.json': {'json_module': 'orjson'},
+            }
+
+    rendered = []
+
+    def post_render(app, out_text):
+        rendered.append(out_text)
+
+    data = dict(foo='bar', items=[1, 2, 3])
+    with OrjsonApp() as app:
+        app.hook.register('post_render', post_render)
+        app.run()
+        assert app.output.bytes_native is True
+        assert app.config.get_section_dict('section') == CONFIG_PARSED['section']
+
+        # written directly to the binary buffer of `out`, still returning str
+        out = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        out.write('text first ')
+        with patch.object(out, 'write') as write:
+            res = app.render(data, out=out)
+            assert not write.called
+        assert res == orjson.dumps(data).decode()
+        assert rendered == [res]
+        assert app.last_rendered == (data, res)
+        assert out.buffer.getvalue() == b'text first ' + orjson.dumps(data)
+
+        # backend options are passed through
+        res = app.render(data, out=out, option=orjson.OPT_INDENT_2)
+        assert res == orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+        # text only `out` (or none at all) still get a str
+        assert app.render(data, out=io.StringIO()) == orjson.dumps(data).decode()
+        assert app.render(data, out=None) == orjson.dumps(data).decode()
+
+        # text modified by post_render hooks is written as text
+        out = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        app.hook.register('post_render', lambda app, text: text.upper())
+        assert app.render(data, out=out) == orjson.dumps(data).decode().upper()
+        out.flush()
+        assert out.buffer.getvalue() == orjson.dumps(data).upper()
+
+    with JsonApp() as app:
+        app.run()
+        assert app.output.bytes_native is False
+        assert app.output.render_bytes(data) == json.dumps(data).encode()
+
+
 def test_has_section():
     with JsonApp() as app:
         assert app.config.has_section('section')
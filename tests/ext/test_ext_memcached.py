@@ -78,3 +78,15 @@ def test_memcache_expire(key):
         app.cache.set(key, 1003, time=2)
         sleep(3)
         assert app.cache.get(key) is None
+
+
+def test_memcached_many(key):
+    with MemcachedApp() as app:
+        keys = [f'{key}-1', f'{key}-2', f'{key}-3']
+        app.cache.set_many({keys[0]: 1, keys[1]: 2})
+        res = app.cache.get_many(keys, fallback='none')
+        assert res == {keys[0]: 1, keys[1]: 2, keys[2]: 'none'}
+        assert app.cache.delete_many(keys) == 2
+        assert app.cache.get_many(keys) == {k: None for k in keys}
+        assert app.cache.delete_many(keys) == 0
+        assert app.cache.delete_many([]) == 0
@@ -0,0 +1,144 @@
+
+import threading
+from unittest.mock import patch
+
+from cement.utils.misc import init_defaults
+from cement.utils.test import TestApp
+
+
+class MemoryApp(TestApp):
+    class Meta:
+        extensions = ['memory']
+        cache_handler = 'memory'
+
+
+def test_memory_set_get(key):
+    with MemoryApp() as app:
+        app.cache.set(key, dict(foo='bar'))
+        assert app.cache.get(key) == dict(foo='bar')
+
+
+def test_memory_get(key):
+    with MemoryApp() as app:
+        assert app.cache.get(key) is None
+        assert app.cache.get(key, 1234) == 1234
+        assert app.cache.stats()['misses'] == 2
+
+
+def test_memory_delete(key):
+    with MemoryApp() as app:
+        app.cache.set(key, 1001)
+        assert app.cache.delete(key) is True
+        assert app.cache.delete(key) is False
+        assert app.cache.get(key) is None
+
+
+def test_memory_purge(key):
+    with MemoryApp() as app:
+        app.cache.set(key, 1002)
+        app.cache.purge()
+        assert app.cache.get(key) is None
+        assert app.cache.stats()['entries'] == 0
+        assert app.cache.stats()['bytes'] == 0
+
+
+def test_memory_many(key):
+    with MemoryApp() as app:
+        keys = [f'{key}-1', f'{key}-2', f'{key}-3']
+        app.cache.set_many({keys[0]: 1, keys[1]: 2})
+        assert app.cache.get_many(keys, fallback=0) == {keys[0]: 1, keys[1]: 2, keys[2]: 0}
+        assert app.cache.delete_many(keys) == 2
+
+
+def test_memory_expire(key):
+    with MemoryApp() as app:
+        with patch('cement.ext.ext_memory.monotonic', return_value=100):
+            app.cache.set(key, 1003, time=2)
+            app.cache.set(f'{key}-forever', 1004)
+        with patch('cement.ext.ext_memory.monotonic', return_value=101):
+            assert app.cache.get(key) == 1003
+        with patch('cement.ext.ext_memory.monotonic', return_value=102):
+            assert app.cache.get(key) is None
+            assert app.cache.get(f'{key}-forever') == 1004
+        assert app.cache.stats()['expirations'] == 1
+
+
+def test_memory_expire_time_config(key):
+    defaults = init_defaults('cache.memory')
+    defaults['cache.memory']['expire_time'] = 10
+    with MemoryApp(config_defaults=defaults) as app:
+        with patch('cement.ext.ext_memory.monotonic', return_value=100):
+            app.cache.set(key, 1005)
+        with patch('cement.ext.ext_memory.monotonic', return_value=110):
+            assert app.cache.get(key) is None
+
+
+def test_memory_lru_max_entries():
+    defaults = init_defaults('cache.memory')
+    defaults['cache.memory']['max_entries'] = 3
+    with MemoryApp(config_defaults=defaults) as app:
+        for key in ['a', 'b', 'c']:
+            app.cache.set(key, key)
+
+        # touching `a` makes `b` the least recently used
+        assert app.cache.get('a') == 'a'
+        app.cache.set('d', 'd')
+        assert app.cache.get('b') is None
+        assert app.cache.get_many(['a', 'c', 'd']) == dict(a='a', c='c', d='d')
+
+        # overwriting an existing key does not evict
+        app.cache.set('a', 'A')
+        stats = app.cache.stats()
+        assert stats['entries'] == 3
+        assert stats['evictions'] == 1
+        assert stats['hits'] == 4
+        assert stats['misses'] == 1
+
+
+def test_memory_max_bytes():
+    defaults = init_defaults('cache.memory')
+    defaults['cache.memory']['max_entries'] = 0
+    defaults['cache.memory']['max_bytes'] = 10
+    with MemoryApp(config_defaults=defaults) as app:
+        app.cache.set('a', b'12345')
+        app.cache.set('b', '12345')
+        assert app.cache.stats()['bytes'] == 10
+        app.cache.set('c', b'1')
+        assert app.cache.get('a') is None
+        assert app.cache.stats()['bytes'] == 6
+
+        # a single value larger than the bound is not kept
+        app.cache.set('d', b'x' * 11)
+        assert app.cache.get('d') is None
+        assert app.cache.stats()['entries'] == 0
+
+
+def test_memory_serializer(key):
+    defaults = init_defaults('cache.memory')
+    defaults['cache.memory']['serializer'] = 'json'
+    with MemoryApp(config_defaults=defaults) as app:
+        data = dict(foo=['bar'])
+        app.cache.set(key, data)
+        res = app.cache.get(key)
+        assert res == data
+        assert res is not data
+        assert app.cache.stats()['bytes'] == len(b'{"foo": ["bar"]}')
+
+
+def test_memory_threads():
+    with MemoryApp() as app:
+        def work(n):
+            for i in range(200):
+                app.cache.set(f'{n}-{i}', i)
+                app.cache.get(f'{n}-{i - 1}')
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = app.cache.stats()
+        assert stats['entries'] == 1000
+        assert stats['evictions'] == 0
+        assert stats['hits'] + stats['misses'] == 1000
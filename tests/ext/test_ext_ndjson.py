@@ -0,0 +1,126 @@
+import json
+from unittest.mock import Mock, patch
+
+import orjson
+
+from cement.utils.test import TestApp
+
+
+class NdjsonApp(TestApp):
+    class Meta:
+        extensions = ['ndjson']
+        output_handler = 'ndjson'
+        argv = ['-o', 'ndjson']
+        meta_defaults = {'output.ndjson': {'overridable': True}}
+
+
+def records(count):
+    for i in range(count):
+        yield dict(id=i, name=f'record{i}')
+
+
+def test_ndjson():
+    with NdjsonApp() as app:
+        app.run()
+        res = app.render(list(records(3)))
+        lines = [json.dumps(dict(id=i, name=f'record{i}')) for i in range(3)]
+        assert res == '\n'.join(lines) + '\n'
+
+        # a single record
+        assert app.render(dict(foo='bar')) == '{"foo": "bar"}\n'
+        assert app.render([]) == ''
+
+        # keyword arguments are passed to dumps()
+        res = app.render([dict(b=1, a=2)], sort_keys=True)
+        assert res == '{"a": 2, "b": 1}\n'
+
+
+def test_ndjson_output_suppression():
+    with NdjsonApp() as app:
+        with patch.object(app, '_suppress_output') as suppress, \
+                patch.object(app, '_unsuppress_output') as unsuppress:
+            app.run()
+            assert suppress.call_count == 1
+            app.render(dict(foo='bar'))
+            assert unsuppress.call_count == 1
+            assert suppress.call_count == 2
+
+    # without the override option the output hooks do nothing
+    with NdjsonApp(argv=[], meta_defaults={}) as app:
+        app.run()
+        assert not hasattr(app.pargs, 'output_handler_override')
+        with patch.object(app, '_suppress_output') as suppress:
+            assert app.render(dict(foo='bar')) == '{"foo": "bar"}\n'
+            assert not suppress.called
+
+
+def test_ndjson_stream(tmp):
+    with NdjsonApp() as app:
+        app.run()
+        app.output._meta.flush_records = 10
+        app.output._meta.flush_bytes = 0
+        chunks = list(app.output.render_iter(records(25)))
+        assert [chunk.count('\n') for chunk in chunks] == [10, 10, 5]
+
+        app.output._meta.flush_records = 0
+        app.output._meta.flush_bytes = 100
+        chunks = list(app.output.render_iter(records(25)))
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+
+        with open(tmp.file, 'w') as f:
+            app.render(records(2500), out=f, stream=True)
+        with open(tmp.file) as f:
+            res = [json.loads(line) for line in f]
+        assert res == list(records(2500))
+
+        # records are consumed lazily, and not past a closed pipe
+        consumed = []
+
+        def counted():
+            for record in records(100000):
+                consumed.append(record)
+                yield record
+
+        app.output._meta.flush_records = 1000
+        app.output._meta.flush_bytes = 0
+        out = Mock()
+        out.write.side_effect = BrokenPipeError
+        app.render(counted(), out=out, stream=True)
+        assert out.write.call_count == 1
+        assert len(consumed) == 1000
+
+    with NdjsonApp(argv=[]) as app:
+        app.run()
+        with open(tmp.file, 'w') as f:
+            app.render(records(3), out=f, stream=True)
+        with open(tmp.file) as f:
+            assert len(f.readlines()) == 3
+
+
+def test_ndjson_json_module():
+    class MyJsonModule:
+        @staticmethod
+        def dumps(record, **kw):
+            return 'custom'
+
+    with NdjsonApp() as app:
+        app.run()
+        assert app.output._json is json
+        app.output._json = MyJsonModule
+        assert app.render(records(2)) == 'custom\ncustom\n'
+
+
+def test_ndjson_bytes_native():
+    class OrjsonApp(NdjsonApp):
+        class Meta:
+            meta_defaults = {'output.ndjson': {'overridable': True,
+                                               'json_module': 'orjson'}}
+
+    with OrjsonApp() as app:
+        app.run()
+        assert app.output._json is orjson
+        app.output._meta.flush_records = 2
+        chunks = list(app.output.render_iter(records(3)))
+        assert chunks == ['{"id":0,"name":"record0"}\n{"id":1,"name":"record1"}\n',
+                          '{"id":2,"name":"record2"}\n']
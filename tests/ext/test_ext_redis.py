@@ -1,6 +1,7 @@
 
 import os
 from time import sleep
+from unittest.mock import patch
 
 from cement.utils.misc import init_defaults
 from cement.utils.test import TestApp
@@ -60,3 +61,80 @@ def test_redis_expire(key):
         app.cache.set(key, 1003, time=2)
         sleep(3)
         assert app.cache.get(key) is None
+
+
+def test_redis_many(key):
+    with RedisApp() as app:
+        keys = [f'{key}-1', f'{key}-2', f'{key}-3']
+        app.cache.set_many({keys[0]: 1, keys[1]: 2})
+        res = app.cache.get_many(keys, fallback='none')
+        assert res == {keys[0]: '1', keys[1]: '2', keys[2]: 'none'}
+        assert app.cache.delete_many(keys) == 2
+        assert app.cache.get_many(keys) == {k: None for k in keys}
+        assert app.cache.get_many([]) == {}
+        assert app.cache.delete_many([]) == 0
+
+
+def test_redis_set_many_expire(key):
+    with RedisApp() as app:
+        app.cache.set_many({key: 1004}, time=2)
+        sleep(3)
+        assert app.cache.get(key) is None
+
+
+def test_redis_key_prefix(key):
+    defaults = init_defaults('cache.redis')
+    defaults['cache.redis']['host'] = redis_host
+    defaults['cache.redis']['key_prefix'] = 'cement-test:'
+    defaults['cache.redis']['scan_count'] = 2
+    with RedisApp(config_defaults=defaults) as app:
+        for i in range(5):
+            app.cache.set(f'{key}-{i}', i)
+        assert app.cache.r.get(f'cement-test:{key}-0') == b'0'
+
+        # keys outside of the prefix survive a purge, which deletes each
+        # batch of scan_count keys as it is found
+        app.cache.r.set(key, 'unprefixed')
+        with patch.object(app.cache.r, 'delete', wraps=app.cache.r.delete) as mock:
+            app.cache.purge()
+            assert mock.call_count == 3
+        assert app.cache.get_many([f'{key}-{i}' for i in range(5)]) == \
+            {f'{key}-{i}': None for i in range(5)}
+        assert app.cache.r.get(key) == b'unprefixed'
+        app.cache.r.delete(key)
+
+    # glob metacharacters in the prefix are matched literally
+    defaults['cache.redis']['key_prefix'] = 'cement-[test]:'
+    with RedisApp(config_defaults=defaults) as app:
+        app.cache.set(key, 'prefixed')
+        app.cache.r.set(f'cement-t:{key}', 'other')
+        app.cache.purge()
+        assert app.cache.get(key) is None
+        assert app.cache.r.get(f'cement-t:{key}') == b'other'
+        app.cache.r.delete(f'cement-t:{key}')
+
+
+def test_redis_connection_pool():
+    defaults = init_defaults('cache.redis')
+    defaults['cache.redis']['host'] = redis_host
+    defaults['cache.redis']['max_connections'] = 5
+    defaults['cache.redis']['socket_keepalive'] = True
+    with RedisApp(config_defaults=defaults) as app:
+        assert app.cache.pool.max_connections == 5
+        assert app.cache.pool.connection_kwargs['socket_keepalive'] is True
+
+
+def test_redis_serializer(key):
+    defaults = init_defaults('cache.redis')
+    defaults['cache.redis']['host'] = redis_host
+    defaults['cache.redis']['serializer'] = 'json'
+    defaults['cache.redis']['compression'] = 'zlib'
+    defaults['cache.redis']['compress_threshold'] = 100
+    with RedisApp(config_defaults=defaults) as app:
+        data = dict(foo=['bar', 1, None], baz='x' * 1000)
+        app.cache.set(key, data)
+        assert app.cache.get(key) == data
+        assert len(app.cache.r.get(key)) < 1000
+        app.cache.set_many({key: 1001})
+        assert app.cache.get_many([key]) == {key: 1001}
+        app.cache.delete(key)
@@ -0,0 +1,153 @@
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+from pytest import raises
+
+from cement.utils import fs
+from cement.utils.misc import init_defaults
+from cement.utils.test import TestApp
+
+
+def sqlite_app(tmp, **kw):
+    defaults = init_defaults('cache.sqlite')
+    defaults['cache.sqlite']['path'] = fs.join(tmp.dir, 'cache.db')
+    defaults['cache.sqlite'].update(kw)
+    return TestApp(extensions=['sqlite'],
+                   cache_handler='sqlite',
+                   config_defaults=defaults)
+
+
+def test_sqlite_set_get(tmp, key):
+    with sqlite_app(tmp) as app:
+        app.cache.set(key, dict(foo=['bar', 1]))
+        assert app.cache.get(key) == dict(foo=['bar', 1])
+        assert app.cache.path == fs.join(tmp.dir, 'cache.db')
+
+
+def test_sqlite_get(tmp, key):
+    with sqlite_app(tmp) as app:
+        assert app.cache.get(key) is None
+        assert app.cache.get(key, 1234) == 1234
+
+
+def test_sqlite_delete(tmp, key):
+    with sqlite_app(tmp) as app:
+        app.cache.set(key, 1001)
+        assert app.cache.delete(key) is True
+        assert app.cache.delete(key) is False
+        assert app.cache.get(key) is None
+
+
+def test_sqlite_purge(tmp, key):
+    with sqlite_app(tmp) as app:
+        app.cache.set(key, 1002)
+        app.cache.purge()
+        assert app.cache.get(key) is None
+
+
+def test_sqlite_many(tmp, key):
+    with sqlite_app(tmp) as app:
+        keys = [f'{key}-1', f'{key}-2', f'{key}-3']
+        app.cache.set_many({keys[0]: 1, keys[1]: 2})
+        assert app.cache.get_many(keys, fallback=0) == {keys[0]: 1, keys[1]: 2, keys[2]: 0}
+        assert app.cache.delete_many(keys) == 2
+        assert app.cache.get_many([]) == {}
+        assert app.cache.delete_many([]) == 0
+
+
+def test_sqlite_many_chunked(tmp):
+    with sqlite_app(tmp) as app:
+        with patch('cement.ext.ext_sqlite.MAX_VARIABLES', 2):
+            keys = [f'key-{i}' for i in range(5)]
+            app.cache.set_many({key: key for key in keys[:4]})
+            res = app.cache.get_many(keys)
+            assert res == {key: key if key != 'key-4' else None for key in keys}
+            assert app.cache.delete_many(keys) == 4
+            assert app.cache.get_many(keys) == dict.fromkeys(keys)
+
+
+def test_sqlite_close(tmp, key):
+    with sqlite_app(tmp) as app:
+        app.cache.set(key, 1008)
+        conn = app.cache.conn
+    assert app.cache.conn is None
+    with raises(sqlite3.ProgrammingError, match='closed'):
+        conn.execute('SELECT 1')
+
+
+def test_sqlite_expire(tmp, key):
+    with sqlite_app(tmp, expire_time=10) as app:
+        with patch('cement.ext.ext_sqlite._now', return_value=100):
+            app.cache.set(key, 1003, time=2)
+            app.cache.set(f'{key}-default', 1004)
+            app.cache.set(f'{key}-forever', 1005, time=0)
+        with patch('cement.ext.ext_sqlite._now', return_value=101):
+            assert app.cache.get(key) == 1003
+        with patch('cement.ext.ext_sqlite._now', return_value=102):
+            assert app.cache.get(key) is None
+            assert app.cache.get(f'{key}-default') == 1004
+        with patch('cement.ext.ext_sqlite._now', return_value=1000):
+            assert app.cache.get(f'{key}-default') is None
+            assert app.cache.get(f'{key}-forever') == 1005
+
+
+def test_sqlite_persistence(tmp, key):
+    with sqlite_app(tmp) as app:
+        app.cache.set(key, 1006)
+
+    # a second process (connection) sees the same data
+    with sqlite_app(tmp) as app1, sqlite_app(tmp) as app2:
+        assert app1.cache.get(key) == 1006
+        app2.cache.set(key, 1007)
+        assert app1.cache.get(key) == 1007
+
+
+def test_sqlite_lru_max_entries(tmp):
+    with sqlite_app(tmp, max_entries=3) as app:
+        for i, key in enumerate(['a', 'b', 'c']):
+            with patch('cement.ext.ext_sqlite._now', return_value=100 + i):
+                app.cache.set(key, key)
+
+        # touching `a` makes `b` the least recently used
+        with patch('cement.ext.ext_sqlite._now', return_value=200):
+            assert app.cache.get('a') == 'a'
+        with patch('cement.ext.ext_sqlite._now', return_value=201):
+            app.cache.set('d', 'd')
+
+        assert app.cache.get('b') is None
+        assert app.cache.get_many(['a', 'c', 'd']) == dict(a='a', c='c', d='d')
+
+
+def test_sqlite_unlimited_entries(tmp):
+    with sqlite_app(tmp, max_entries=0) as app:
+        app.cache.set_many({str(i): i for i in range(10)})
+        assert app.cache.conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0] == 10
+
+
+def test_sqlite_evicts_expired_first(tmp):
+    with sqlite_app(tmp, max_entries=2) as app:
+        with patch('cement.ext.ext_sqlite._now', return_value=100):
+            app.cache.set('a', 'a', time=1)
+            app.cache.set('b', 'b')
+        with patch('cement.ext.ext_sqlite._now', return_value=50):
+            assert app.cache.get('b') == 'b'
+        with patch('cement.ext.ext_sqlite._now', return_value=200):
+            app.cache.set('c', 'c')
+            assert app.cache.get_many(['a', 'b', 'c']) == dict(a=None, b='b', c='c')
+
+
+def test_sqlite_default_path(tmp):
+    with patch('cement.ext.ext_sqlite.fs.HOME_DIR', tmp.dir):
+        with TestApp(extensions=['sqlite'], cache_handler='sqlite') as app:
+            app.cache.set('foo', 'bar')
+            path = fs.join(tmp.dir, f'.{app._meta.label}', 'cache', 'cache.db')
+            assert app.cache.path == path
+            assert os.path.exists(path)
+
+
+def test_sqlite_raw_serializer(tmp, key):
+    with sqlite_app(tmp, serializer='raw') as app:
+        app.cache.set(key, 'text')
+        assert app.cache.get(key) == b'text'
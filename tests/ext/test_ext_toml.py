@@ -0,0 +1,126 @@
+import json
+import os
+from unittest.mock import patch
+
+import tomli_w
+import yaml
+
+from cement.ext.ext_configparser import ConfigParserConfigHandler
+from cement.ext.ext_json import JsonConfigHandler
+from cement.ext.ext_toml import TomlConfigHandler
+from cement.ext.ext_yaml import YamlConfigHandler
+from cement.utils import fs
+from cement.utils.test import TestApp
+
+CONFIG_PARSED = dict(
+    section=dict(
+        subsection=dict(
+            list=['item1', 'item2', 'item3', 'item4'],
+            key='value'),
+        key1='ok1',
+        key2='ok2',
+    ),
+)
+
+
+CONFIG = fs.join(os.path.dirname(__file__), '..',
+                 'data', 'config', 'config.toml')
+
+
+class TomlApp(TestApp):
+    class Meta:
+        extensions = ['toml']
+        output_handler = 'toml'
+        config_handler = 'toml'
+        config_files = [CONFIG]
+        argv = ['-o', 'toml']
+        meta_defaults = {'output.toml': {'overridable': True}}
+
+
+def test_toml():
+    with TomlApp() as app:
+        app.run()
+        res = app.render(dict(foo='bar'))
+        toml_res = tomli_w.dumps(dict(foo='bar'))
+        assert res == toml_res
+
+
+def test_toml_not_overridable():
+    # without the override option the output hooks do nothing
+    with TomlApp(argv=[], meta_defaults={}) as app:
+        app.run()
+        assert not hasattr(app.pargs, 'output_handler_override')
+        with patch.object(app, '_suppress_output') as suppress:
+            assert app.render(dict(foo='bar')) == 'foo = "bar"\n'
+            assert not suppress.called
+
+
+def test_has_section():
+    with TomlApp() as app:
+        assert app.config.has_section('section')
+
+
+def test_keys():
+    with TomlApp() as app:
+        assert 'subsection' in app.config.keys('section')
+
+
+@patch('cement.ext.ext_toml.TomlConfigHandler._parse_file')
+def test_parse_file_bad_path(parser):
+    with TomlApp(config_files=['./some_bogus_path']):
+        assert not parser.called
+
+
+def test_parse_file():
+    with TomlApp() as app:
+        assert app.config.get('section', 'key1') == 'ok1'
+        assert app.config.get_section_dict('section') == \
+            CONFIG_PARSED['section']
+
+
+def test_get_dict():
+    with TomlApp() as app:
+        _config = app.config.get_dict()
+        assert _config['log.logging']['level'] == 'INFO'
+
+
+def test_env_var_override(rando):
+    env_var = f'{rando}_KEY1'.upper()
+    with patch.dict(os.environ, {env_var: 'from-env'}):
+        with TomlApp(label=rando) as app:
+            app.config.merge({rando: dict(key1='ok1')})
+            assert app.config.get(rando, 'key1') == 'from-env'
+
+
+def test_parse_parity(tmp):
+    # the same (flat) settings parse identically across all config handlers
+    data = {
+        f'section{i}': {f'key{j}': f'value {i}.{j}' for j in range(20)}
+        for i in range(200)
+    }
+
+    def write_ini(f):
+        for section, items in data.items():
+            f.write(f'[{section}]\n')
+            for key, value in items.items():
+                f.write(f'{key} = {value}\n')
+
+    writers = {
+        ConfigParserConfigHandler: ('conf', write_ini),
+        JsonConfigHandler: ('json', lambda f: f.write(json.dumps(data))),
+        YamlConfigHandler: ('yml', lambda f: f.write(yaml.dump(data))),
+        TomlConfigHandler: ('toml', lambda f: f.write(tomli_w.dumps(data))),
+    }
+
+    with TestApp() as app:
+        for handler_class, (suffix, write) in writers.items():
+            path = fs.join(tmp.dir, f'parity.{suffix}')
+            with open(path, 'w') as f:
+                write(f)
+
+            han = handler_class()
+            han._setup(app)
+            han.parse_file(path)
+
+            for section, items in data.items():
+                assert han.get_section_dict(section) == items
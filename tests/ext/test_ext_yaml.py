@@ -1,8 +1,10 @@
 import os
 from unittest.mock import patch
 
+import pytest
 import yaml
 
+from cement.core.exc import FrameworkError
 from cement.utils import fs
 from cement.utils.test import TestApp
 
@@ -38,6 +40,32 @@ def test_yaml():
         assert res == yaml_res
 
 
+def test_render_stream(tmp):
+    data = dict(
+        rows=[dict(id=i, tags=['a', 'b'], text='multi\nline') for i in range(10)],
+        foo='bar',
+        empty={},
+    )
+    with YamlApp() as app:
+        app.run()
+        assert ''.join(app.output.render_iter(data)) == yaml.dump(data)
+        assert ''.join(app.output.render_iter(data['rows'])) == yaml.dump(data['rows'])
+        res = ''.join(app.output.render_iter(data, sort_keys=False))
+        assert res == yaml.dump(data, sort_keys=False)
+
+        # rendered as a single chunk
+        assert list(app.output.render_iter({})) == [yaml.dump({})]
+        res = list(app.output.render_iter(data, default_flow_style=None))
+        assert res == [yaml.dump(data, default_flow_style=None)]
+        res = list(app.output.render_iter(data, explicit_start=True))
+        assert res == [yaml.dump(data, explicit_start=True)]
+
+        with open(tmp.file, 'w') as f:
+            app.render(data, out=f, stream=True)
+        with open(tmp.file) as f:
+            assert yaml.safe_load(f) == data
+
+
 def test_has_section():
     with YamlApp() as app:
         assert app.config.has_section('section')
@@ -65,3 +93,50 @@ def test_get_dict():
     with YamlApp() as app:
         _config = app.config.get_dict()
         assert _config['log.logging']['level'] == 'INFO'
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__,
+                    reason='pyYaml is not installed with LibYAML bindings')
+def test_libyaml():
+    with YamlApp() as app:
+        assert app.config._loader is yaml.CFullLoader
+        app.run()
+        assert app.output._dumper is yaml.CDumper
+
+
+def test_libyaml_disabled():
+    defaults = {
+        'config.yaml': {'libyaml': False},
+        'output.yaml': {'libyaml': False, 'overridable': True},
+    }
+    with YamlApp(meta_defaults=defaults) as app:
+        assert app.config._loader is yaml.FullLoader
+        assert app.config.get_section_dict('section') == \
+            CONFIG_PARSED['section']
+        app.run()
+        assert app.output._dumper is yaml.Dumper
+        assert app.render(dict(foo='bar')) == yaml.dump(dict(foo='bar'))
+
+
+def test_libyaml_unavailable():
+    # pyYaml without libyaml bindings
+    with patch.object(yaml, 'CFullLoader', None, create=True):
+        with YamlApp() as app:
+            assert app.config._loader is yaml.FullLoader
+
+        defaults = {'config.yaml': {'libyaml': True}}
+        with pytest.raises(FrameworkError, match='CFullLoader'):
+            with YamlApp(meta_defaults=defaults):
+                pass
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__,
+                    reason='pyYaml is not installed with LibYAML bindings')
+def test_render_libyaml_parity():
+    # the pure Python and LibYAML dumpers render a large data set the same
+    data = [dict(id=i, name=f'item {i}', tags=['a', 'b', 'c']) for i in range(2000)]
+    with YamlApp() as app:
+        app.run()
+        for dumper in [yaml.Dumper, yaml.CDumper]:
+            res = app.render(dict(items=data), Dumper=dumper)
+            assert yaml.load(res, Loader=yaml.CFullLoader) == dict(items=data)